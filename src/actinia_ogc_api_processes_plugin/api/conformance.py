@@ -36,6 +36,10 @@ class Conformance(Resource):
                     "dismiss"
                 ),
                 "http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/json",
+                (
+                    "http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/"
+                    "callback"
+                ),
                 (
                     "http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/"
                     "ogc-process-description"
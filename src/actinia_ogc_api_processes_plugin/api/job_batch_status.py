@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+JobBatchStatus endpoint implementation.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from flask import jsonify, make_response, request
+from flask_restful_swagger_2 import Resource, swagger
+
+from actinia_ogc_api_processes_plugin.apidocs import job_batch_status
+from actinia_ogc_api_processes_plugin.authentication import require_basic_auth
+from actinia_ogc_api_processes_plugin.core.job_batch import (
+    bad_request_response,
+    unauthorized_response,
+)
+from actinia_ogc_api_processes_plugin.core.job_batch_status import (
+    get_job_status_infos,
+)
+from actinia_ogc_api_processes_plugin.resources.config import JOBSTATUS
+
+
+class JobBatchStatus(Resource):
+    """JobBatchStatus handling."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.msg = "Return status information of several jobs"
+
+    @require_basic_auth()
+    @swagger.doc(job_batch_status.describe_job_batch_status_post_docs)
+    def post(self):
+        """Return the statusInfo of the given jobs."""
+        postbody = request.get_json(silent=True)
+        if not isinstance(postbody, dict):
+            return bad_request_response(
+                "ERROR: Request body has to be a JSON object",
+            )
+        job_ids = postbody.get("jobIDs")
+        if not isinstance(job_ids, list) or not all(
+            isinstance(j, str) and j for j in job_ids
+        ):
+            return bad_request_response(
+                "ERROR: jobIDs has to be a list of job identifiers",
+            )
+        if len(job_ids) > JOBSTATUS.batch_max_jobs:
+            return bad_request_response(
+                f"ERROR: At most {JOBSTATUS.batch_max_jobs} jobs can be "
+                "requested",
+            )
+
+        result = get_job_status_infos(job_ids)
+        if result["unauthorized"] and not result["jobs"]:
+            return unauthorized_response()
+        res = jsonify(
+            {
+                "jobs": result["jobs"],
+                "errors": result["errors"],
+                "links": [
+                    {
+                        "href": request.base_url,
+                        "rel": "self",
+                        "type": "application/json",
+                    },
+                ],
+            },
+        )
+        return make_response(res, 200)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+JobDismiss endpoint implementation.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from flask import jsonify, make_response, request
+from flask_restful_swagger_2 import Resource, swagger
+from requests.exceptions import ConnectionError as req_ConnectionError
+
+from actinia_ogc_api_processes_plugin.apidocs import job_dismiss
+from actinia_ogc_api_processes_plugin.authentication import require_basic_auth
+from actinia_ogc_api_processes_plugin.core.job_batch import (
+    bad_request_response,
+    unauthorized_response,
+)
+from actinia_ogc_api_processes_plugin.core.job_dismiss import (
+    dismiss_jobs,
+    find_jobs_to_dismiss,
+)
+from actinia_ogc_api_processes_plugin.model.response_models import (
+    SimpleStatusCodeResponseModel,
+)
+from actinia_ogc_api_processes_plugin.resources.config import JOBLIST
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+FILTER_KEYS = ("status", "processID", "datetime")
+
+
+def _as_list(value) -> list | None:
+    """Return a filter value as list (comma separated strings are split)."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return [v for v in value.split(",") if v]
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        return value
+    msg = "Filter values have to be strings or lists of strings"
+    raise ValueError(msg)
+
+
+class JobDismiss(Resource):
+    """JobDismiss handling."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.msg = "Dismiss several jobs of the current user"
+
+    @require_basic_auth()
+    @swagger.doc(job_dismiss.describe_job_dismiss_post_docs)
+    def post(self):
+        """Cancel the given jobs or all jobs matching a filter."""
+        postbody = request.get_json(silent=True)
+        if not isinstance(postbody, dict):
+            return bad_request_response(
+                "ERROR: Request body has to be a JSON object",
+            )
+        with_status_info = postbody.get("statusInfo", False)
+        if not isinstance(with_status_info, bool):
+            return bad_request_response(
+                "ERROR: statusInfo has to be a boolean",
+            )
+
+        job_ids = postbody.get("jobIDs")
+        try:
+            if job_ids is not None:
+                if not isinstance(job_ids, list) or not all(
+                    isinstance(j, str) and j for j in job_ids
+                ):
+                    return bad_request_response(
+                        "ERROR: jobIDs has to be a list of job identifiers",
+                    )
+                if len(job_ids) > JOBLIST.dismiss_max_jobs:
+                    return bad_request_response(
+                        "ERROR: At most "
+                        f"{JOBLIST.dismiss_max_jobs} jobs can be dismissed",
+                    )
+            elif any(postbody.get(key) for key in FILTER_KEYS):
+                try:
+                    status = _as_list(postbody.get("status"))
+                    process_ids = _as_list(postbody.get("processID"))
+                except ValueError as e:
+                    return bad_request_response(f"ERROR: {e}")
+                datetime = postbody.get("datetime") or None
+                if datetime is not None and not isinstance(datetime, str):
+                    return bad_request_response(
+                        "ERROR: datetime has to be a string",
+                    )
+                resp, job_ids = find_jobs_to_dismiss(
+                    status,
+                    process_ids,
+                    datetime,
+                )
+                if job_ids is None:
+                    if resp.status_code == 401:
+                        return unauthorized_response()
+                    log.error("ERROR: Internal Server Error")
+                    log.debug(f"actinia response: {resp.text}")
+                    res = jsonify(
+                        SimpleStatusCodeResponseModel(
+                            status=500,
+                            message="ERROR: Internal Server Error",
+                        ),
+                    )
+                    return make_response(res, 500)
+            else:
+                return bad_request_response(
+                    "ERROR: Provide jobIDs or a filter "
+                    f"({', '.join(FILTER_KEYS)})",
+                )
+
+            result = dismiss_jobs(job_ids, with_status_info)
+            if result["unauthorized"] and not result["jobs"]:
+                return unauthorized_response()
+            res = jsonify(
+                {
+                    "jobs": result["jobs"],
+                    "errors": result["errors"],
+                    "numberOfDismissed": len(result["jobs"]),
+                    "links": [
+                        {
+                            "href": request.base_url,
+                            "rel": "self",
+                            "type": "application/json",
+                        },
+                    ],
+                },
+            )
+            return make_response(res, 200)
+        except req_ConnectionError as e:
+            log.error(f"Connection ERROR: {e}")
+            res = jsonify(
+                SimpleStatusCodeResponseModel(
+                    status=503,
+                    message=f"Connection ERROR: {e}",
+                ),
+            )
+            return make_response(res, 503)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Job event stream endpoint implementations.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from flask import Response, jsonify, make_response
+from flask_restful_swagger_2 import Resource, swagger
+
+from actinia_ogc_api_processes_plugin.api.job_status_info import JobStatusInfo
+from actinia_ogc_api_processes_plugin.apidocs import job_events
+from actinia_ogc_api_processes_plugin.authentication import require_basic_auth
+from actinia_ogc_api_processes_plugin.core.job_events import (
+    job_event_stream,
+    user_event_stream,
+)
+from actinia_ogc_api_processes_plugin.core.job_retention import is_purged
+from actinia_ogc_api_processes_plugin.core.known_jobs import is_unknown_job
+from actinia_ogc_api_processes_plugin.model.response_models import (
+    SimpleStatusCodeResponseModel,
+)
+from actinia_ogc_api_processes_plugin.resources.config import JOBSTATUS
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+
+def event_stream_response(stream, job_id: str | None = None):
+    """Return a text/event-stream response or the error of the stream."""
+    error = stream.error
+    if error is not None:
+        stream.close()
+        log.error(error["message"])
+        if error["status"] == 404 and job_id is not None:
+            return JobStatusInfo.not_found_response(job_id)
+        res = jsonify(
+            SimpleStatusCodeResponseModel(
+                status=error["status"],
+                message=error["message"],
+            ),
+        )
+        res = make_response(res, error["status"])
+        if error["status"] == 503:
+            res.headers["Retry-After"] = str(JOBSTATUS.events_retry)
+        return res
+    res = Response(iter(stream), mimetype="text/event-stream")
+    # also unsubscribe if the stream is closed before it was started
+    res.call_on_close(stream.close)
+    res.headers["Cache-Control"] = "no-cache"
+    # disable response buffering of nginx
+    res.headers["X-Accel-Buffering"] = "no"
+    return res
+
+
+class JobEvents(Resource):
+    """JobEvents handling."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.msg = "Return status changes of a job as server-sent events"
+
+    @require_basic_auth()
+    @swagger.doc(job_events.describe_job_events_get_docs)
+    def get(self, job_id):
+        """Stream the status changes of a job until it is final."""
+        if is_purged(job_id) or is_unknown_job(job_id):
+            return JobStatusInfo.not_found_response(job_id)
+        return event_stream_response(job_event_stream(job_id), job_id)
+
+
+class JobListEvents(Resource):
+    """JobListEvents handling."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.msg = "Return status changes of all jobs as server-sent events"
+
+    @require_basic_auth()
+    @swagger.doc(job_events.describe_job_list_events_get_docs)
+    def get(self):
+        """Stream the status changes of all jobs of the current user."""
+        return event_stream_response(user_event_stream())
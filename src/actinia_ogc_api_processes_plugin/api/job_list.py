@@ -18,11 +18,33 @@ from requests.exceptions import ConnectionError as req_ConnectionError
 from actinia_ogc_api_processes_plugin.apidocs import job_list
 from actinia_ogc_api_processes_plugin.authentication import require_basic_auth
 from actinia_ogc_api_processes_plugin.core.actinia_common import (
+    STATUS_INFO_FIELDS,
     map_status_reverse,
+    parse_fields,
+)
+from actinia_ogc_api_processes_plugin.core.job_changes import (
+    get_change_feed,
+    parse_updated_since,
+)
+from actinia_ogc_api_processes_plugin.core.job_index import (
+    BBoxFilter,
+    parse_bbox,
 )
 from actinia_ogc_api_processes_plugin.core.job_list import (
-    get_actinia_jobs,
-    parse_actinia_jobs,
+    build_job_list,
+    collect_actinia_jobs,
+    combine_record_filters,
+    serialize_job_list,
+)
+from actinia_ogc_api_processes_plugin.core.job_retention import (
+    get_tombstones,
+    schedule_retention,
+)
+from actinia_ogc_api_processes_plugin.core.media_types import (
+    JSON,
+    make_encoded_response,
+    negotiate_media_type,
+    not_acceptable_response,
 )
 from actinia_ogc_api_processes_plugin.model.response_models import (
     SimpleStatusCodeResponseModel,
@@ -42,6 +64,11 @@ class JobList(Resource):
     def get(self):
         """Return a list of jobs for the authenticated user."""
         try:
+            media_type = negotiate_media_type()
+            if media_type is None:
+                return not_acceptable_response()
+            schedule_retention()
+
             # read optional type query parameter (array)
             job_types = request.args.getlist("type") or None
             if job_types and len(job_types) == 1 and "," in job_types[0]:
@@ -86,6 +113,73 @@ class JobList(Resource):
                 )
                 return make_response(res, 400)
 
+            # read optional fields parameter (projection of the statusInfo,
+            # jobID is always included)
+            try:
+                fields = parse_fields(
+                    request.args.getlist("fields"),
+                    STATUS_INFO_FIELDS,
+                    required=("jobID",),
+                )
+            except ValueError:
+                res = jsonify(
+                    SimpleStatusCodeResponseModel(
+                        status=400,
+                        message="ERROR: Invalid fields parameter",
+                    ),
+                )
+                return make_response(res, 400)
+
+            # read optional change feed parameters: only jobs changed since
+            # the given sync token or updatedSince timestamp are returned
+            change_filter = None
+            sync_token = request.args.get("syncToken")
+            updated_since = request.args.get("updatedSince") or None
+            if sync_token is not None or updated_since:
+                try:
+                    if updated_since:
+                        updated_since = parse_updated_since(updated_since)
+                    feed = get_change_feed(request.authorization.username)
+                    change_filter = feed.changes_since(
+                        sync_token,
+                        updated_since,
+                    )
+                except ValueError:
+                    res = jsonify(
+                        SimpleStatusCodeResponseModel(
+                            status=400,
+                            message=(
+                                "ERROR: Invalid syncToken or updatedSince "
+                                "parameter"
+                            ),
+                        ),
+                    )
+                    return make_response(res, 400)
+
+            # read optional bbox parameter: only jobs whose bounding box
+            # intersects it are returned
+            bbox_filter = None
+            bbox = request.args.get("bbox") or None
+            if bbox:
+                try:
+                    bbox_filter = BBoxFilter(parse_bbox(bbox))
+                except ValueError:
+                    res = jsonify(
+                        SimpleStatusCodeResponseModel(
+                            status=400,
+                            message="ERROR: Invalid bbox parameter",
+                        ),
+                    )
+                    return make_response(res, 400)
+            # hidden jobs are left out until actinia dropped them as well
+            tombstones = get_tombstones()
+            # the change feed has to observe every job, so it goes first
+            record_filter = combine_record_filters(
+                change_filter,
+                tombstones.record_filter if tombstones else None,
+                bbox_filter,
+            )
+
             # If a single status was requested and it maps to an actinia raw
             # type, forward the filter to actinia-core via the `type` query
             # parameter. If multiple job_status requested, request all jobs and
@@ -94,18 +188,37 @@ class JobList(Resource):
             if job_status and len(job_status) == 1:
                 actinia_type = map_status_reverse(job_status[0])
 
-            resp = get_actinia_jobs(actinia_type=actinia_type, limit=limit)
+            # Filters applied locally can drop jobs from the actinia
+            # response, so more jobs are fetched until `limit` matches are
+            # found (see collect_actinia_jobs).
+            resp, records, partial = collect_actinia_jobs(
+                actinia_type,
+                limit,
+                job_types,
+                process_ids,
+                job_status,
+                datetime,
+                min_duration,
+                max_duration,
+                record_filter=record_filter,
+                sort_key=change_filter.sort_key if change_filter else None,
+            )
             if resp.status_code == 200:
-                jobs = parse_actinia_jobs(
-                    resp,
-                    job_types,
-                    process_ids,
-                    job_status,
-                    datetime,
-                    min_duration,
-                    max_duration,
+                next_token = None
+                if change_filter:
+                    next_token = change_filter.next_token(records, limit)
+                if media_type != JSON:
+                    return make_encoded_response(
+                        build_job_list(records, partial, next_token, fields),
+                        media_type,
+                    )
+                res = make_response(
+                    serialize_job_list(records, partial, next_token, fields),
+                    200,
                 )
-                return make_response(jsonify(jobs), 200)
+                res.mimetype = JSON
+                res.vary.add("Accept")
+                return res
             elif resp.status_code == 401:
                 log.error("ERROR: Unauthorized Access")
                 log.debug(f"actinia response: {resp.text}")
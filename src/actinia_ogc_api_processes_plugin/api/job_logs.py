@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+JobLogs endpoint implementation.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from flask import jsonify, make_response, request
+from flask_restful_swagger_2 import Resource, swagger
+from requests.exceptions import ConnectionError as req_ConnectionError
+
+from actinia_ogc_api_processes_plugin.api.job_events import (
+    event_stream_response,
+)
+from actinia_ogc_api_processes_plugin.api.job_status_info import JobStatusInfo
+from actinia_ogc_api_processes_plugin.apidocs import job_logs
+from actinia_ogc_api_processes_plugin.authentication import require_basic_auth
+from actinia_ogc_api_processes_plugin.core.job_logs import (
+    get_job_log,
+    job_log_stream,
+    parse_since,
+)
+from actinia_ogc_api_processes_plugin.core.job_retention import is_purged
+from actinia_ogc_api_processes_plugin.core.known_jobs import is_unknown_job
+from actinia_ogc_api_processes_plugin.model.response_models import (
+    SimpleStatusCodeResponseModel,
+)
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+EVENT_STREAM = "text/event-stream"
+
+
+class JobLogs(Resource):
+    """JobLogs handling."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.msg = "Return the new process log entries of a job"
+
+    @require_basic_auth()
+    @swagger.doc(job_logs.describe_job_logs_get_docs)
+    def get(self, job_id):
+        """Return the process log entries of a job from an offset on."""
+        try:
+            since = parse_since(request.args.get("since"))
+        except ValueError:
+            res = jsonify(
+                SimpleStatusCodeResponseModel(
+                    status=400,
+                    message="ERROR: Invalid since parameter",
+                ),
+            )
+            return make_response(res, 400)
+        if is_purged(job_id) or is_unknown_job(job_id):
+            return JobStatusInfo.not_found_response(job_id)
+
+        best = request.accept_mimetypes.best_match(
+            ["application/json", EVENT_STREAM],
+        )
+        if best == EVENT_STREAM:
+            stream = job_log_stream(job_id, since)
+            return event_stream_response(stream, job_id)
+
+        try:
+            status, page, resp = get_job_log(job_id, since)
+            if status == 200:
+                res = make_response(jsonify(page), 200)
+                res.headers["Cache-Control"] = "no-store"
+                return res
+            return JobStatusInfo.handle_error_status(status, resp, job_id)
+        except req_ConnectionError as e:
+            log.error(f"Connection ERROR: {e}")
+            res = jsonify(
+                SimpleStatusCodeResponseModel(
+                    status=503,
+                    message=f"Connection ERROR: {e}",
+                ),
+            )
+            return make_response(res, 503)
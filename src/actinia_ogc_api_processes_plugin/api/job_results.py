@@ -23,6 +23,10 @@ from requests.exceptions import ConnectionError as req_ConnectionError
 
 from actinia_ogc_api_processes_plugin.apidocs import job_results
 from actinia_ogc_api_processes_plugin.authentication import require_basic_auth
+from actinia_ogc_api_processes_plugin.core.job_cache import (
+    cache_terminal_job,
+    get_terminal_job,
+)
 from actinia_ogc_api_processes_plugin.core.job_results import (
     export_ref_to_header,
     export_ref_to_multipart,
@@ -30,9 +34,11 @@ from actinia_ogc_api_processes_plugin.core.job_results import (
     get_results,
     stdout_to_multipart,
 )
+from actinia_ogc_api_processes_plugin.core.job_retention import is_purged
 from actinia_ogc_api_processes_plugin.core.job_status_info import (
     get_job_status_info,
 )
+from actinia_ogc_api_processes_plugin.core.known_jobs import is_unknown_job
 from actinia_ogc_api_processes_plugin.model.response_models import (
     SimpleStatusCodeResponseModel,
 )
@@ -95,21 +101,49 @@ class JobResults(Resource):
                 )
                 return make_response(res, 400)
 
-            # -- request job results
-            status_code, status_info, resp = get_job_status_info(job_id)
+            # -- request job results (hidden and certainly unknown jobs
+            #    without asking actinia, cached jobs in a final state if
+            #    their results are known)
+            cached = None
+            if is_purged(job_id) or is_unknown_job(job_id):
+                status_code, status_info, resp = 404, None, None
+            else:
+                cached = get_terminal_job(job_id)
+                if cached is not None and (
+                    "results" in cached
+                    or cached["statusInfo"]["status"] != "successful"
+                ):
+                    status_code, status_info = 200, cached["statusInfo"]
+                else:
+                    cached = None
+                    status_code, status_info, resp = get_job_status_info(
+                        job_id,
+                    )
             if status_code == 200:
-                # Return full actinia response for logs
-                actinia_log_url = re.sub(
-                    r"https?:\/\/(.*?)\/api\/v\d+",
-                    ACTINIA.user_actinia_base_url,
-                    resp.json()["urls"]["status"],
-                )
+                if cached is None:
+                    cache_terminal_job(job_id, status_info, resp)
+                    # Return full actinia response for logs
+                    actinia_log_url = re.sub(
+                        r"https?:\/\/(.*?)\/api\/v\d+",
+                        ACTINIA.user_actinia_base_url,
+                        resp.json()["urls"]["status"],
+                    )
+                else:
+                    actinia_log_url = next(
+                        link["href"]
+                        for link in status_info["links"]
+                        if link.get("rel") == "convertedfrom"
+                    )
                 if status_info["status"] == "successful":
                     (
                         result_format,
                         stdout_dict,
                         export_out_dict,
-                    ) = get_results(resp)
+                    ) = (
+                        get_results(resp)
+                        if cached is None
+                        else cached["results"]
+                    )
                     # default status_code for most returns
                     status_code = 200
                     # -- Return results dependent on key-value of
@@ -14,22 +14,49 @@ __copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 
 
-from flask import jsonify, make_response
+from flask import jsonify, make_response, request
 from flask_restful_swagger_2 import Resource, swagger
 from requests.exceptions import ConnectionError as req_ConnectionError
 
 from actinia_ogc_api_processes_plugin.apidocs import job_status_info
-from actinia_ogc_api_processes_plugin.authentication import require_basic_auth
+from actinia_ogc_api_processes_plugin.authentication import (
+    credentials_key,
+    require_basic_auth,
+)
+from actinia_ogc_api_processes_plugin.core.job_cache import (
+    cache_terminal_job,
+    get_terminal_job,
+    invalidate_terminal_job,
+    status_info_of,
+)
+from actinia_ogc_api_processes_plugin.core.job_events import (
+    wait_for_job_status_info,
+)
+from actinia_ogc_api_processes_plugin.core.job_progress import progress_hints
+from actinia_ogc_api_processes_plugin.core.job_retention import is_purged
 from actinia_ogc_api_processes_plugin.core.job_status_info import (
     cancel_actinia_job,
     get_job_status_info,
+    last_known_status_info,
+    parse_wait,
+    remember_status_info,
+)
+from actinia_ogc_api_processes_plugin.core.known_jobs import is_unknown_job
+from actinia_ogc_api_processes_plugin.core.media_types import (
+    make_encoded_response,
+    negotiate_media_type,
+    not_acceptable_response,
 )
 from actinia_ogc_api_processes_plugin.model.response_models import (
     SimpleStatusCodeResponseModel,
     StatusInfoResponseModel,
 )
+from actinia_ogc_api_processes_plugin.resources.config import JOBSTATUS
 from actinia_ogc_api_processes_plugin.resources.logging import log
 
+# status codes of actinia (or a proxy in front of it) while it is down
+UNAVAILABLE_STATUS_CODES = frozenset({502, 503, 504})
+
 
 class JobStatusInfo(Resource):
     """JobStatusInfo handling."""
@@ -53,7 +80,7 @@ class JobStatusInfo(Resource):
         return model_kwargs
 
     @staticmethod
-    def _not_found_response(job_id: str) -> tuple:
+    def not_found_response(job_id: str) -> tuple:
         """Return a standardized 404 OGC exception response for a job."""
         res = jsonify(
             {
@@ -69,7 +96,30 @@ class JobStatusInfo(Resource):
         return make_response(res, 404)
 
     @staticmethod
-    def _handle_error_status(
+    def _stale_response(job_id: str, media_type: str | None):
+        """Return the last known statusInfo of a job or None.
+
+        Used while actinia is not available; the response is marked as
+        stale with its age.
+        """
+        last_known = last_known_status_info(job_id)
+        if last_known is None:
+            return None
+        status_info, age = last_known
+        log.warning(f"Returning last known status of job {job_id}")
+        res = make_encoded_response(
+            StatusInfoResponseModel(
+                **JobStatusInfo._build_status_info_kwargs(status_info),
+            ),
+            media_type,
+        )
+        res.headers["Warning"] = '110 - "Response is Stale"'
+        res.headers["Age"] = str(int(age))
+        res.headers["Retry-After"] = str(JOBSTATUS.stale_retry_after)
+        return res
+
+    @staticmethod
+    def handle_error_status(
         status_code: int,
         resp,
         job_id: str | None = None,
@@ -93,7 +143,7 @@ class JobStatusInfo(Resource):
         if status_code in {400, 404}:
             log.error("ERROR: No such job")
             log.debug(f"actinia response: {getattr(resp, 'text', '')}")
-            return JobStatusInfo._not_found_response(job_id)
+            return JobStatusInfo.not_found_response(job_id)
 
         # fallback
         log.error("ERROR: Internal Server Error")
@@ -113,19 +163,83 @@ class JobStatusInfo(Resource):
     @swagger.doc(job_status_info.describe_job_status_info_get_docs)
     def get(self, job_id):
         """Return status information for a given job id."""
+        media_type = None
         try:
-            status, status_info, resp = get_job_status_info(job_id)
+            media_type = negotiate_media_type()
+            if media_type is None:
+                return not_acceptable_response()
+            if is_purged(job_id) or is_unknown_job(job_id):
+                return self.not_found_response(job_id)
+
+            # read optional wait query parameter or Prefer header: hold the
+            # request until status or progress of the job change
+            try:
+                wait = parse_wait(
+                    request.args.get("wait"),
+                    request.headers.get("Prefer"),
+                )
+            except ValueError:
+                res = jsonify(
+                    SimpleStatusCodeResponseModel(
+                        status=400,
+                        message="ERROR: Invalid wait parameter",
+                    ),
+                )
+                return make_response(res, 400)
+
+            # jobs in a final state do not change anymore
+            cached = get_terminal_job(job_id)
+            if cached is not None:
+                status, status_info, resp = 200, status_info_of(cached), None
+            elif wait:
+                status, status_info, resp = wait_for_job_status_info(
+                    job_id,
+                    wait,
+                )
+            else:
+                status, status_info, resp = get_job_status_info(job_id)
             if status == 200:
+                if cached is None:
+                    cache_terminal_job(job_id, status_info, resp)
+                    remember_status_info(job_id, status_info)
+                # estimate the completion of running jobs and when it is
+                # worth to poll again
+                completion, retry_after = progress_hints(
+                    (credentials_key(), job_id),
+                    status_info,
+                )
+                if completion is not None:
+                    status_info = {
+                        **status_info,
+                        "estimatedCompletion": completion,
+                    }
                 # build StatusInfoResponseModel from status_info dict
                 model_kwargs = self._build_status_info_kwargs(status_info)
 
-                res = jsonify(StatusInfoResponseModel(**model_kwargs))
-                return make_response(res, 200)
+                res = make_encoded_response(
+                    StatusInfoResponseModel(**model_kwargs),
+                    media_type,
+                )
+                if wait is not None and "wait" not in request.args:
+                    res.headers["Preference-Applied"] = f"wait={wait:g}"
+                if retry_after is not None:
+                    res.headers["Retry-After"] = str(retry_after)
+                    res.headers["Cache-Control"] = (
+                        f"private, max-age={retry_after}"
+                    )
+                return res
 
+            if status in UNAVAILABLE_STATUS_CODES:
+                stale = self._stale_response(job_id, media_type)
+                if stale is not None:
+                    return stale
             # handle all non-200 cases centrally
-            return self._handle_error_status(status, resp, job_id)
+            return self.handle_error_status(status, resp, job_id)
         except req_ConnectionError as e:
             log.error(f"Connection ERROR: {e}")
+            stale = self._stale_response(job_id, media_type)
+            if stale is not None:
+                return stale
             res = jsonify(
                 SimpleStatusCodeResponseModel(
                     status=503,
@@ -146,6 +260,8 @@ class JobStatusInfo(Resource):
             status_code = getattr(resp, "status_code", None)
             if status_code == 200:
                 # After sending the termination request, return statusInfo
+                # (the cached one of a job in a final state is outdated)
+                invalidate_terminal_job(job_id)
                 s, status_info, _get_resp = get_job_status_info(job_id)
 
                 if s == 200 and status_info:
@@ -166,7 +282,7 @@ class JobStatusInfo(Resource):
                 )
                 return make_response(res, status_code)
             # handle non-success centrally
-            return self._handle_error_status(status_code, resp, job_id)
+            return self.handle_error_status(status_code, resp, job_id)
         except req_ConnectionError as e:
             log.error(f"Connection ERROR: {e}")
             res = jsonify(
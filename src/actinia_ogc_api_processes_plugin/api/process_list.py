@@ -17,7 +17,16 @@ from requests.exceptions import ConnectionError  # noqa: A004
 
 from actinia_ogc_api_processes_plugin.apidocs import process_list
 from actinia_ogc_api_processes_plugin.authentication import require_basic_auth
-from actinia_ogc_api_processes_plugin.core.process_list import get_modules
+from actinia_ogc_api_processes_plugin.core.actinia_common import parse_fields
+from actinia_ogc_api_processes_plugin.core.media_types import (
+    make_encoded_response,
+    negotiate_media_type,
+    not_acceptable_response,
+)
+from actinia_ogc_api_processes_plugin.core.process_list import (
+    PROCESS_SUMMARY_FIELDS,
+    get_modules,
+)
 from actinia_ogc_api_processes_plugin.model.response_models import (
     SimpleStatusCodeResponseModel,
 )
@@ -40,6 +49,10 @@ class ProcessList(Resource):
         and link to process descriptions.
         """
         try:
+            media_type = negotiate_media_type()
+            if media_type is None:
+                return not_acceptable_response()
+
             # read optional limit parameter
             limit = request.args.get("limit") or 10000
             try:
@@ -61,16 +74,33 @@ class ProcessList(Resource):
                 )
                 return make_response(res, 400)
 
+            # read optional fields parameter (projection of the process
+            # summaries, id is always included)
+            try:
+                fields = parse_fields(
+                    request.args.getlist("fields"),
+                    PROCESS_SUMMARY_FIELDS,
+                    required=("id",),
+                )
+            except ValueError:
+                res = jsonify(
+                    SimpleStatusCodeResponseModel(
+                        status=400,
+                        message="ERROR: Invalid fields parameter",
+                    ),
+                )
+                return make_response(res, 400)
+
             (
                 processes,
                 status_code_grass_modules,
                 status_code_actinia_modules,
-            ) = get_modules(limit=limit)
+            ) = get_modules(limit=limit, fields=fields)
             if (
                 status_code_grass_modules == 200
                 and status_code_actinia_modules == 200
             ):
-                return make_response(processes, 200)
+                return make_encoded_response(processes, media_type)
             elif (
                 status_code_grass_modules == 401
                 or status_code_actinia_modules == 401
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+JobBatchStatus API docs.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from actinia_ogc_api_processes_plugin.model.response_models import (
+    SimpleStatusCodeResponseModel,
+)
+
+describe_job_batch_status_post_docs = {
+    "tags": ["job_status_info"],
+    "description": (
+        "Retrieves the status information of several jobs of the "
+        "requesting user at once. The jobs listed in `jobIDs` are "
+        "requested concurrently."
+    ),
+    "parameters": [
+        {
+            "name": "body",
+            "in": "body",
+            "required": True,
+            "schema": {
+                "type": "object",
+                "required": ["jobIDs"],
+                "properties": {
+                    "jobIDs": {"type": "array", "items": {"type": "string"}},
+                },
+            },
+        },
+    ],
+    "responses": {
+        "200": {
+            "description": (
+                "This response returns the statusInfo per job id (`jobs`) "
+                "and the status code and message per job id which could "
+                "not be returned (`errors`): 401 or 403 if actinia denied "
+                "the access to the job, 404 for unknown jobs and 503 if "
+                "actinia was not available."
+            ),
+        },
+        "400": {
+            "description": "Client error",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+        "401": {
+            "description": "Unauthorized Access for all jobs",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+    },
+}
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+API docs for JobDismiss endpoint.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from actinia_ogc_api_processes_plugin.model.response_models import (
+    SimpleStatusCodeResponseModel,
+)
+
+describe_job_dismiss_post_docs = {
+    "tags": ["job_list"],
+    "description": (
+        "Dismiss several jobs of the requesting user at once. The body "
+        "either lists the `jobIDs` or gives a filter with `status`, "
+        "`processID` and `datetime` (see GET /jobs; without `status` only "
+        "accepted and running jobs match). Jobs are cancelled "
+        "concurrently. With `statusInfo: true` the statusInfo of every "
+        "cancelled job is requested from actinia, otherwise a `dismissed` "
+        "statusInfo is returned."
+    ),
+    "parameters": [
+        {
+            "name": "body",
+            "in": "body",
+            "required": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "jobIDs": {"type": "array", "items": {"type": "string"}},
+                    "status": {"type": "array", "items": {"type": "string"}},
+                    "processID": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "datetime": {"type": "string"},
+                    "statusInfo": {"type": "boolean", "default": False},
+                },
+            },
+        },
+    ],
+    "responses": {
+        "200": {
+            "description": (
+                "This response returns the statusInfo of the dismissed jobs "
+                "(`jobs`) and the jobs which could not be dismissed with "
+                "their status code (`errors`)."
+            ),
+        },
+        "400": {
+            "description": "Client error",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+        "401": {
+            "description": "Unauthorized Access",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+        "500": {
+            "description": "Internal Server Error",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+        "503": {
+            "description": "Connection Error",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+    },
+}
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Job event stream API docs.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from actinia_ogc_api_processes_plugin.model.response_models import (
+    SimpleStatusCodeResponseModel,
+)
+
+_error_responses = {
+    "401": {
+        "description": "Unauthorized Access",
+        "schema": SimpleStatusCodeResponseModel,
+    },
+    "500": {
+        "description": "Internal Server Error",
+        "schema": SimpleStatusCodeResponseModel,
+    },
+    "503": {
+        "description": (
+            "Connection Error or too many event streams of the server"
+        ),
+        "schema": SimpleStatusCodeResponseModel,
+        "headers": {
+            "Retry-After": {
+                "description": "Seconds after which to connect again",
+                "type": "integer",
+            },
+        },
+    },
+}
+
+describe_job_events_get_docs = {
+    "tags": ["job_status_info"],
+    "description": (
+        "Server-sent events (text/event-stream) with the status changes of "
+        "a job. The first `status` event contains the complete statusInfo, "
+        "later ones only the changed members and `jobID`. A `done` event "
+        "is sent and the stream is closed when the job reached a final "
+        "state; `error` events end the stream as well."
+    ),
+    "produces": ["text/event-stream"],
+    "responses": {
+        "200": {"description": "Stream of job status events"},
+        "404": {
+            "description": "Job not found",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+        **_error_responses,
+    },
+}
+
+describe_job_list_events_get_docs = {
+    "tags": ["job_list"],
+    "description": (
+        "Server-sent events (text/event-stream) with the status changes of "
+        "all jobs of the requesting user. First the complete statusInfo of "
+        "all jobs which are not final is sent followed by a `ready` event. "
+        "Afterwards a `status` event is sent for every new job and with "
+        "the changed members and `jobID` of every changed job."
+    ),
+    "produces": ["text/event-stream"],
+    "responses": {
+        "200": {"description": "Stream of job status events"},
+        **_error_responses,
+    },
+}
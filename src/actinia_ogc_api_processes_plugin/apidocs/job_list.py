@@ -11,6 +11,13 @@ __author__ = "Carmen Tawalika"
 __copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 
+from actinia_ogc_api_processes_plugin.apidocs.media_types import (
+    format_parameter,
+    not_acceptable_docs,
+)
+from actinia_ogc_api_processes_plugin.core.actinia_common import (
+    STATUS_INFO_FIELDS,
+)
 from actinia_ogc_api_processes_plugin.model.response_models import (
     SimpleStatusCodeResponseModel,
 )
@@ -74,6 +81,58 @@ describe_job_list_get_docs = {
             ),
             "type": "string",
         },
+        {
+            "name": "bbox",
+            "in": "query",
+            "required": False,
+            "description": (
+                "Return only jobs executed with a `bounding_box` input which "
+                "intersects the given box: 'minx,miny,maxx,maxy' (or 6 "
+                "numbers with heights, which are ignored). Coordinates are "
+                "compared as given, without reprojection."
+            ),
+            "type": "array",
+            "items": {"type": "number"},
+        },
+        {
+            "name": "updatedSince",
+            "in": "query",
+            "required": False,
+            "description": (
+                "Return only jobs whose `updated` time is later than the "
+                "given date-time (or epoch seconds). The response contains a "
+                "`syncToken` for the next request."
+            ),
+            "type": "string",
+        },
+        {
+            "name": "syncToken",
+            "in": "query",
+            "required": False,
+            "description": (
+                "Return only jobs which changed since the request which "
+                "returned this `syncToken`. An empty value starts a new feed "
+                "and returns all jobs. Changes are ordered by the time they "
+                "were observed; if `limit` jobs are returned, the remaining "
+                "changes follow with the next token."
+            ),
+            "type": "string",
+        },
+        {
+            "name": "fields",
+            "in": "query",
+            "required": False,
+            "description": (
+                "Return only these members of the statusInfo of each job "
+                "(comma separated, e.g. 'status,progress'). `jobID` is "
+                "always included."
+            ),
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": list(STATUS_INFO_FIELDS),
+            },
+        },
         {
             "name": "limit",
             "in": "query",
@@ -87,10 +146,15 @@ describe_job_list_get_docs = {
             "description": "Maximum number of returned jobs (1-10000).",
             "type": "integer",
         },
+        format_parameter,
     ],
     "responses": {
         "200": {
-            "description": "This response returns the jobs list.",
+            "description": (
+                "This response returns the jobs list. When filters are "
+                "given, `partial` is true if the scan of upstream jobs was "
+                "stopped before `limit` matches were found."
+            ),
         },
         "400": {
             "description": "Client error",
@@ -100,6 +164,7 @@ describe_job_list_get_docs = {
             "description": "Unauthorized Access",
             "schema": SimpleStatusCodeResponseModel,
         },
+        "406": not_acceptable_docs,
         "500": {
             "description": "Internal Server Error",
             "schema": SimpleStatusCodeResponseModel,
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+JobLogs API docs.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from actinia_ogc_api_processes_plugin.model.response_models import (
+    SimpleStatusCodeResponseModel,
+)
+
+describe_job_logs_get_docs = {
+    "tags": ["job_status_info"],
+    "description": (
+        "Retrieves the entries of the actinia process log of a job from "
+        "the offset `since` on, so a log can be followed without "
+        "downloading it completely on every request. The response "
+        "contains the `offset` to continue with (also as `next` link). "
+        "Without `since` the log is returned from the start. With `Accept: "
+        "text/event-stream` the entries are streamed as server-sent `log` "
+        "events (with the same members) until the job reached a final "
+        "state, which is marked by a `done` event."
+    ),
+    "produces": ["application/json", "text/event-stream"],
+    "parameters": [
+        {
+            "name": "since",
+            "in": "query",
+            "required": False,
+            "description": "Number of log entries to skip (default: 0)",
+            "type": "integer",
+            "minimum": 0,
+        },
+    ],
+    "responses": {
+        "200": {
+            "description": (
+                "This response returns the status of the job, the log "
+                "entries from `since` on and the `offset` after them."
+            ),
+            "schema": {
+                "type": "object",
+                "required": ["jobID", "status", "since", "offset"],
+                "properties": {
+                    "jobID": {"type": "string"},
+                    "status": {"type": "string"},
+                    "since": {"type": "integer"},
+                    "offset": {"type": "integer"},
+                    "entries": {"type": "array", "items": {"type": "object"}},
+                    "links": {"type": "array", "items": {"type": "object"}},
+                },
+            },
+        },
+        "400": {
+            "description": "Invalid since parameter",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+        "401": {
+            "description": "Unauthorized Access",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+        "404": {
+            "description": "Job not found",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+        "500": {
+            "description": "Internal Server Error",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+        "503": {
+            "description": "Connection Error",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+    },
+}
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+API docs for JobStats endpoint.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from actinia_ogc_api_processes_plugin.model.response_models import (
+    SimpleStatusCodeResponseModel,
+)
+
+describe_job_stats_get_docs = {
+    "tags": ["job_list"],
+    "description": (
+        "Aggregated statistics of the jobs of the requesting user: number "
+        "of jobs per status and type, and count, mean, min, max and "
+        "p50/p90/p99 percentiles (seconds) of the job duration "
+        "(finished - started) and queue wait (started - created). "
+        "Results are cached for a few seconds. If old jobs are hidden by "
+        "the retention, `retention` holds the number of hidden jobs (they "
+        "are not deleted in actinia)."
+    ),
+    "responses": {
+        "200": {
+            "description": "This response returns the job statistics.",
+        },
+        "401": {
+            "description": "Unauthorized Access",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+        "500": {
+            "description": "Internal Server Error",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+        "503": {
+            "description": "Connection Error",
+            "schema": SimpleStatusCodeResponseModel,
+        },
+    },
+}
@@ -11,6 +11,10 @@ __author__ = "Carmen Tawalika"
 __copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 
+from actinia_ogc_api_processes_plugin.apidocs.media_types import (
+    format_parameter,
+    not_acceptable_docs,
+)
 from actinia_ogc_api_processes_plugin.model.response_models import (
     SimpleStatusCodeResponseModel,
     StatusInfoResponseModel,
@@ -18,11 +22,61 @@ from actinia_ogc_api_processes_plugin.model.response_models import (
 
 describe_job_status_info_get_docs = {
     "tags": ["job_status_info"],
-    "description": "Retrieves the status information for a job.",
+    "description": (
+        "Retrieves the status information for a job. With `wait` (or the "
+        "header `Prefer: wait=<seconds>`) the response is delayed until "
+        "status or progress of the job change or the given number of "
+        "seconds passed."
+    ),
+    "parameters": [
+        format_parameter,
+        {
+            "name": "wait",
+            "in": "query",
+            "required": False,
+            "description": (
+                "Maximum number of seconds to wait for a change of status "
+                "or progress (capped by the server, 30 by default)."
+            ),
+            "type": "number",
+        },
+    ],
     "responses": {
         "200": {
-            "description": "This response returns the job status information.",
+            "description": (
+                "This response returns the job status information. For "
+                "running jobs `estimatedCompletion` is estimated from the "
+                "progress if possible."
+            ),
             "schema": StatusInfoResponseModel,
+            "headers": {
+                "Retry-After": {
+                    "description": (
+                        "Seconds after which the status of a running job "
+                        "has probably changed"
+                    ),
+                    "type": "integer",
+                },
+                "Cache-Control": {
+                    "description": "max-age with the same seconds",
+                    "type": "string",
+                },
+                "Warning": {
+                    "description": (
+                        "'110 - \"Response is Stale\"' if actinia is not "
+                        "available and the last known status is returned"
+                    ),
+                    "type": "string",
+                },
+                "Age": {
+                    "description": "Seconds since the status was last known",
+                    "type": "integer",
+                },
+            },
+        },
+        "400": {
+            "description": "Invalid wait parameter",
+            "schema": SimpleStatusCodeResponseModel,
         },
         "401": {
             "description": "Unauthorized Access",
@@ -32,6 +86,7 @@ describe_job_status_info_get_docs = {
             "description": "Job not found",
             "schema": SimpleStatusCodeResponseModel,
         },
+        "406": not_acceptable_docs,
         "500": {
             "description": "Internal Server Error",
             "schema": SimpleStatusCodeResponseModel,
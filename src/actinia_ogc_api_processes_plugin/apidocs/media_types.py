@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+API docs shared by endpoints supporting MessagePack and CBOR encodings.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from actinia_ogc_api_processes_plugin.model.response_models import (
+    SimpleStatusCodeResponseModel,
+)
+
+format_parameter = {
+    "name": "f",
+    "in": "query",
+    "required": False,
+    "description": (
+        "Format of the response: 'json', 'msgpack' or 'cbor'. Takes "
+        "precedence over the Accept header (application/json, "
+        "application/msgpack, application/cbor)."
+    ),
+    "type": "string",
+    "enum": ["json", "msgpack", "cbor"],
+}
+
+not_acceptable_docs = {
+    "description": "Requested format is not available",
+    "schema": SimpleStatusCodeResponseModel,
+}
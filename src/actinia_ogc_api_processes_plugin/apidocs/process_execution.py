@@ -19,12 +19,24 @@ from actinia_ogc_api_processes_plugin.model.response_models import (
 describe_process_execution_post_docs = {
     # "summary" is taken from the description of the get method
     "tags": ["process_execution"],
-    "description": "Executes a process.",
+    "description": (
+        "Executes a process. If the request body contains a `subscriber` "
+        "with a `successUri` (and optionally `inProgressUri` and "
+        "`failedUri`), the results document, the statusInfo of every "
+        "status or progress change and the statusInfo of a failed job are "
+        "POSTed to these URIs."
+    ),
     "responses": {
         "201": {
             "description": "This response returns the status info of the "
             "successfully started process.",
         },
+        "400": {
+            "description": (
+                "This response returns an 'Invalid request body' error "
+                "message, e.g. for an invalid subscriber"
+            ),
+        },
         "401": {
             "description": (
                 "This response returns an "
@@ -12,6 +12,13 @@ __copyright__ = "Copyright 2025 mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 
 
+from actinia_ogc_api_processes_plugin.apidocs.media_types import (
+    format_parameter,
+    not_acceptable_docs,
+)
+from actinia_ogc_api_processes_plugin.core.process_list import (
+    PROCESS_SUMMARY_FIELDS,
+)
 from actinia_ogc_api_processes_plugin.model.response_models import (
     SimpleStatusCodeResponseModel,
 )
@@ -21,6 +28,20 @@ describe_process_list_get_docs = {
     "tags": ["process_list"],
     "description": "Process identifiers, links to process descriptions.",
     "parameters": [
+        {
+            "name": "fields",
+            "in": "query",
+            "required": False,
+            "description": (
+                "Return only these members of each process summary (comma "
+                "separated, e.g. 'version'). `id` is always included."
+            ),
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": list(PROCESS_SUMMARY_FIELDS),
+            },
+        },
         {
             "name": "limit",
             "in": "query",
@@ -34,6 +55,7 @@ describe_process_list_get_docs = {
             "description": "Maximum number of returned processes (1-10000).",
             "type": "integer",
         },
+        format_parameter,
     ],
     "responses": {
         "200": {
@@ -49,6 +71,7 @@ describe_process_list_get_docs = {
             ),
             "schema": SimpleStatusCodeResponseModel,
         },
+        "406": not_acceptable_docs,
         "500": {
             "description": (
                 "This response returns an "
@@ -12,10 +12,18 @@ __copyright__ = "Copyright 2025 mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 
 
+import hashlib
+import hmac
+import secrets
 from functools import wraps
 
 from flask import jsonify, request
 
+from actinia_ogc_api_processes_plugin.resources.config import SHARED
+
+# secret of the credentials keys of this worker if SHARED.secret is not set
+_SECRET = secrets.token_bytes(32)
+
 
 def require_basic_auth(realm: str = "Login Required"):
     """Apply decorator for HTTP Basic Auth.
@@ -40,3 +48,19 @@ def require_basic_auth(realm: str = "Login Required"):
         return wrapped
 
     return decorator
+
+
+def credentials_key(auth=None) -> str:
+    """Return a key identifying the credentials of the current request.
+
+    Credentials are only verified by actinia, so responses cached without
+    asking actinia must be keyed by user and password, not by user alone.
+    The key is an HMAC with the server secret `SHARED.secret`, so the
+    password cannot be guessed from keys in the shared database or in file
+    names. `auth` defaults to the credentials of the current request.
+    """
+    if auth is None:
+        auth = request.authorization
+    secret = SHARED.secret.encode() if SHARED.secret else _SECRET
+    raw = f"{auth.username}:{auth.password}".encode()
+    return hmac.new(secret, raw, hashlib.sha256).hexdigest()
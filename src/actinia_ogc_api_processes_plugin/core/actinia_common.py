@@ -11,10 +11,33 @@ __author__ = "Carmen Tawalika"
 __copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 
+import sys
 from datetime import datetime, timedelta, timezone
 
 from flask import request
 
+from actinia_ogc_api_processes_plugin.core.job_index import (
+    bbox_from_process_chain,
+)
+
+# actinia states in which a job does not change anymore
+TERMINAL_STATES = frozenset({"finished", "error", "terminated"})
+
+# members of an OGC statusInfo in the order they are returned
+STATUS_INFO_FIELDS = (
+    "jobID",
+    "status",
+    "type",
+    "message",
+    "processID",
+    "created",
+    "updated",
+    "started",
+    "finished",
+    "progress",
+    "links",
+)
+
 
 def map_status(raw: object) -> str:
     """Map actinia status values to OGC statusInfo values.
@@ -100,7 +123,7 @@ def calculate_finished(data: dict):
     Calculate `finished` from accept_timestamp + time_delta (seconds)
     """
     status = data.get("status")
-    if status not in {"finished", "error", "terminated"}:
+    if status not in TERMINAL_STATES:
         return None
     start = data.get("accept_timestamp")
 
@@ -123,73 +146,214 @@ def parse_actinia_job_id(data):
     return job_id
 
 
-def parse_actinia_job(job_id, data):
-    """Parse actinia job response json into status_info dict."""
-    status_info = {}
-    status_info["jobID"] = job_id
-    status_info["status"] = map_status(data.get("status"))
-    status_info["type"] = data.get("type", "process")
-    status_info["message"] = data.get("message")
-    status_info["processID"] = data.get("resource_id")
-
-    # Servers SHOULD set the value of the created field when a job has been
-    # accepted and queued for execution.
+def _to_epoch(value) -> float | None:
+    """Return `value` as epoch seconds float or None when invalid."""
     try:
-        created = datetime.fromtimestamp(
-            float(data.get("accept_timestamp")),
-            tz=timezone.utc,
-        )
-        status_info["created"] = created.replace(microsecond=0).isoformat()
+        return float(value)
     except (TypeError, ValueError):
-        pass
+        return None
 
-    # Whenever the status field of the job changes, servers SHOULD revise the
-    # value of the updated field.
-    # -> actinia-core updates this field every time anything was updated.
-    try:
-        updated = datetime.fromtimestamp(
-            float(data.get("timestamp")),
-            tz=timezone.utc,
-        )
-        status_info["updated"] = updated.replace(microsecond=0).isoformat()
-    except (TypeError, ValueError):
-        pass
 
-    # Servers SHOULD set the value of the started field when a job begins
-    # execution and is consuming compute resources.
+def _format_epoch(value: float | None) -> str | None:
+    """Return epoch seconds as ISO string without microseconds or None."""
+    if value is None:
+        return None
     try:
-        started = datetime.fromtimestamp(
-            float(data.get("start_timestamp")),
-            tz=timezone.utc,
+        dt = datetime.fromtimestamp(value, tz=timezone.utc)
+    except (OverflowError, OSError, ValueError):
+        return None
+    return dt.replace(microsecond=0).isoformat()
+
+
+class JobRecord:
+    """Compact representation of an actinia job.
+
+    Timestamps are kept as epoch seconds (float) and status and type as
+    interned strings, so that filtering and sorting work on raw values.
+    The OGC `statusInfo` dict is only created by `to_status_info`.
+    `fragment` can hold the serialized statusInfo of a job which does not
+    change anymore (see `core.job_list.serialize_job_list`).
+    """
+
+    __slots__ = (
+        "bbox",
+        "created",
+        "finished",
+        "fragment",
+        "job_id",
+        "links",
+        "message",
+        "process_id",
+        "progress",
+        "started",
+        "status",
+        "type",
+        "updated",
+    )
+
+    def __init__(
+        self,
+        job_id: str,
+        status: str,
+        job_type: str = "process",
+        message: str | None = None,
+        process_id: str | None = None,
+        created: float | None = None,
+        updated: float | None = None,
+        started: float | None = None,
+        finished: float | None = None,
+        progress: int | None = None,
+        links: list | None = None,
+        bbox: tuple | None = None,
+    ) -> None:
+        """Initialise."""
+        self.job_id = job_id
+        self.status = status
+        self.type = job_type
+        self.message = message
+        self.process_id = process_id
+        self.created = created
+        self.updated = updated
+        self.started = started
+        self.finished = finished
+        self.progress = progress
+        self.links = links
+        self.bbox = bbox
+        self.fragment = None
+
+    @classmethod
+    def from_actinia(cls, job_id, data: dict):
+        """Create a JobRecord from an actinia job response json."""
+        job_type = data.get("type", "process")
+        if isinstance(job_type, str):
+            job_type = sys.intern(job_type)
+
+        # Servers SHOULD set the value of the created field when a job has
+        # been accepted and queued for execution.
+        created = _to_epoch(data.get("accept_timestamp"))
+
+        # Servers SHOULD set the value of the finished field when the
+        # execution of a job has completed and the process is no longer
+        # consuming compute resources.
+        # -> calculated from accept_timestamp + time_delta (seconds),
+        #    None if job not finished.
+        finished = None
+        raw_status = data.get("status")
+        if (
+            created is not None
+            and isinstance(raw_status, str)
+            and raw_status in TERMINAL_STATES
+        ):
+            time_delta = _to_epoch(data.get("time_delta"))
+            if time_delta is not None:
+                finished = created + time_delta
+
+        return cls(
+            job_id,
+            map_status(raw_status),
+            job_type,
+            data.get("message"),
+            data.get("resource_id"),
+            created,
+            # Whenever the status field of the job changes, servers SHOULD
+            # revise the value of the updated field.
+            # -> actinia-core updates this field every time anything was
+            #    updated.
+            _to_epoch(data.get("timestamp")),
+            # Servers SHOULD set the value of the started field when a job
+            # begins execution and is consuming compute resources.
+            _to_epoch(data.get("start_timestamp")),
+            finished,
+            calculate_progress(data),
+            data.get("links"),
+            # items of job lists carry the bbox instead of the process
+            # chains, see `core.job_list.reduce_job_item`
+            data["bbox"] if "bbox" in data else bbox_from_process_chain(data),
         )
-        status_info["started"] = started.replace(microsecond=0).isoformat()
-    except (TypeError, ValueError):
-        pass
-
-    # Servers SHOULD set the value of the finished field when the execution of
-    # a job has completed and the process is no longer consuming compute
-    # resources.
-    # -> Returns none of job not finished.
-    finished_val = calculate_finished(data)
-    if finished_val is not None:
-        status_info["finished"] = finished_val
-
-    progress_val = calculate_progress(data)
-    if progress_val is not None:
-        status_info["progress"] = progress_val
-
-    links = data.get("links")
-    if not links:
-        links = [
-            {"href": request.url, "rel": "self"},
-            {
-                "href": f"{request.url}/results",
-                "rel": "http://www.opengis.net/def/rel/ogc/1.0/results",
-            },
-        ]
-    status_info["links"] = links
-
-    return status_info
+
+    def to_status_info(
+        self,
+        links: list | None = None,
+        fields=None,
+    ) -> dict:
+        """Return the OGC `statusInfo` dict of this job.
+
+        `links` overwrite the links of the record. If neither is given,
+        links to the current request are generated.
+        If `fields` is given, only these members are included; timestamps
+        and links which are not requested are neither formatted nor
+        generated.
+        """
+        status_info = {}
+        for key, value in (
+            ("jobID", self.job_id),
+            ("status", self.status),
+            ("type", self.type),
+            ("message", self.message),
+            ("processID", self.process_id),
+        ):
+            if fields is None or key in fields:
+                status_info[key] = value
+        for key, value in (
+            ("created", self.created),
+            ("updated", self.updated),
+            ("started", self.started),
+            ("finished", self.finished),
+        ):
+            if fields is not None and key not in fields:
+                continue
+            formatted = _format_epoch(value)
+            if formatted is not None:
+                status_info[key] = formatted
+        if self.progress is not None and (
+            fields is None or "progress" in fields
+        ):
+            status_info["progress"] = self.progress
+
+        if fields is not None and "links" not in fields:
+            return status_info
+        if links is None:
+            links = self.links
+        if not links:
+            links = [
+                {"href": request.url, "rel": "self"},
+                {
+                    "href": f"{request.url}/results",
+                    "rel": "http://www.opengis.net/def/rel/ogc/1.0/results",
+                },
+            ]
+        status_info["links"] = links
+        return status_info
+
+
+def parse_actinia_job(job_id, data, fields=None):
+    """Parse actinia job response json into status_info dict.
+
+    If `fields` is given, only these statusInfo members are computed.
+    """
+    return JobRecord.from_actinia(job_id, data).to_status_info(fields=fields)
+
+
+def parse_fields(value: str | list | None, allowed, required=()):
+    """Parse a `fields` projection query parameter.
+
+    `value` is a comma separated string or a list of such strings. Returns
+    a frozenset of the requested fields including `required` ones, or None
+    if no projection was requested. Raises ValueError for fields which are
+    not `allowed`.
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = [value]
+    fields = {f.strip() for v in value for f in v.split(",") if f.strip()}
+    unknown = fields.difference(allowed)
+    if unknown:
+        msg = f"Unknown fields: {', '.join(sorted(unknown))}"
+        raise ValueError(msg)
+    if not fields:
+        return None
+    return frozenset(fields.union(required))
 
 
 def safe_parse_actinia_job(data):
@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Read-only access to the jobs in the valkey database of actinia.
+
+actinia keeps every job as pickled tuple (http code, response model) with
+the key `RESOURCE-LOGGER::<user>::<resource id>` and its users as hash
+`USER-DATABASE::<user>`. Reading them directly skips the HTTP API of
+actinia for status polls and job lists. Credentials are verified against
+the password hash of the user like actinia does.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+import base64
+import builtins
+import functools
+import hashlib
+import hmac
+import io
+import json
+import pickle
+import time
+
+from actinia_ogc_api_processes_plugin.authentication import credentials_key
+from actinia_ogc_api_processes_plugin.core.cache import LRUCache
+from actinia_ogc_api_processes_plugin.resources.config import VALKEY
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+try:
+    import valkey
+except ImportError:
+    valkey = None
+
+RESOURCE_PREFIX = "RESOURCE-LOGGER::"
+USER_PREFIX = "USER-DATABASE::"
+
+# credentials key -> (monotonic time until which it is valid, verified)
+_VERIFIED = LRUCache(1000)
+
+# errors of unpickling jobs which are not as expected
+_LOAD_ERRORS = (
+    pickle.UnpicklingError,
+    AttributeError,
+    EOFError,
+    IndexError,
+    KeyError,
+    TypeError,
+    ValueError,
+)
+
+
+class ValkeyResponse:
+    """Stand-in for the `requests.Response` of the actinia API."""
+
+    def __init__(self, status_code: int, data) -> None:
+        """Initialise with the status code and the parsed body."""
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        """Return the body."""
+        return self._data
+
+    @property
+    def text(self) -> str:
+        """Return the body as JSON string."""
+        return json.dumps(self._data, default=str)
+
+    def close(self) -> None:
+        """Do nothing, there is no connection to release."""
+
+
+class _Model(dict):
+    """Loads the response models of actinia, which are dicts."""
+
+    def __setstate__(self, state) -> None:
+        """Ignore the instance attributes of the model classes."""
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickler which only creates containers and plain values.
+
+    Classes of actinia and its dependencies are loaded as dicts (their
+    response models are dicts), any other class is rejected.
+    """
+
+    BUILTINS = frozenset(
+        {"bool", "bytes", "dict", "float", "frozenset", "int", "list"}
+        | {"set", "str", "tuple"},
+    )
+    MODEL_MODULES = ("actinia_core", "flask_restful_swagger_2")
+
+    def find_class(self, module: str, name: str):
+        """Return the class to create for `module`.`name`."""
+        if module == "builtins" and name in self.BUILTINS:
+            return getattr(builtins, name)
+        if module == "collections" and name == "OrderedDict":
+            return dict
+        if module.split(".")[0] in self.MODEL_MODULES:
+            return _Model
+        msg = f"Class {module}.{name} is not allowed"
+        raise pickle.UnpicklingError(msg)
+
+
+def _loads(data: bytes):
+    """Return the (http code, response model) tuple of a job."""
+    http_code, model = _Unpickler(io.BytesIO(data)).load()
+    return int(http_code), model
+
+
+@functools.cache
+def _client():
+    """Return the valkey client (with a connection pool) or None."""
+    if not VALKEY.url:
+        return None
+    if valkey is None:
+        log.warning(
+            "VALKEY url is set, but valkey is not installed; jobs are "
+            "requested from actinia",
+        )
+        return None
+    pool = valkey.ConnectionPool.from_url(
+        VALKEY.url,
+        max_connections=VALKEY.max_connections,
+        socket_timeout=VALKEY.timeout,
+        socket_connect_timeout=VALKEY.timeout,
+    )
+    return valkey.Valkey(connection_pool=pool)
+
+
+def _ab64_decode(value: str) -> bytes:
+    """Decode the base64 variant of passlib ("." instead of "+")."""
+    value = value.replace(".", "+")
+    return base64.b64decode(value + "=" * (-len(value) % 4))
+
+
+def verify_password(password: str, password_hash) -> bool | None:
+    """Verify a password against a pbkdf2-sha256 hash of passlib.
+
+    Returns None if the hash has an unknown format.
+    """
+    if isinstance(password_hash, bytes):
+        password_hash = password_hash.decode()
+    parts = (password_hash or "").split("$")
+    if len(parts) != 5 or parts[1] != "pbkdf2-sha256":
+        return None
+    try:
+        rounds = int(parts[2])
+        salt = _ab64_decode(parts[3])
+        checksum = _ab64_decode(parts[4])
+    except ValueError:
+        return None
+    digest = hashlib.pbkdf2_hmac(
+        "sha256",
+        password.encode(),
+        salt,
+        rounds,
+        len(checksum),
+    )
+    return hmac.compare_digest(digest, checksum)
+
+
+def _cached_verification(auth) -> bool | None:
+    """Return the cached result of verifying `auth` or None."""
+    cached = _VERIFIED.get(credentials_key(auth))
+    if cached is None or cached[0] < time.monotonic():
+        return None
+    return cached[1]
+
+
+def _verify(auth, password_hash) -> bool | None:
+    """Verify and cache `auth` for `VALKEY.auth_ttl` seconds.
+
+    Returns None if the user is unknown or its hash cannot be verified,
+    then actinia has to decide.
+    """
+    if password_hash is None:
+        return None
+    verified = verify_password(auth.password, password_hash)
+    if verified is not None:
+        _VERIFIED.set(
+            credentials_key(auth),
+            (time.monotonic() + VALKEY.auth_ttl, verified),
+        )
+    return verified
+
+
+def _unauthorized() -> ValkeyResponse:
+    """Return the response of actinia for invalid credentials."""
+    return ValkeyResponse(401, {"message": "Unauthorized Access"})
+
+
+def read_actinia_job(job_id: str, auth) -> ValkeyResponse | None:
+    """Return a job of the user of `auth` like GET /resources/<user>/<id>.
+
+    The password hash and the job are read in one round trip. Returns None
+    if valkey is not configured or not available, or the credentials
+    cannot be verified; the job has to be requested from actinia then.
+    """
+    client = _client()
+    if client is None:
+        return None
+    verified = _cached_verification(auth)
+    key = f"{RESOURCE_PREFIX}{auth.username}::resource_id-{job_id}"
+    try:
+        if verified is None:
+            pipe = client.pipeline(transaction=False)
+            pipe.hget(f"{USER_PREFIX}{auth.username}", "password_hash")
+            pipe.get(key)
+            password_hash, data = pipe.execute()
+            verified = _verify(auth, password_hash)
+        elif verified:
+            data = client.get(key)
+    except valkey.exceptions.ValkeyError as e:
+        log.warning(f"valkey of actinia not available: {e}")
+        return None
+    if verified is None:
+        return None
+    if not verified:
+        return _unauthorized()
+    if data is None:
+        return ValkeyResponse(
+            400,
+            {"status": "error", "message": "Resource does not exist"},
+        )
+    try:
+        return ValkeyResponse(*_loads(data))
+    except _LOAD_ERRORS as e:
+        log.warning(f"Job {job_id} could not be read from valkey: {e}")
+        return None
+
+
+def _iter_jobs(client, username: str):
+    """Yield the pickled jobs of a user.
+
+    Keys are scanned and the jobs fetched with one MGET per batch of
+    `VALKEY.scan_count` keys.
+    """
+    prefix = f"{RESOURCE_PREFIX}{username}::"
+    start = len(prefix.encode())
+    batch = []
+    keys = client.scan_iter(match=f"{prefix}*", count=VALKEY.scan_count)
+    for key in keys:
+        # keys with an iteration suffix belong to the same job
+        if b"::" in key[start:]:
+            continue
+        batch.append(key)
+        if len(batch) >= VALKEY.scan_count:
+            yield from client.mget(batch)
+            batch = []
+    if batch:
+        yield from client.mget(batch)
+
+
+def read_actinia_jobs(
+    auth,
+    actinia_type: str | None = None,
+    limit: int | None = None,
+) -> ValkeyResponse | None:
+    """Return the jobs of the user of `auth` like GET /resources/<user>.
+
+    `actinia_type` filters by actinia status and `limit` limits the number
+    of jobs, as the `type` and `num` parameters of actinia. Returns None if
+    the jobs have to be requested from actinia (see `read_actinia_job`).
+    """
+    client = _client()
+    if client is None:
+        return None
+    try:
+        verified = _cached_verification(auth)
+        if verified is None:
+            verified = _verify(
+                auth,
+                client.hget(f"{USER_PREFIX}{auth.username}", "password_hash"),
+            )
+        if verified is None:
+            return None
+        if not verified:
+            return _unauthorized()
+        resource_list = []
+        for data in _iter_jobs(client, auth.username):
+            if limit is not None and len(resource_list) >= limit:
+                break
+            if data is None:
+                # removed since the scan
+                continue
+            try:
+                _http_code, model = _loads(data)
+            except _LOAD_ERRORS:
+                continue
+            if actinia_type and model.get("status") != actinia_type:
+                continue
+            resource_list.append(model)
+    except valkey.exceptions.ValkeyError as e:
+        log.warning(f"valkey of actinia not available: {e}")
+        return None
+    return ValkeyResponse(200, {"resource_list": resource_list})
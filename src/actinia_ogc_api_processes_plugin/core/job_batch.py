@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Core helpers shared by the endpoints acting on several jobs at once.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from flask import jsonify, make_response
+
+from actinia_ogc_api_processes_plugin.model.response_models import (
+    SimpleStatusCodeResponseModel,
+)
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+
+def bad_request_response(message: str):
+    """Return a 400 response."""
+    res = jsonify(SimpleStatusCodeResponseModel(status=400, message=message))
+    return make_response(res, 400)
+
+
+def unauthorized_response():
+    """Return a 401 response."""
+    log.error("ERROR: Unauthorized Access")
+    res = jsonify(
+        SimpleStatusCodeResponseModel(
+            status=401,
+            message="ERROR: Unauthorized Access",
+        ),
+    )
+    return make_response(res, 401)
+
+
+def _call(func, job_id: str) -> tuple:
+    """Call `func(job_id)` and return a tuple (result, error)."""
+    try:
+        return func(job_id), None
+    except requests.RequestException as e:
+        return None, e
+
+
+def map_jobs(func, job_ids: list, concurrency: int) -> list:
+    """Call `func(job_id)` for every job id concurrently.
+
+    At most `concurrency` calls run at the same time. Returns a tuple
+    (result, error) per job id in the order of `job_ids`; `error` is the
+    requests exception raised by the call or None.
+    """
+    if not job_ids:
+        return []
+    workers = max(1, min(concurrency, len(job_ids)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda job_id: _call(func, job_id), job_ids))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Core helper to request the status of several jobs at once.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from flask import request
+
+from actinia_ogc_api_processes_plugin.core.job_batch import map_jobs
+from actinia_ogc_api_processes_plugin.core.job_events import job_links
+from actinia_ogc_api_processes_plugin.core.job_retention import get_tombstones
+from actinia_ogc_api_processes_plugin.core.job_status_info import (
+    get_actinia_job,
+    status_info_from_response,
+)
+from actinia_ogc_api_processes_plugin.resources.config import JOBSTATUS
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+NOT_FOUND = {"status": 404, "message": "No such job"}
+# errors of single jobs by the status code of actinia (400 only remains
+# for unknown jobs, see `status_info_from_response`)
+ITEM_ERRORS = {
+    401: {"status": 401, "message": "ERROR: Unauthorized Access"},
+    403: {"status": 403, "message": "ERROR: Forbidden"},
+    404: NOT_FOUND,
+    502: {"status": 503, "message": "ERROR: actinia is not available"},
+    503: {"status": 503, "message": "ERROR: actinia is not available"},
+    504: {"status": 503, "message": "ERROR: actinia is not available"},
+}
+INTERNAL_ERROR = {"status": 500, "message": "ERROR: Internal Server Error"}
+
+
+def get_job_status_infos(job_ids: list) -> dict:
+    """Return the statusInfo of several jobs of the current user.
+
+    Jobs are requested concurrently, at most `JOBSTATUS.batch_concurrency`
+    at the same time; hidden jobs are not requested.
+
+    Returns a dict with the statusInfo per job id (`jobs`), an error with
+    `status` and `message` per job id which could not be returned
+    (`errors`, see `ITEM_ERRORS`) and `unauthorized` if actinia rejected
+    the credentials for all jobs.
+    """
+    auth = request.authorization
+    base = request.url_root.rstrip("/")
+    job_ids = list(dict.fromkeys(job_ids))
+
+    errors = {}
+    tombstones = get_tombstones()
+    if tombstones:
+        errors = {
+            job_id: NOT_FOUND for job_id in job_ids if job_id in tombstones
+        }
+    pending = [job_id for job_id in job_ids if job_id not in errors]
+    results = map_jobs(
+        lambda job_id: get_actinia_job(job_id, auth=auth),
+        pending,
+        JOBSTATUS.batch_concurrency,
+    )
+
+    jobs = {}
+    for job_id, (resp, error) in zip(pending, results):
+        if error is not None:
+            log.error(f"Connection ERROR while requesting {job_id}: {error}")
+            errors[job_id] = {
+                "status": 503,
+                "message": f"Connection ERROR: {error}",
+            }
+            continue
+        status_code, status_info = status_info_from_response(
+            job_id,
+            resp,
+            job_links(base, job_id),
+        )
+        if status_code == 200:
+            jobs[job_id] = status_info
+            continue
+        if status_code not in ITEM_ERRORS:
+            log.debug(f"actinia response for {job_id}: {resp.text}")
+        errors[job_id] = ITEM_ERRORS.get(status_code, INTERNAL_ERROR)
+
+    unauthorized = bool(errors) and all(
+        error["status"] == 401 for error in errors.values()
+    )
+    return {"jobs": jobs, "errors": errors, "unauthorized": unauthorized}
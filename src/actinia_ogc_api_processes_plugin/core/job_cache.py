@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Cache of the statusInfo and results of jobs in a final state.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+import json
+
+from flask import request
+
+from actinia_ogc_api_processes_plugin.authentication import credentials_key
+from actinia_ogc_api_processes_plugin.core.cache import LRUCache
+from actinia_ogc_api_processes_plugin.core.job_list import COMPLETED_STATES
+from actinia_ogc_api_processes_plugin.core.job_results import get_results
+from actinia_ogc_api_processes_plugin.core.shared_store import (
+    shared,
+    shared_key,
+)
+from actinia_ogc_api_processes_plugin.resources.config import JOBSTATUS
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+RESULTS_REL = "http://www.opengis.net/def/rel/ogc/1.0/results"
+# links of a statusInfo which depend on the request
+REQUEST_RELS = frozenset({"self", RESULTS_REL})
+
+# (credentials key, job id) -> serialized entry
+_LOCAL = LRUCache(JOBSTATUS.terminal_cache_size)
+
+
+def _shared_key(key: tuple) -> str:
+    """Return the key of an entry in the shared database."""
+    return shared_key("terminal-job", *key)
+
+
+def get_terminal_job(job_id: str) -> dict | None:
+    """Return the cached entry of a job of the current user or None.
+
+    An entry is a dict with the `statusInfo` of the job (without links to
+    the request, see `status_info_of`) and, for successful jobs, usually
+    its `results` as returned by `get_results`. Each call returns a new
+    copy, so entries can be modified.
+    """
+    key = (credentials_key(), job_id)
+    data = _LOCAL.get(key)
+    if data is None:
+        data = shared("get", _shared_key(key))
+        if data is None:
+            return None
+        _LOCAL.set(key, data)
+    return json.loads(data)
+
+
+def cache_terminal_job(job_id: str, status_info: dict, resp=None) -> None:
+    """Cache the statusInfo of a job of the current user in a final state.
+
+    The results of a successful job are cached as well if the actinia
+    response `resp` is given. Jobs which are not in a final state are not
+    cached, because their statusInfo still changes.
+    """
+    status = status_info.get("status")
+    if status not in COMPLETED_STATES:
+        return
+    key = (credentials_key(), job_id)
+    entry = {
+        "statusInfo": {
+            **status_info,
+            "links": [
+                link
+                for link in status_info.get("links") or ()
+                if link.get("rel") not in REQUEST_RELS
+            ],
+        },
+    }
+    if status == "successful":
+        if resp is None:
+            # do not replace an entry which includes the results
+            if key in _LOCAL:
+                return
+        else:
+            try:
+                entry["results"] = get_results(resp)
+            except (KeyError, IndexError, TypeError, ValueError):
+                log.debug(f"Results of job {job_id} are not cached")
+    data = json.dumps(entry)
+    _LOCAL.set(key, data)
+    shared("setex", _shared_key(key), JOBSTATUS.terminal_cache_ttl, data)
+
+
+def invalidate_terminal_job(job_id: str, key: str | None = None) -> None:
+    """Remove a job from the cache.
+
+    `key` is the credentials key of the user and defaults to the one of
+    the current request.
+    """
+    if key is None:
+        key = credentials_key()
+    _LOCAL.pop((key, job_id))
+    shared("delete", _shared_key((key, job_id)))
+
+
+def status_info_of(entry: dict) -> dict:
+    """Return the statusInfo of a cache entry with links to the request."""
+    status_info = entry["statusInfo"]
+    status_info["links"] = [
+        {"href": request.url, "rel": "self"},
+        {"href": f"{request.url}/results", "rel": RESULTS_REL},
+        *status_info["links"],
+    ]
+    return status_info
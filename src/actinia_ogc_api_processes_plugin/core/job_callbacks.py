@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Callbacks to the subscriber of a job (successUri, inProgressUri, failedUri).
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+import ipaddress
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+from flask import request
+
+from actinia_ogc_api_processes_plugin.core.job_events import (
+    job_watcher,
+    subscribe,
+)
+from actinia_ogc_api_processes_plugin.core.job_results import get_results
+from actinia_ogc_api_processes_plugin.core.job_status_info import (
+    get_actinia_job,
+)
+from actinia_ogc_api_processes_plugin.resources.config import (
+    CALLBACKS,
+    JOBSTATUS,
+)
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+SUBSCRIBER_URIS = ("successUri", "inProgressUri", "failedUri")
+IN_PROGRESS_STATES = frozenset({"accepted", "running"})
+
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=CALLBACKS.workers,
+    thread_name_prefix="callback",
+)
+# callbacks which are sent or waiting for a (further) attempt
+_PENDING = threading.BoundedSemaphore(CALLBACKS.max_pending)
+
+
+def _is_public(hostname: str) -> bool:
+    """Return True if a host resolves to public addresses only."""
+    try:
+        infos = socket.getaddrinfo(hostname, None)
+    except (OSError, UnicodeError):
+        return False
+    # the zone of scoped IPv6 addresses is appended after "%"
+    addresses = {info[4][0].split("%", 1)[0] for info in infos}
+    return bool(addresses) and all(
+        ipaddress.ip_address(address).is_global for address in addresses
+    )
+
+
+def host_allowed(hostname: str) -> bool:
+    """Return True if callbacks can be sent to a host.
+
+    Only hosts in `CALLBACKS.allowed_hosts` are allowed or, if it is empty,
+    hosts with public addresses, so that callbacks cannot reach internal
+    services (loopback, private and link-local addresses like the cloud
+    metadata service).
+    """
+    if CALLBACKS.allowed_hosts:
+        return hostname in CALLBACKS.allowed_hosts
+    return _is_public(hostname)
+
+
+def parse_subscriber(subscriber) -> dict | None:
+    """Return the callback URIs of the `subscriber` of an execute request.
+
+    `successUri` is required, `inProgressUri` and `failedUri` are optional.
+    Only http(s) URIs to allowed hosts (see `host_allowed`) are accepted.
+    Raises ValueError for an invalid subscriber.
+    """
+    if subscriber is None:
+        return None
+    if not isinstance(subscriber, dict) or "successUri" not in subscriber:
+        msg = "Subscriber requires a successUri"
+        raise ValueError(msg)
+    unknown = set(subscriber) - set(SUBSCRIBER_URIS)
+    if unknown:
+        msg = f"Unknown subscriber keys: {', '.join(sorted(unknown))}"
+        raise ValueError(msg)
+    for name, uri in subscriber.items():
+        parsed = urlparse(uri) if isinstance(uri, str) else None
+        if (
+            parsed is None
+            or parsed.scheme not in {"http", "https"}
+            or not parsed.hostname
+        ):
+            msg = f"{name} has to be a http(s) URI"
+            raise ValueError(msg)
+        if not host_allowed(parsed.hostname):
+            msg = f"Callbacks to {parsed.hostname} are not allowed"
+            raise ValueError(msg)
+    return dict(subscriber)
+
+
+def _retry(uri: str, payload, attempt: int, reason: str) -> bool:
+    """Schedule the next attempt of a callback; False if it is given up."""
+    if attempt >= CALLBACKS.max_attempts:
+        log.error(f"Callback to {uri} failed {attempt} times: {reason}")
+        return False
+    delay = min(
+        CALLBACKS.retry_delay * 2 ** (attempt - 1),
+        CALLBACKS.max_retry_delay,
+    )
+    log.debug(f"Callback to {uri} failed ({reason}), retry in {delay}s")
+    timer = threading.Timer(
+        delay,
+        _EXECUTOR.submit,
+        (_send, uri, payload, attempt + 1),
+    )
+    timer.daemon = True
+    timer.start()
+    return True
+
+
+def _attempt(uri: str, payload, attempt: int) -> bool:
+    """Send one attempt of a callback; return True if it is retried.
+
+    A callable `payload` is called to create the payload on each attempt.
+    Connection errors, 429 and 5xx responses are retried, invalid payloads
+    are not. The host is checked again, as its addresses can change after
+    `parse_subscriber`.
+    """
+    if not host_allowed(urlparse(uri).hostname):
+        log.error(f"Callback to {uri} dropped: host is not allowed")
+        return False
+    try:
+        body = payload() if callable(payload) else payload
+    except requests.RequestException as e:
+        return _retry(uri, payload, attempt, str(e))
+    except (IndexError, KeyError, TypeError, ValueError) as e:
+        log.error(f"Callback to {uri} dropped: invalid payload: {e}")
+        return False
+    try:
+        # redirects could lead to hosts which are not allowed
+        resp = requests.post(
+            uri,
+            json=body,
+            timeout=CALLBACKS.timeout,
+            allow_redirects=False,
+        )
+    except requests.RequestException as e:
+        return _retry(uri, payload, attempt, str(e))
+    except (TypeError, ValueError) as e:
+        log.error(f"Callback to {uri} dropped: invalid payload: {e}")
+        return False
+    if resp.status_code == 429 or resp.status_code >= 500:
+        return _retry(uri, payload, attempt, f"status {resp.status_code}")
+    if resp.status_code >= 300:
+        log.error(f"Callback to {uri} rejected: {resp.status_code}")
+    return False
+
+
+def _send(uri: str, payload, attempt: int = 1) -> None:
+    """Send one attempt of a callback (runs in the worker pool).
+
+    The pending slot of the callback is released once no further attempt
+    follows, also after unexpected errors.
+    """
+    retried = False
+    try:
+        retried = _attempt(uri, payload, attempt)
+    finally:
+        if not retried:
+            _PENDING.release()
+
+
+def dispatch(uri: str, payload) -> bool:
+    """Send a callback in the background.
+
+    Returns False if the callback was dropped because
+    `CALLBACKS.max_pending` callbacks are pending already.
+    """
+    if not _PENDING.acquire(blocking=False):
+        log.error(f"Too many pending callbacks, dropped callback to {uri}")
+        return False
+    _EXECUTOR.submit(_send, uri, payload)
+    return True
+
+
+def _results_document(job_id: str, auth, status_info: dict) -> dict:
+    """Return the results of a job as for resultResponse=document."""
+    results = get_results(get_actinia_job(job_id, auth=auth))[0]
+    for link in status_info.get("links") or ():
+        if link.get("rel") == "convertedfrom":
+            results["log"] = link["href"]
+    return results
+
+
+class CallbackSubscriber:
+    """Subscriber of a job watcher which sends the callbacks of a job.
+
+    `inProgressUri` receives the statusInfo on every change of status or
+    progress while the job is accepted or running, `successUri` the results
+    document and `failedUri` the statusInfo of a failed or dismissed job.
+    """
+
+    def __init__(self, uris: dict, key: tuple, factory, auth) -> None:
+        """Initialise with the URIs and the watcher of the job."""
+        self.uris = uris
+        self.key = key
+        self.factory = factory
+        self.auth = auth
+        self.status_info = None
+        self.finished = False
+        self._last_progress = None
+        # subsequent attempts to watch the job while actinia is unavailable
+        self._attempts = 0
+
+    def put(self, event) -> None:
+        """Handle an event of the job watcher."""
+        if not isinstance(event, tuple):
+            return
+        name, data = event
+        if name == "status":
+            self._attempts = 0
+            # later events only contain the changed members
+            self.status_info = {**(self.status_info or {}), **data}
+            self._on_status(dict(self.status_info))
+        elif name == "error" and data["status"] == 503 and not self.finished:
+            self._attempts += 1
+            if self._attempts >= CALLBACKS.max_attempts:
+                log.error(
+                    f"Callbacks of job {data.get('jobID')} stopped: actinia "
+                    f"not available {self._attempts} times",
+                )
+                return
+            # actinia is not reachable: watch the job again later
+            timer = threading.Timer(
+                JOBSTATUS.wait_max_interval,
+                subscribe,
+                (self.key, self.factory, self),
+            )
+            timer.daemon = True
+            timer.start()
+        elif name == "error":
+            log.error(
+                f"Callbacks of job {data.get('jobID')} stopped: "
+                f"{data['message']}",
+            )
+
+    def _on_status(self, status_info: dict) -> None:
+        """Send the callback for a new statusInfo."""
+        status = status_info["status"]
+        if self.finished:
+            return
+        if status in IN_PROGRESS_STATES:
+            progress = (status, status_info.get("progress"))
+            uri = self.uris.get("inProgressUri")
+            if uri and progress != self._last_progress:
+                self._last_progress = progress
+                dispatch(uri, status_info)
+            return
+        self.finished = True
+        if status == "successful":
+            job_id = status_info["jobID"]
+            dispatch(
+                self.uris["successUri"],
+                lambda: _results_document(job_id, self.auth, status_info),
+            )
+        elif self.uris.get("failedUri"):
+            dispatch(self.uris["failedUri"], status_info)
+
+
+def register_callbacks(job_id: str, uris: dict) -> None:
+    """Watch a job of the current user and send its callbacks."""
+    key, factory = job_watcher(job_id)
+    subscriber = CallbackSubscriber(uris, key, factory, request.authorization)
+    subscribe(key, factory, subscriber)
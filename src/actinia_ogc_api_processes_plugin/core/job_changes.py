@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Core helper to return only jobs which changed since a client's last request.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+import base64
+import json
+import threading
+import uuid
+from datetime import datetime, timezone
+
+from actinia_ogc_api_processes_plugin.core.actinia_common import JobRecord
+from actinia_ogc_api_processes_plugin.core.cache import LRUCache
+from actinia_ogc_api_processes_plugin.resources.config import JOBLIST
+
+# Sequence numbers are only meaningful within one worker process. Tokens of
+# other workers (or from before a restart) fall back to the cursor
+# (`updated` timestamp and job id) contained in the token.
+INSTANCE_ID = uuid.uuid4().hex[:12]
+
+# change feeds per user
+_FEEDS = LRUCache(1000)
+_FEEDS_LOCK = threading.Lock()
+
+
+def parse_updated_since(value: str) -> float:
+    """Parse the `updatedSince` query parameter into epoch seconds.
+
+    Accepts a RFC 3339 date-time (naive values are UTC) or epoch seconds.
+    Raises ValueError for invalid values.
+    """
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    v = value.replace("Z", "+00:00") if value.endswith("Z") else value
+    dt = datetime.fromisoformat(v)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def encode_sync_token(
+    seq: int | None,
+    high_water: float | None,
+    job_id: str | None = None,
+) -> str:
+    """Return an opaque sync token for the given feed position.
+
+    `high_water` and `job_id` are the cursor for other workers: changes
+    with a later `updated` timestamp (or the same timestamp and a greater
+    job id) are returned next.
+    """
+    data = {"i": INSTANCE_ID, "s": seq, "t": high_water}
+    if job_id is not None:
+        data["j"] = job_id
+    raw = json.dumps(data)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_sync_token(token: str) -> dict:
+    """Decode a sync token. Raises ValueError for invalid tokens."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        data = json.loads(raw)
+        seq = data["s"]
+        if seq is not None:
+            seq = int(seq)
+        high_water = data.get("t")
+        if high_water is not None:
+            high_water = float(high_water)
+        job_id = data.get("j")
+        if job_id is not None:
+            job_id = str(job_id)
+        instance = str(data["i"])
+    except (TypeError, ValueError, KeyError) as e:
+        msg = "Invalid sync token"
+        raise ValueError(msg) from e
+    return {
+        "instance": instance,
+        "seq": seq,
+        "high_water": high_water,
+        "job_id": job_id,
+    }
+
+
+class JobChangeFeed:
+    """Record of the last seen state of the jobs of one user.
+
+    Every observed change of the `updated` timestamp or status of a job is
+    assigned the next sequence number of the user. A sync token marks the
+    sequence number (and the high-water mark of `updated`) up to which a
+    client has seen the changes.
+
+    The states of at most `JOBLIST.max_scan` jobs are kept. A job whose
+    state was dropped gets a new sequence number when it is seen again, so
+    it is returned once more instead of being skipped.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty feed."""
+        self.seq = 0
+        # job_id -> ((updated, status), sequence number)
+        self._last_seen = LRUCache(JOBLIST.max_scan)
+        self._lock = threading.Lock()
+
+    def observe(self, record: JobRecord) -> int:
+        """Record the state of a job and return its sequence number."""
+        state = (record.updated, record.status)
+        with self._lock:
+            seen = self._last_seen.get(record.job_id)
+            if seen is not None and seen[0] == state:
+                return seen[1]
+            self.seq += 1
+            self._last_seen.set(record.job_id, (state, self.seq))
+            return self.seq
+
+    def sequence(self, job_id: str) -> int:
+        """Return the sequence number of the last change of a job."""
+        seen = self._last_seen.get(job_id)
+        return seen[1] if seen else 0
+
+    def changes_since(
+        self,
+        token: str | None = None,
+        updated_since: float | None = None,
+    ):
+        """Return a ChangeFilter for jobs changed since token/timestamp.
+
+        Raises ValueError for invalid tokens.
+        """
+        since_seq = None
+        since_job_id = None
+        if token:
+            decoded = decode_sync_token(token)
+            if (
+                decoded["instance"] == INSTANCE_ID
+                and decoded["seq"] is not None
+                and decoded["seq"] <= self.seq
+            ):
+                since_seq = decoded["seq"]
+            if decoded["high_water"] is not None and (
+                updated_since is None or decoded["high_water"] >= updated_since
+            ):
+                updated_since = decoded["high_water"]
+                since_job_id = decoded["job_id"]
+        return ChangeFilter(self, since_seq, updated_since, since_job_id)
+
+
+class ChangeFilter:
+    """Record filter passing only jobs changed since a feed position.
+
+    Observes every record it is called with, so the feed is kept up to date
+    with the jobs seen in a job list request. Without a sequence number the
+    changes after the cursor (`updated_since`, `since_job_id`) pass.
+    """
+
+    def __init__(
+        self,
+        feed: JobChangeFeed,
+        since_seq: int | None = None,
+        updated_since: float | None = None,
+        since_job_id: str | None = None,
+    ) -> None:
+        """Initialise."""
+        self.feed = feed
+        self.since_seq = since_seq
+        self.updated_since = updated_since
+        self.since_job_id = since_job_id
+        self.max_seq = since_seq or 0
+        # job_id -> sequence number of the jobs which passed
+        self._seqs = {}
+        # high-water mark of `updated` of the jobs seen by this filter
+        self.high_water = updated_since
+
+    @property
+    def by_cursor(self) -> bool:
+        """Return True if changes are selected by the cursor."""
+        return self.since_seq is None and self.updated_since is not None
+
+    def __call__(self, record: JobRecord) -> bool:
+        """Return True if the job changed since the feed position."""
+        seq = self.feed.observe(record)
+        self.max_seq = max(self.max_seq, seq)
+        if record.updated is not None and (
+            self.high_water is None or record.updated > self.high_water
+        ):
+            self.high_water = record.updated
+        if self._changed(record, seq):
+            self._seqs[record.job_id] = seq
+            return True
+        return False
+
+    def _changed(self, record: JobRecord, seq: int) -> bool:
+        """Return True if the job changed since the feed position."""
+        if self.since_seq is not None:
+            return seq > self.since_seq
+        if self.updated_since is not None:
+            if record.updated is None:
+                return False
+            if self.since_job_id is None:
+                return record.updated > self.updated_since
+            return (record.updated, record.job_id) > (
+                self.updated_since,
+                self.since_job_id,
+            )
+        return True
+
+    def sort_key(self, record: JobRecord):
+        """Order changes by sequence number or by (updated, job id).
+
+        Changes selected by the cursor are ordered like the cursor.
+        """
+        if self.by_cursor:
+            return (record.updated, record.job_id)
+        return self._seqs[record.job_id]
+
+    def next_token(self, records: list, limit: int) -> str:
+        """Return the sync token for the next request after `records`.
+
+        If the change list was cut by `limit`, the token only moves to the
+        last returned change, so the remaining ones are returned next time.
+        Changes ordered by sequence number keep the previous cursor for
+        other workers, which return some changes again instead of skipping
+        any. Otherwise the token points to the last change seen by this
+        filter.
+        """
+        if records and len(records) >= limit:
+            last = records[-1]
+            if self.by_cursor:
+                return encode_sync_token(None, last.updated, last.job_id)
+            return encode_sync_token(
+                max(map(self.sort_key, records)),
+                self.updated_since,
+                self.since_job_id,
+            )
+        return encode_sync_token(self.max_seq, self.high_water)
+
+
+def get_change_feed(user: str) -> JobChangeFeed:
+    """Return the change feed of a user."""
+    with _FEEDS_LOCK:
+        feed = _FEEDS.get(user)
+        if feed is None:
+            feed = JobChangeFeed()
+            _FEEDS.set(user, feed)
+    return feed
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Core helper to dismiss several jobs at once.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from flask import request
+
+from actinia_ogc_api_processes_plugin.core.actinia_common import (
+    map_status_reverse,
+)
+from actinia_ogc_api_processes_plugin.core.job_batch import map_jobs
+from actinia_ogc_api_processes_plugin.core.job_cache import (
+    invalidate_terminal_job,
+)
+from actinia_ogc_api_processes_plugin.core.job_list import (
+    collect_actinia_jobs,
+)
+from actinia_ogc_api_processes_plugin.core.job_status_info import (
+    cancel_actinia_job,
+    get_actinia_job,
+    status_info_from_response,
+)
+from actinia_ogc_api_processes_plugin.core.process_execution import (
+    generate_new_joblinks,
+)
+from actinia_ogc_api_processes_plugin.resources.config import JOBLIST
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+# jobs which are matched by a filter without `status`
+CANCELLABLE_STATES = ["accepted", "running"]
+
+
+def find_jobs_to_dismiss(
+    status: list | None = None,
+    process_ids: list | None = None,
+    datetime_param: str | None = None,
+):
+    """Return a tuple (resp, job_ids) of the jobs matching a filter.
+
+    Without `status` only accepted and running jobs are matched. At most
+    `JOBLIST.dismiss_max_jobs` jobs are returned; `job_ids` is None when
+    actinia did not answer with 200.
+    """
+    status = status or CANCELLABLE_STATES
+    actinia_type = None
+    if len(status) == 1:
+        actinia_type = map_status_reverse(status[0])
+    resp, records, _partial = collect_actinia_jobs(
+        actinia_type,
+        JOBLIST.dismiss_max_jobs,
+        process_ids=process_ids,
+        status=status,
+        datetime_param=datetime_param,
+    )
+    if records is None:
+        return resp, None
+    return resp, [record.job_id for record in records]
+
+
+def _dismiss_job(job_id: str, auth, with_status_info: bool) -> tuple:
+    """Cancel a job and optionally fetch its statusInfo (runs in a thread).
+
+    Returns a tuple (cancel response, status response or None).
+    """
+    resp = cancel_actinia_job(job_id, auth=auth)
+    status_resp = None
+    if with_status_info and resp.status_code == 200:
+        status_resp = get_actinia_job(job_id, auth=auth)
+    return resp, status_resp
+
+
+def dismiss_jobs(job_ids: list, with_status_info: bool = False) -> dict:
+    """Cancel the given jobs concurrently.
+
+    At most `JOBLIST.dismiss_concurrency` requests are sent to actinia at
+    the same time. The statusInfo of each cancelled job is only requested
+    from actinia if `with_status_info` is set, otherwise a `dismissed`
+    statusInfo is returned.
+
+    Returns a dict with the statusInfo of the cancelled jobs (`jobs`), the
+    jobs which could not be cancelled (`errors`) and `unauthorized` if
+    actinia rejected the credentials.
+    """
+    auth = request.authorization
+    job_ids = list(dict.fromkeys(job_ids))
+    for job_id in job_ids:
+        invalidate_terminal_job(job_id)
+    results = map_jobs(
+        lambda job_id: _dismiss_job(job_id, auth, with_status_info),
+        job_ids,
+        JOBLIST.dismiss_concurrency,
+    )
+
+    jobs = []
+    errors = []
+    unauthorized = False
+    for job_id, (result, error) in zip(job_ids, results):
+        if error is not None:
+            log.error(f"Connection ERROR while dismissing {job_id}: {error}")
+            errors.append(
+                {
+                    "jobID": job_id,
+                    "status": 503,
+                    "message": f"Connection ERROR: {error}",
+                },
+            )
+            continue
+        resp, status_resp = result
+        if resp.status_code == 401:
+            unauthorized = True
+            errors.append(
+                {
+                    "jobID": job_id,
+                    "status": 401,
+                    "message": "ERROR: Unauthorized Access",
+                },
+            )
+            continue
+        if resp.status_code in {400, 404}:
+            errors.append(
+                {"jobID": job_id, "status": 404, "message": "No such job"},
+            )
+            continue
+        if resp.status_code != 200:
+            log.debug(f"actinia response for {job_id}: {resp.text}")
+            errors.append(
+                {
+                    "jobID": job_id,
+                    "status": 500,
+                    "message": "ERROR: Internal Server Error",
+                },
+            )
+            continue
+
+        links = generate_new_joblinks(job_id)
+        status_info = None
+        if status_resp is not None:
+            _status, status_info = status_info_from_response(
+                job_id,
+                status_resp,
+                links,
+            )
+        if status_info is None:
+            status_info = {
+                "jobID": job_id,
+                "status": "dismissed",
+                "type": "process",
+                "message": "Job cancelled",
+                "links": links,
+            }
+        jobs.append(status_info)
+
+    return {"jobs": jobs, "errors": errors, "unauthorized": unauthorized}
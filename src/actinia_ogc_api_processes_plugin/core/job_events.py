@@ -0,0 +1,534 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Server-sent events with the status changes of jobs.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+import json
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+import requests
+from flask import request
+
+from actinia_ogc_api_processes_plugin.authentication import credentials_key
+from actinia_ogc_api_processes_plugin.core.job_list import (
+    COMPLETED_STATES,
+    get_actinia_jobs,
+    iter_job_records,
+    read_resource_list,
+)
+from actinia_ogc_api_processes_plugin.core.job_progress import (
+    record_progress,
+)
+from actinia_ogc_api_processes_plugin.core.job_status_info import (
+    get_actinia_job,
+    get_job_status_info,
+    last_known_status_info,
+    status_info_from_response,
+)
+from actinia_ogc_api_processes_plugin.resources.config import (
+    JOBLIST,
+    JOBSTATUS,
+)
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+# running watchers keyed by (credentials key, job id or None for the user)
+_WATCHERS = {}
+# protects `_WATCHERS` and the subscribers of all watchers
+_LOCK = threading.Lock()
+
+# marks the end of the events of a watcher in the subscriber queues
+_END = object()
+
+# requests of this worker waiting for changes, each of them holds a thread
+_WAITING = set()
+
+# members of a statusInfo whose change ends a wait (?wait=)
+CHANGE_MEMBERS = ("status", "message", "progress", "updated")
+
+
+def job_links(base: str, job_id: str) -> list:
+    """Return the links of the statusInfo of a job below `base`/jobs."""
+    href = f"{base}/jobs/{job_id}"
+    return [
+        {"href": href, "rel": "self"},
+        {
+            "href": f"{href}/results",
+            "rel": "http://www.opengis.net/def/rel/ogc/1.0/results",
+        },
+    ]
+
+
+def _delta(old: dict | None, new: dict) -> dict:
+    """Return the members of `new` which differ from `old` (incl. jobID)."""
+    if old is None:
+        return new
+    delta = {k: v for k, v in new.items() if old.get(k) != v}
+    if delta:
+        delta = {"jobID": new["jobID"], **delta}
+    return delta
+
+
+def _error(status: int, message: str, job_id: str | None = None) -> tuple:
+    """Return an error event."""
+    data = {"status": status, "message": message}
+    if job_id is not None:
+        data["jobID"] = job_id
+    return "error", data
+
+
+def error_from_response(resp, job_id: str | None = None) -> tuple:
+    """Return an error event for a non-200 actinia response."""
+    if resp.status_code == 401:
+        return _error(401, "ERROR: Unauthorized Access", job_id)
+    if resp.status_code in {400, 404}:
+        return _error(404, "No such job", job_id)
+    log.debug(f"actinia response: {getattr(resp, 'text', '')}")
+    return _error(500, "ERROR: Internal Server Error", job_id)
+
+
+class Watcher(ABC):
+    """Polls actinia in a background thread and fans out the changes.
+
+    There is one watcher per watched resource and credentials, shared by
+    all of its subscribers. Subclasses implement `poll`, which returns a
+    list of (event, data) tuples and sets `done` once nothing changes
+    anymore, and `snapshot`, the events sent to new subscribers. The thread
+    stops when `done` is set or the last subscriber left.
+    """
+
+    min_interval = None
+    max_interval = None
+
+    def __init__(self, key: tuple, auth) -> None:
+        """Initialise with the credentials used for polling."""
+        self.key = key
+        self.auth = auth
+        self.done = False
+        # connection error which ended the watcher
+        self.exception = None
+        self._subscribers = set()
+        self._thread = None
+
+    @abstractmethod
+    def poll(self) -> list:
+        """Request actinia and return the events since the last poll."""
+
+    @abstractmethod
+    def snapshot(self) -> list:
+        """Return the events describing the current state."""
+
+    def _publish(self, events: list) -> None:
+        """Put the events into the queues of all subscribers."""
+        with _LOCK:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            for event in events:
+                subscriber.put(event)
+
+    def _poll(self) -> list:
+        """Call `poll`; connection errors and invalid responses end it."""
+        try:
+            return self.poll()
+        except requests.RequestException as e:
+            log.error(f"Connection ERROR while watching jobs: {e}")
+            self.done = True
+            self.exception = e
+            return [_error(503, f"Connection ERROR: {e}")]
+        except (KeyError, TypeError, ValueError) as e:
+            log.error(f"Invalid actinia response while watching jobs: {e}")
+            self.done = True
+            return [_error(500, "ERROR: Internal Server Error")]
+
+    def next_interval(self, interval: float, events: list) -> float:
+        """Return the seconds until the next poll.
+
+        Polls quickly again after a change and doubles the previous
+        `interval` otherwise.
+        """
+        if events:
+            return self.min_interval
+        return min(2 * interval, self.max_interval)
+
+    def _run(self) -> None:
+        """Poll until done or unobserved (runs in the watcher thread)."""
+        interval = self.min_interval
+        while True:
+            events = self._poll()
+            if self.done:
+                events.append(_END)
+            self._publish(events)
+            with _LOCK:
+                if self.done or not self._subscribers:
+                    if _WATCHERS.get(self.key) is self:
+                        del _WATCHERS[self.key]
+                    return
+            interval = self.next_interval(interval, events)
+            time.sleep(interval)
+
+    def _subscribe(self, subscriber):
+        """Add a subscriber and start polling (lock is held by the caller).
+
+        Subscribers are objects with a `put` method like `queue.Queue`.
+        """
+        for event in self.snapshot():
+            subscriber.put(event)
+        if self.done:
+            # the thread is about to stop and publishes nothing anymore
+            subscriber.put(_END)
+            return subscriber
+        self._subscribers.add(subscriber)
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"watcher-{self.key[1] or 'jobs'}",
+                daemon=True,
+            )
+            self._thread.start()
+        return subscriber
+
+    def unsubscribe(self, subscriber) -> None:
+        """Remove a subscriber; the watcher stops if it was the last one."""
+        with _LOCK:
+            self._subscribers.discard(subscriber)
+
+
+class JobWatcher(Watcher):
+    """Watches the statusInfo of one job.
+
+    The first event is the complete statusInfo, later `status` events only
+    contain the changed members (and `jobID`). A `done` event is sent when
+    the job reached a final state.
+    """
+
+    def __init__(self, key: tuple, auth, job_id: str, links: list) -> None:
+        """Initialise."""
+        super().__init__(key, auth)
+        self.min_interval = JOBSTATUS.wait_min_interval
+        self.max_interval = JOBSTATUS.wait_max_interval
+        self.job_id = job_id
+        self.links = links
+        self.status_info = None
+
+    def poll(self) -> list:
+        """Request the job from actinia."""
+        resp = get_actinia_job(self.job_id, auth=self.auth)
+        status_code, status_info = status_info_from_response(
+            self.job_id,
+            resp,
+            self.links,
+        )
+        if status_code != 200:
+            self.done = True
+            return [error_from_response(resp, self.job_id)]
+        record_progress(self.key, status_info)
+        delta = _delta(self.status_info, status_info)
+        self.status_info = status_info
+        events = [("status", delta)] if delta else []
+        if status_info["status"] in COMPLETED_STATES:
+            self.done = True
+            events.append(("done", {"jobID": self.job_id}))
+        return events
+
+    def next_interval(self, interval: float, events: list) -> float:
+        """Return the seconds until the next poll based on the job.
+
+        Jobs which are running for a long time change less often and are
+        polled less often (`JOBSTATUS.poll_age_factor` times their age),
+        but not later than their end estimated from the progress. Without
+        a change the interval is doubled up to `max_interval`.
+        """
+        base = self.min_interval
+        info = self.status_info or {}
+        started = info.get("started") or info.get("created")
+        if started:
+            age = time.time() - datetime.fromisoformat(started).timestamp()
+            base = age * JOBSTATUS.poll_age_factor
+            progress = info.get("progress")
+            if progress and 0 < progress < 100:
+                base = min(base, age * (100 - progress) / progress)
+        base = min(max(base, self.min_interval), self.max_interval)
+        if events:
+            return base
+        return min(max(2 * interval, base), self.max_interval)
+
+    def snapshot(self) -> list:
+        """Return the complete statusInfo if it is known already."""
+        if self.status_info is None:
+            return []
+        events = [("status", self.status_info)]
+        if self.done:
+            events.append(("done", {"jobID": self.job_id}))
+        return events
+
+
+class UserJobsWatcher(Watcher):
+    """Watches all jobs of a user with one job list request per interval.
+
+    New subscribers receive the statusInfo of all jobs which are not in a
+    final state followed by a `ready` event. Afterwards a `status` event is
+    sent for every new job and with the changed members of every changed
+    job.
+    """
+
+    def __init__(self, key: tuple, auth, base: str) -> None:
+        """Initialise."""
+        super().__init__(key, auth)
+        self.min_interval = JOBSTATUS.events_list_interval
+        self.max_interval = max(
+            JOBSTATUS.events_list_interval,
+            JOBSTATUS.wait_max_interval,
+        )
+        self.base = base
+        # job id -> members of the JobRecord compared between polls
+        self.states = None
+        # job id -> statusInfo of the jobs which are not final yet
+        self.active = {}
+
+    def poll(self) -> list:
+        """Request the job list from actinia."""
+        resp = get_actinia_jobs(limit=JOBLIST.max_scan, auth=self.auth)
+        if resp.status_code != 200:
+            self.done = True
+            return [error_from_response(resp)]
+        states = {}
+        active = {}
+        events = []
+        for record in iter_job_records(read_resource_list(resp)):
+            job_id = record.job_id
+            state = (record.status, record.progress, record.updated)
+            states[job_id] = state
+            changed = self.states is None or self.states.get(job_id) != state
+            final = record.status in COMPLETED_STATES
+            if not changed and final:
+                continue
+            # statusInfo is only created for new, changed or active jobs
+            status_info = self.active.get(job_id)
+            if changed or status_info is None:
+                status_info = record.to_status_info(
+                    links=job_links(self.base, job_id),
+                )
+            if not final:
+                active[job_id] = status_info
+            if changed and self.states is not None:
+                delta = _delta(self.active.get(job_id), status_info)
+                if delta:
+                    events.append(("status", delta))
+        first = self.states is None
+        self.states = states
+        self.active = active
+        return self.snapshot() if first else events
+
+    def snapshot(self) -> list:
+        """Return the statusInfo of all jobs which are not final yet."""
+        if self.states is None:
+            return []
+        events = [("status", info) for info in self.active.values()]
+        events.append(("ready", {"numberOfJobs": len(self.states)}))
+        return events
+
+
+def subscribe(key: tuple, factory, subscriber=None) -> tuple:
+    """Subscribe to the watcher of `key`, creating it with `factory`.
+
+    `subscriber` defaults to a new `queue.Queue`. Returns a tuple
+    (watcher, subscriber).
+    """
+    if subscriber is None:
+        subscriber = queue.Queue()
+    with _LOCK:
+        watcher = _WATCHERS.get(key)
+        if watcher is None:
+            watcher = factory()
+            _WATCHERS[key] = watcher
+        return watcher, watcher._subscribe(subscriber)
+
+
+def start_waiting(waiter) -> bool:
+    """Register a request waiting for changes.
+
+    Returns False if `JOBSTATUS.max_streams` requests of this worker are
+    waiting already. `waiter` is removed again with `stop_waiting`.
+    """
+    with _LOCK:
+        if len(_WAITING) >= JOBSTATUS.max_streams:
+            return False
+        _WAITING.add(waiter)
+        return True
+
+
+def stop_waiting(waiter) -> None:
+    """Remove a request registered with `start_waiting`."""
+    with _LOCK:
+        _WAITING.discard(waiter)
+
+
+def format_event(event: str, data) -> str:
+    """Return a server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class EventStream:
+    """Iterable of the server-sent events of one subscriber.
+
+    `first` is the first event, which is awaited on creation so that
+    errors can still be answered with an HTTP error status, also a 503
+    error if too many requests wait already (see `start_waiting`). The
+    stream ends after the last event of the watcher or after
+    `JOBSTATUS.events_max_duration` seconds; clients reconnect then.
+    """
+
+    def __init__(self, key: tuple, factory) -> None:
+        """Subscribe to the watcher of `key` and wait for the first event."""
+        self._watcher = None
+        self._deadline = time.monotonic() + JOBSTATUS.events_max_duration
+        if not start_waiting(self):
+            self.first = _error(503, "ERROR: Too many event streams")
+            return
+        self._watcher, self._queue = subscribe(key, factory)
+        self.first = self._queue.get()
+
+    @property
+    def error(self) -> dict | None:
+        """Return the data of the first event if it is an error."""
+        if self.first is not _END and self.first[0] == "error":
+            return self.first[1]
+        return None
+
+    def transform(self, event: tuple) -> tuple:
+        """Return an event as it is sent to this subscriber."""
+        return event
+
+    def close(self) -> None:
+        """Unsubscribe from the watcher; can be called more than once."""
+        stop_waiting(self)
+        if self._watcher is not None:
+            self._watcher.unsubscribe(self._queue)
+
+    def __iter__(self):
+        """Yield the formatted events and keep-alive comments."""
+        try:
+            # clients reconnect after `retry` milliseconds
+            yield f"retry: {JOBSTATUS.events_retry * 1000}\n\n"
+            heartbeat = JOBSTATUS.events_heartbeat
+            event = self.first
+            while event is not _END:
+                if event is not None:
+                    yield format_event(*self.transform(event))
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    event = self._queue.get(timeout=min(heartbeat, remaining))
+                except queue.Empty:
+                    # writing to a closed connection ends the stream
+                    event = None
+                    yield ": keep-alive\n\n"
+        finally:
+            self.close()
+
+
+def job_watcher(job_id: str) -> tuple:
+    """Return (key, factory) of the watcher of a job of the current user."""
+    key = (credentials_key(), job_id)
+    links = job_links(request.url_root.rstrip("/"), job_id)
+    auth = request.authorization
+    return key, lambda: JobWatcher(key, auth, job_id, links)
+
+
+def _change_view(status_info: dict) -> dict:
+    """Return the members of a statusInfo which make up a change."""
+    return {name: status_info.get(name) for name in CHANGE_MEMBERS}
+
+
+def _wait_for_change(job_id: str, deadline: float) -> tuple:
+    """Wait for a change of the statusInfo of a job until `deadline`.
+
+    The statusInfo returned last to the current user is the state the
+    client knows; if the job changed since, it is returned right away.
+    Without any statusInfo until `deadline`, 504 is returned.
+    """
+    last_known = last_known_status_info(job_id)
+    seen = None if last_known is None else _change_view(last_known[0])
+    watcher, subscriber = subscribe(*job_watcher(job_id))
+    try:
+        status_info = None
+        while True:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                event = subscriber.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if event is _END or event[0] == "done":
+                break
+            name, data = event
+            if name == "error":
+                if data["status"] == 503 and watcher.exception is not None:
+                    raise watcher.exception
+                return data["status"], None, None
+            if status_info is not None:
+                # later events only contain the changed members
+                changed = {**status_info, **data}
+                if changed != status_info:
+                    return 200, changed, None
+                continue
+            status_info = data
+            if status_info["status"] in COMPLETED_STATES:
+                break
+            if seen is not None and _change_view(status_info) != seen:
+                # changed since the previous request of the client
+                break
+        if status_info is None:
+            log.error(f"No status of job {job_id} within the wait time")
+            return 504, None, None
+        return 200, status_info, None
+    finally:
+        watcher.unsubscribe(subscriber)
+
+
+def wait_for_job_status_info(job_id: str, wait: float) -> tuple:
+    """Return a tuple (status_code, status_info_dict_or_None, response).
+
+    Waits until the statusInfo of a job of the current user changes or
+    `wait` seconds passed. All requests waiting for the same job share one
+    `JobWatcher`, so actinia is polled once per interval no matter how many
+    clients wait. Errors and jobs in a final state are returned right away;
+    connection errors are raised. `response` is None unless too many
+    requests wait already (see `start_waiting`): then the statusInfo is
+    requested from actinia without waiting.
+    """
+    deadline = time.monotonic() + wait
+    waiter = object()
+    if not start_waiting(waiter):
+        log.warning(f"Too many waiting requests, not waiting for {job_id}")
+        return get_job_status_info(job_id)
+    try:
+        return _wait_for_change(job_id, deadline)
+    finally:
+        stop_waiting(waiter)
+
+
+def job_event_stream(job_id: str) -> EventStream:
+    """Return the event stream of a job of the current user."""
+    return EventStream(*job_watcher(job_id))
+
+
+def user_event_stream() -> EventStream:
+    """Return the event stream of all jobs of the current user."""
+    key = (credentials_key(), None)
+    base = request.url_root.rstrip("/")
+    auth = request.authorization
+    return EventStream(key, lambda: UserJobsWatcher(key, auth, base))
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Indexes over the jobs of a user: the bounding boxes of jobs and a Bloom
+filter of the known job ids.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+import hashlib
+import math
+import threading
+
+from actinia_ogc_api_processes_plugin.core.cache import LRUCache
+
+# known job ids per credentials key
+_KNOWN_JOB_IDS = LRUCache(1000)
+_KNOWN_JOB_IDS_LOCK = threading.Lock()
+
+
+def parse_bbox(value) -> tuple:
+    """Return a (west, south, east, north) tuple of floats.
+
+    `value` is a list or a comma separated string of 4 numbers, or of 6
+    numbers for a 3D box (minx, miny, minz, maxx, maxy, maxz) whose height
+    is ignored. Raises ValueError for invalid boxes.
+    """
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, (list, tuple)) or len(value) not in {4, 6}:
+        msg = "Bounding box needs 4 or 6 numbers"
+        raise ValueError(msg)
+    try:
+        numbers = [float(v) for v in value]
+    except (TypeError, ValueError) as e:
+        msg = "Bounding box needs 4 or 6 numbers"
+        raise ValueError(msg) from e
+    if len(numbers) == 6:
+        numbers = [numbers[0], numbers[1], numbers[3], numbers[4]]
+    west, south, east, north = numbers
+    if not all(math.isfinite(n) for n in numbers):
+        msg = "Bounding box contains non-finite numbers"
+        raise ValueError(msg)
+    if west > east or south > north:
+        msg = "Bounding box minimum is larger than maximum"
+        raise ValueError(msg)
+    return west, south, east, north
+
+
+def bbox_from_process_chain(data: dict) -> tuple | None:
+    """Return the bbox of the region set by a job's process chain or None.
+
+    Jobs executed with a `bounding_box` input set the region with a
+    `g.region` step `g_region_1` with the parameters w, s, e and n (see
+    `core.process_execution`).
+    """
+    pc_lists = data.get("process_chain_list")
+    if not isinstance(pc_lists, list):
+        return None
+    for pc in pc_lists:
+        steps = pc.get("list") if isinstance(pc, dict) else None
+        for step in steps if isinstance(steps, list) else ():
+            if not isinstance(step, dict) or step.get("id") != "g_region_1":
+                continue
+            params = {
+                i.get("param"): i.get("value")
+                for i in step.get("inputs") or ()
+                if isinstance(i, dict)
+            }
+            try:
+                return parse_bbox([params[k] for k in ("w", "s", "e", "n")])
+            except (KeyError, ValueError):
+                return None
+    return None
+
+
+def _intersects(a: tuple, b: tuple) -> bool:
+    """Return True if two boxes intersect or touch."""
+    return a[0] <= b[2] and a[2] >= b[0] and a[1] <= b[3] and a[3] >= b[1]
+
+
+class BBoxFilter:
+    """Record filter passing only jobs whose bbox intersects a bbox."""
+
+    def __init__(self, bbox: tuple) -> None:
+        """Initialise."""
+        self.bbox = bbox
+
+    def __call__(self, record) -> bool:
+        """Return True if the bbox of the job intersects the filter bbox."""
+        return record.bbox is not None and _intersects(record.bbox, self.bbox)
+
+
+class KnownJobIds:
+    """Bloom filter of the ids of the jobs of one user.
+
+    There are no false negatives: an id which was added is always found.
+    Ids which were not added are found with a probability of about
+    `error_rate` as long as no more than `capacity` ids were added. An id
+    which is not found is certainly unknown if the filter was rebuilt from
+    the complete job list (see `rebuilt`) and every new job was added since.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        error_rate: float = 0.01,
+    ) -> None:
+        """Initialise an empty filter."""
+        self.error_rate = error_rate
+        # monotonic time of the last rebuild from the complete job list
+        self.rebuilt = None
+        self.rebuilding = False
+        # ids added while a rebuild is running
+        self._added = set()
+        self._lock = threading.Lock()
+        # (bits, number of bits, number of hashes), replaced as a whole
+        self._filter = self._empty(capacity)
+
+    def _empty(self, capacity: int) -> tuple:
+        """Return (bits, number of bits, number of hashes) for `capacity`."""
+        capacity = max(1, capacity)
+        size = math.ceil(
+            -capacity * math.log(self.error_rate) / math.log(2) ** 2,
+        )
+        hashes = max(1, round(size / capacity * math.log(2)))
+        return bytearray((size + 7) // 8), size, hashes
+
+    @staticmethod
+    def _positions(job_id: str, size: int, hashes: int):
+        """Yield the bit positions of a job id (double hashing)."""
+        digest = hashlib.blake2b(job_id.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        for i in range(hashes):
+            yield (first + i * second) % size
+
+    @classmethod
+    def _add(cls, bloom: tuple, job_id: str) -> None:
+        """Set the bits of a job id in a filter."""
+        bits, size, hashes = bloom
+        for pos in cls._positions(job_id, size, hashes):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, job_id: str) -> bool:
+        """Return False if the job id was certainly not added."""
+        bits, size, hashes = self._filter
+        return all(
+            bits[pos >> 3] & (1 << (pos & 7))
+            for pos in self._positions(job_id, size, hashes)
+        )
+
+    def add(self, job_id: str) -> None:
+        """Add a job id."""
+        with self._lock:
+            self._add(self._filter, job_id)
+            if self.rebuilding:
+                self._added.add(job_id)
+
+    def start_rebuild(self) -> bool:
+        """Mark the start of a rebuild; False if one is running already."""
+        with self._lock:
+            if self.rebuilding:
+                return False
+            self.rebuilding = True
+            self._added = set()
+            return True
+
+    def finish_rebuild(self, job_ids, now: float) -> None:
+        """Replace the filter with `job_ids` (None to cancel the rebuild).
+
+        `job_ids` has to be the complete list of the jobs of the user read
+        after `start_rebuild`; ids added in the meantime are kept.
+        """
+        with self._lock:
+            self.rebuilding = False
+            if job_ids is None:
+                return
+            job_ids = set(job_ids) | self._added
+            self._added = set()
+            # room for new jobs until the next rebuild
+            bloom = self._empty(max(1024, 2 * len(job_ids)))
+            for job_id in job_ids:
+                self._add(bloom, job_id)
+            self._filter = bloom
+            self.rebuilt = now
+
+
+def get_known_job_ids(key: str, error_rate: float = 0.01) -> KnownJobIds:
+    """Return the known job ids stored under a credentials key."""
+    with _KNOWN_JOB_IDS_LOCK:
+        known = _KNOWN_JOB_IDS.get(key)
+        if known is None:
+            known = KnownJobIds(error_rate=error_rate)
+            _KNOWN_JOB_IDS.set(key, known)
+    return known
@@ -11,29 +11,90 @@ __author__ = "Carmen Tawalika"
 __copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 
+import math
 from datetime import datetime, timezone
 
 import requests
-from flask import has_request_context, request
+from flask import current_app, has_request_context, request
 from requests.auth import HTTPBasicAuth
 
+from actinia_ogc_api_processes_plugin.authentication import credentials_key
 from actinia_ogc_api_processes_plugin.core.actinia_common import (
-    safe_parse_actinia_job,
+    TERMINAL_STATES,
+    JobRecord,
+    map_status,
+    parse_actinia_job_id,
+)
+from actinia_ogc_api_processes_plugin.core.actinia_valkey import (
+    read_actinia_jobs,
+)
+from actinia_ogc_api_processes_plugin.core.cache import LRUCache
+from actinia_ogc_api_processes_plugin.core.job_index import (
+    bbox_from_process_chain,
+    get_known_job_ids,
+)
+from actinia_ogc_api_processes_plugin.core.json_stream import iter_json_array
+from actinia_ogc_api_processes_plugin.core.media_types import (
+    alternate_links,
+    format_href,
+)
+from actinia_ogc_api_processes_plugin.core.shared_store import is_shared
+from actinia_ogc_api_processes_plugin.resources.config import (
+    ACTINIA,
+    JOBLIST,
+    JOBSTATUS,
+    VALKEY,
 )
-from actinia_ogc_api_processes_plugin.resources.config import ACTINIA
 from actinia_ogc_api_processes_plugin.resources.logging import log
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# OGC states of jobs for which a duration between started and finished exists
+COMPLETED_STATES = frozenset({"successful", "failed", "dismissed"})
+
+# JobRecords (incl. serialized statusInfo) of jobs in a terminal state, keyed
+# by (user, base url, job id, actinia timestamp)
+TERMINAL_JOBS = LRUCache(JOBLIST.terminal_cache_size)
+
+# fields of actinia resource list items needed for JobRecords; everything
+# else (process chains, logs, ...) is dropped while streaming the list
+JOB_FIELDS = frozenset(
+    {
+        "accept_timestamp",
+        "links",
+        "message",
+        "progress",
+        "resource_id",
+        "start_timestamp",
+        "status",
+        "time_delta",
+        "timestamp",
+        "type",
+    },
+)
+
 
 def get_actinia_jobs(
     actinia_type: str | None = None,
     limit: int | None = None,
+    auth=None,
 ):
     """Retrieve job list from actinia for current user.
 
     Returns the raw requests.Response from actinia so callers can decide how
-    to handle different status codes.
+    to handle different status codes. With `VALKEY.url` the jobs are read
+    from the valkey of actinia if possible. `auth` defaults to the
+    credentials of the current request.
     """
-    auth = request.authorization
+    if auth is None:
+        auth = request.authorization
+    if VALKEY.url:
+        resp = read_actinia_jobs(auth, actinia_type, limit)
+        if resp is not None:
+            return resp
     kwargs = dict()
     if auth:
         kwargs["auth"] = HTTPBasicAuth(auth.username, auth.password)
@@ -46,6 +107,9 @@ def get_actinia_jobs(
         if not params:
             params = {}
         params["num"] = str(limit)
+    if JOBLIST.stream_parse:
+        # the body is parsed incrementally in `read_resource_list`
+        kwargs["stream"] = True
     try:
         if params:
             return requests.get(url, params=params, **kwargs)
@@ -105,32 +169,51 @@ def _get_datetime_interval(datetime_param):
     return datetime_interval
 
 
+def _get_epoch_interval(datetime_interval):
+    """Convert a (start, end) datetime tuple into epoch seconds.
+
+    Naive datetimes are interpreted as UTC. Open bounds stay None.
+    """
+    if not datetime_interval:
+        return None
+
+    def _epoch(dt):
+        if dt is None:
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+
+    start, end = datetime_interval
+    return _epoch(start), _epoch(end)
+
+
 def _matches_filters(
-    status_info,
+    record: JobRecord,
     job_types: list | None,
     process_ids: list | None,
     status: list | None,
 ) -> bool:
-    """Return True when `status_info` passes provided filters."""
+    """Return True when `record` passes provided filters."""
     # apply optional filtering by type (query parameter)
     # Requirement 66: If the parameter is provided and its value is process
     # then only jobs created by an OGC processes API SHALL be included in the
     # response.
     # Additionally, support filtering by other job types as well.
-    if job_types and status_info.get("type") not in job_types:
+    if job_types and record.type not in job_types:
         return False
 
     # apply optional filtering by processIDs (query parameter)
     if process_ids:
-        pid_val = status_info.get("processID")
-        jid_val = status_info.get("jobID")
+        pid_val = record.process_id
+        jid_val = record.job_id
         matched = any(pid in {pid_val, jid_val} for pid in process_ids)
         if not matched:
             return False
     # apply optional filtering by status (query parameter)
     # single status is filtered by actinia request directly
     if status:
-        s_val = status_info.get("status")
+        s_val = record.status
         allowed = {st.lower() for st in status}
         if not s_val or s_val.lower() not in allowed:
             return False
@@ -138,84 +221,55 @@ def _matches_filters(
 
 
 def _matches_datetime_filters(
-    status_info,
-    datetime_interval: tuple | None = None,
+    record: JobRecord,
+    epoch_interval: tuple | None = None,
 ) -> bool:
-    """Return True when `status_info` passes provided filters."""
+    """Return True when `record` passes provided filters."""
     # apply optional filtering by datetime (query parameter)
-    if datetime_interval:
-        # datetime_interval is (start, end) with start/end are datetime or None
-        created_val = status_info.get("created")
-        if not created_val:
-            return False
-        try:
-            # support 'Z' suffix
-            if created_val.endswith("Z"):
-                created_dt = datetime.fromisoformat(
-                    created_val.replace("Z", "+00:00"),
-                )
-            else:
-                created_dt = datetime.fromisoformat(created_val)
-        except (TypeError, ValueError):
+    if epoch_interval:
+        # epoch_interval is (start, end) with start/end are epoch or None
+        if record.created is None:
             return False
+        # compare with second precision as given in statusInfo `created`
+        created = math.floor(record.created)
 
-        start, end = datetime_interval
-        # convert naive datetimes to timezone-aware UTC if needed
-        if start is not None and start.tzinfo is None:
-            start = start.replace(tzinfo=timezone.utc)
-        if end is not None and end.tzinfo is None:
-            end = end.replace(tzinfo=timezone.utc)
-
-        if start and end:
-            if not (start <= created_dt <= end):
-                return False
-        elif start and not end:
-            if not (created_dt >= start):
-                return False
-        elif end and not start and not (created_dt <= end):
+        start, end = epoch_interval
+        if start is not None and created < start:
+            return False
+        if end is not None and created > end:
             return False
     return True
 
 
 def _matches_duration_filters(
-    status_info,
+    record: JobRecord,
     min_duration: int | None = None,
     max_duration: int | None = None,
 ) -> bool:
-    """Return True when `status_info` passes provided duration filters.
+    """Return True when `record` passes provided duration filters.
 
-    When status is "running": Duration is now - created. When status is
-    "successful", "failed", "dismissed": Duration is finished - created.
+    When status is "running": Duration is now - started. When status is
+    "successful", "failed", "dismissed": Duration is finished - started.
     If no min/max provided returns True. If duration cannot be computed
     while filtering is requested, return False.
     """
     if min_duration is None and max_duration is None:
         return True
 
-    def _parse(dt_str):
-        if not dt_str:
-            return None
-        v = dt_str.replace("Z", "+00:00") if dt_str.endswith("Z") else dt_str
-        try:
-            dt = datetime.fromisoformat(v)
-        except (TypeError, ValueError):
-            return None
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
-
-    s = (status_info.get("status") or "").lower()
-    started = _parse(status_info.get("started"))
-    finished = _parse(status_info.get("finished"))
+    # compare with second precision as given in statusInfo
+    s = record.status
+    started = record.started
+    if started is not None:
+        started = math.floor(started)
 
     if s == "running":
-        if not started:
+        if started is None:
             return False
-        dur = (datetime.now(timezone.utc) - started).total_seconds()
-    elif s in {"successful", "failed", "dismissed"}:
-        if not started or not finished:
+        dur = datetime.now(timezone.utc).timestamp() - started
+    elif s in COMPLETED_STATES:
+        if started is None or record.finished is None:
             return False
-        dur = (finished - started).total_seconds()
+        dur = math.floor(record.finished) - started
     else:
         # duration undefined for other states -> exclude when filtering
         return False
@@ -225,76 +279,495 @@ def _matches_duration_filters(
     return not (max_duration is not None and dur > float(max_duration))
 
 
-def parse_actinia_jobs(
-    resp,
-    job_types: list | None = None,
-    process_ids: list | None = None,
-    status: list | None = None,
-    datetime_param: str | None = None,
+def _epoch_array(items, key: str):
+    """Return values of `key` of all items as float array (NaN if invalid)."""
+    values = []
+    for item in items:
+        try:
+            values.append(float(item.get(key)))
+        except (AttributeError, TypeError, ValueError):
+            values.append(np.nan)
+    return np.array(values, dtype=np.float64)
+
+
+def _bulk_time_mask(
+    items,
+    epoch_interval: tuple | None = None,
     min_duration: int | None = None,
     max_duration: int | None = None,
 ):
-    """Map actinia response into a `jobs` list structure.
+    """Return a boolean NumPy mask of items passing time filters.
 
-    Reuses `parse_actinia_job`.
+    Vectorized equivalent of `_matches_datetime_filters` and
+    `_matches_duration_filters` working directly on the actinia items.
+    """
+    mask = np.ones(len(items), dtype=bool)
+    accepted = _epoch_array(items, "accept_timestamp")
+    with np.errstate(invalid="ignore"):
+        if epoch_interval:
+            # compare with second precision as given in statusInfo `created`
+            created = np.floor(accepted)
+            mask &= ~np.isnan(created)
+            start, end = epoch_interval
+            if start is not None:
+                mask &= created >= start
+            if end is not None:
+                mask &= created <= end
+
+        if min_duration is not None or max_duration is not None:
+            running, done, terminal = [], [], []
+            for item in items:
+                raw = item.get("status") if isinstance(item, dict) else None
+                ogc_status = map_status(raw)
+                running.append(ogc_status == "running")
+                done.append(ogc_status in COMPLETED_STATES)
+                terminal.append(
+                    isinstance(raw, str) and raw in TERMINAL_STATES,
+                )
+            running = np.array(running, dtype=bool)
+            done = np.array(done, dtype=bool)
 
-    If `process_ids` is provided, only include jobs matching any of the
-    provided process identifiers (match against `processID` or `jobID`).
+            time_delta = _epoch_array(items, "time_delta")
+            finished = np.where(terminal, accepted + time_delta, np.nan)
+            started = np.floor(_epoch_array(items, "start_timestamp"))
+
+            now = datetime.now(timezone.utc).timestamp()
+            duration = np.full(len(items), np.nan)
+            duration[running] = now - started[running]
+            duration[done] = np.floor(finished[done]) - started[done]
+
+            # duration undefined -> exclude when filtering
+            mask &= ~np.isnan(duration)
+            if min_duration is not None:
+                mask &= duration >= float(min_duration)
+            if max_duration is not None:
+                mask &= duration <= float(max_duration)
+    return mask
+
+
+def _terminal_job_key(job_id: str, data: dict) -> tuple | None:
+    """Return the cache key of a job which does not change anymore.
+
+    Returns None for jobs that can still change or outside of a request.
     """
-    try:
-        items = resp.json()["resource_list"]
-    except (ValueError, TypeError):
-        items = []
+    raw_status = data.get("status")
+    if not isinstance(raw_status, str) or raw_status not in TERMINAL_STATES:
+        return None
+    if not has_request_context() or not request.authorization:
+        return None
+    # links of the serialized statusInfo depend on the requested base url
+    return (
+        request.authorization.username,
+        request.base_url,
+        job_id,
+        str(data.get("timestamp")),
+    )
+
+
+def _get_job_record(job_id: str, data: dict) -> JobRecord:
+    """Return the JobRecord of an actinia item, cached for terminal jobs."""
+    key = _terminal_job_key(job_id, data)
+    if key is None:
+        return JobRecord.from_actinia(job_id, data)
+    record = TERMINAL_JOBS.get(key)
+    if record is None:
+        record = JobRecord.from_actinia(job_id, data)
+        TERMINAL_JOBS.set(key, record)
+    return record
+
+
+def iter_job_records(items):
+    """Yield a JobRecord for every valid actinia resource item."""
+    for item in items:
+        job_id = parse_actinia_job_id(item) if isinstance(item, dict) else None
+        if job_id:
+            yield _get_job_record(job_id, item)
+
+
+def combine_record_filters(*filters):
+    """Return a record filter passing records accepted by all `filters`.
+
+    Filters are called in the given order until one rejects the record.
+    Returns None if no filter is given.
+    """
+    filters = [f for f in filters if f is not None]
+    if len(filters) <= 1:
+        return filters[0] if filters else None
+
+    def record_filter(record) -> bool:
+        return all(f(record) for f in filters)
+
+    return record_filter
 
-    jobs = []
 
+def _filter_actinia_items(
+    items,
+    job_types: list | None = None,
+    process_ids: list | None = None,
+    status: list | None = None,
+    datetime_param: str | None = None,
+    min_duration: int | None = None,
+    max_duration: int | None = None,
+    seen: set | None = None,
+    record_filter=None,
+) -> list:
+    """Parse actinia resource items and return matching JobRecords.
+
+    When a `seen` set is given, items whose job id is already contained are
+    skipped and new job ids are added to it. `record_filter` is an optional
+    callable which is applied to records passing all other filters.
+    """
+    # parse optional datetime parameter into (start,end) epoch seconds
+    epoch_interval = _get_epoch_interval(
+        _get_datetime_interval(datetime_param),
+    )
+
+    time_filters = any(
+        (
+            epoch_interval,
+            min_duration is not None,
+            max_duration is not None,
+        ),
+    )
+    # evaluate time filters vectorized for large lists, so that only the
+    # remaining items need to be parsed
+    bulk = (
+        np is not None
+        and time_filters
+        and items
+        and len(items) >= JOBLIST.bulk_threshold
+    )
+    if bulk:
+        mask = _bulk_time_mask(
+            items,
+            epoch_interval,
+            min_duration,
+            max_duration,
+        )
+        items = [item for item, keep in zip(items, mask) if keep]
+
+    records = []
     for item in items:
-        job_id, status_info = safe_parse_actinia_job(item)
+        job_id = parse_actinia_job_id(item) if isinstance(item, dict) else None
         if not job_id:
             continue
-
-        # Ensure links point to the single job resource (/jobs/{job_id})
-        if job_id not in status_info.get("links"):
-            status_info["links"] = _generate_new_joblinks(job_id)
-
-        # parse optional datetime parameter into (start,end) datetimes
-        datetime_interval = _get_datetime_interval(datetime_param)
+        if seen is not None:
+            if job_id in seen:
+                continue
+            seen.add(job_id)
+        record = _get_job_record(job_id, item)
 
         # apply optional filtering (query parameters)
         if not _matches_filters(
-            status_info,
+            record,
             job_types,
             process_ids,
             status,
         ):
             continue
 
-        if not _matches_datetime_filters(
-            status_info,
-            datetime_interval,
-        ):
+        if not bulk:
+            if not _matches_datetime_filters(
+                record,
+                epoch_interval,
+            ):
+                continue
+
+            if not _matches_duration_filters(
+                record,
+                min_duration,
+                max_duration,
+            ):
+                continue
+
+        if record_filter is not None and not record_filter(record):
             continue
 
-        if not _matches_duration_filters(
-            status_info,
-            min_duration,
-            max_duration,
-        ):
+        records.append(record)
+    return records
+
+
+def _job_list_links() -> list:
+    """Return the links of the job list document."""
+    href = None if has_request_context() else "/jobs"
+    return [
+        {
+            "href": format_href("json", href),
+            "rel": "self",
+            "type": "application/json",
+        },
+        *alternate_links(href),
+    ]
+
+
+def _job_status_info(record: JobRecord, fields=None) -> dict:
+    """Return statusInfo (projected to `fields`) of a job list entry."""
+    if fields is not None and "links" not in fields:
+        return record.to_status_info(fields=fields)
+    # Ensure links point to the single job resource (/jobs/{job_id})
+    return record.to_status_info(
+        links=_generate_new_joblinks(record.job_id),
+        fields=fields,
+    )
+
+
+def _job_list_members(
+    partial: bool | None = None,
+    sync_token: str | None = None,
+) -> dict:
+    """Return the members of the job list document besides `jobs`."""
+    members = {"links": _job_list_links()}
+    if partial is not None:
+        members["partial"] = partial
+    if sync_token is not None:
+        members["syncToken"] = sync_token
+    return members
+
+
+def build_job_list(
+    records: list,
+    partial: bool | None = None,
+    sync_token: str | None = None,
+    fields=None,
+) -> dict:
+    """Return the OGC `jobList` structure for the given JobRecords.
+
+    If `fields` is given, the statusInfo of the jobs is projected to them.
+    """
+    return {
+        "jobs": [_job_status_info(record, fields) for record in records],
+        **_job_list_members(partial, sync_token),
+    }
+
+
+def serialize_job_list(
+    records: list,
+    partial: bool | None = None,
+    sync_token: str | None = None,
+    fields=None,
+) -> bytes:
+    """Return the OGC `jobList` of the given JobRecords as JSON bytes.
+
+    Equivalent to `jsonify(build_job_list(...))`, but the
+    serialized statusInfo of jobs in a terminal state is kept on their
+    cached JobRecord and spliced into the document, so only jobs which can
+    still change are serialized again. Projected statusInfo (`fields`) is
+    not cached.
+    """
+
+    def dumps(obj) -> bytes:
+        return current_app.json.dumps(obj, separators=(",", ":")).encode()
+
+    fragments = []
+    for record in records:
+        if fields is not None:
+            fragments.append(dumps(_job_status_info(record, fields)))
             continue
+        fragment = record.fragment
+        if fragment is None:
+            fragment = dumps(_job_status_info(record))
+            if record.status in COMPLETED_STATES:
+                record.fragment = fragment
+        fragments.append(fragment)
+
+    tail = _job_list_members(partial, sync_token)
+    # splice `"jobs":[...]` in front of the remaining members of the object
+    return b"".join(
+        (
+            b'{"jobs":[',
+            b",".join(fragments),
+            b"],",
+            dumps(tail)[1:],
+            b"\n",
+        ),
+    )
+
+
+def _known_job_ids():
+    """Return the known job ids of the current user or None.
+
+    Returns None outside of a request or if they are disabled (see
+    `core.known_jobs`).
+    """
+    if JOBSTATUS.known_jobs_ttl <= 0 or not is_shared():
+        return None
+    if not has_request_context() or not request.authorization:
+        return None
+    return get_known_job_ids(
+        credentials_key(),
+        JOBSTATUS.known_jobs_error_rate,
+    )
 
-        jobs.append(status_info)
 
-    self_href = "/jobs?f=json"
-    if has_request_context():
-        self_href = f"{request.url}?f=json"
+def _add_known_job_id(known, item: dict) -> None:
+    """Add the id of an actinia job to the known job ids."""
+    job_id = parse_actinia_job_id(item)
+    if job_id:
+        known.add(job_id)
 
-    return {
-        "jobs": jobs,
-        "links": [
-            {
-                "href": self_href,
-                "rel": "self",
-                "type": "application/json",
-            },
-        ],
-    }
+
+def reduce_job_item(item: dict) -> dict:
+    """Return the `JOB_FIELDS` of an actinia job and the bbox of its region.
+
+    The bbox (see `core.job_index.bbox_from_process_chain`) replaces the
+    process chains, which are not kept.
+    """
+    reduced = {k: v for k, v in item.items() if k in JOB_FIELDS}
+    bbox = bbox_from_process_chain(item)
+    if bbox is not None:
+        reduced["bbox"] = bbox
+    return reduced
+
+
+def read_resource_list(resp) -> list:
+    """Return the `resource_list` of an actinia response or empty list.
+
+    Responses requested with `stream=True` (see `JOBLIST.stream_parse`) are
+    parsed incrementally and their items reduced (see `reduce_job_item`), so
+    the full upstream list is never held in memory.
+    The ids of the jobs are added to the known job ids of the user on the
+    way (see `core.job_index`).
+    """
+    known = _known_job_ids()
+    if JOBLIST.stream_parse and isinstance(resp, requests.Response):
+        items = []
+        try:
+            chunks = resp.iter_content(JOBLIST.stream_chunk_size)
+            for item in iter_json_array(chunks, "resource_list"):
+                if isinstance(item, dict):
+                    if known is not None:
+                        _add_known_job_id(known, item)
+                    item = reduce_job_item(item)
+                items.append(item)
+        except ValueError as e:
+            log.debug(f"Error while reading actinia job list: {e}")
+            return []
+        finally:
+            resp.close()
+        return items
+    try:
+        items = resp.json()["resource_list"]
+    except (ValueError, TypeError, KeyError):
+        return []
+    if isinstance(items, list) and known is not None:
+        for item in items:
+            if isinstance(item, dict):
+                _add_known_job_id(known, item)
+    return items
+
+
+def parse_actinia_jobs(
+    resp,
+    job_types: list | None = None,
+    process_ids: list | None = None,
+    status: list | None = None,
+    datetime_param: str | None = None,
+    min_duration: int | None = None,
+    max_duration: int | None = None,
+):
+    """Map actinia response into a `jobs` list structure.
+
+    Reuses `parse_actinia_job`.
+
+    If `process_ids` is provided, only include jobs matching any of the
+    provided process identifiers (match against `processID` or `jobID`).
+    """
+    records = _filter_actinia_items(
+        read_resource_list(resp),
+        job_types,
+        process_ids,
+        status,
+        datetime_param,
+        min_duration,
+        max_duration,
+    )
+    return build_job_list(records)
+
+
+def collect_actinia_jobs(
+    actinia_type: str | None = None,
+    limit: int = 10000,
+    job_types: list | None = None,
+    process_ids: list | None = None,
+    status: list | None = None,
+    datetime_param: str | None = None,
+    min_duration: int | None = None,
+    max_duration: int | None = None,
+    record_filter=None,
+    sort_key=None,
+):
+    """Fetch and filter actinia jobs until `limit` matches are found.
+
+    actinia only supports limiting the number of returned jobs (`num`), so
+    filters which are applied locally can leave fewer than `limit` jobs in
+    a response although more matches exist upstream. In that case larger
+    batches are requested (growing by `JOBLIST.overfetch_factor`) until
+    `limit` matches are found, the upstream list is exhausted or
+    `JOBLIST.max_scan` jobs were scanned.
+
+    `record_filter` is passed to `_filter_actinia_items`. With `sort_key`
+    the matching records are sorted before they are cut to `limit`; the
+    scan then does not stop at `limit` matches, as the first matches in
+    sort order might not be scanned yet.
+
+    Returns a tuple (resp, records, partial) where `resp` is the last
+    actinia response, `records` the matching JobRecords (None when actinia
+    did not answer with 200) and `partial` whether the scan budget was hit
+    before the upstream list was exhausted.
+    """
+    local_filters = any(
+        (
+            job_types,
+            process_ids,
+            datetime_param,
+            min_duration is not None,
+            max_duration is not None,
+            status and not actinia_type,
+            record_filter is not None,
+        ),
+    )
+    if not local_filters:
+        resp = get_actinia_jobs(actinia_type=actinia_type, limit=limit)
+        if resp.status_code != 200:
+            return resp, None, None
+        records = _filter_actinia_items(
+            read_resource_list(resp),
+            status=status,
+        )
+        return resp, records, False
+
+    factor = max(2, JOBLIST.overfetch_factor)
+    max_scan = max(limit, JOBLIST.max_scan)
+    num = min(limit * factor, max_scan)
+    seen = set()
+    records = []
+    while True:
+        resp = get_actinia_jobs(actinia_type=actinia_type, limit=num)
+        if resp.status_code != 200:
+            return resp, None, None
+        items = read_resource_list(resp)
+        records += _filter_actinia_items(
+            items,
+            job_types,
+            process_ids,
+            status,
+            datetime_param,
+            min_duration,
+            max_duration,
+            seen=seen,
+            record_filter=record_filter,
+        )
+        exhausted = len(items) < num
+        if (len(records) >= limit and sort_key is None) or exhausted:
+            if sort_key is not None:
+                records.sort(key=sort_key)
+            return resp, records[:limit], False
+        if num >= max_scan:
+            log.debug(
+                f"Job list scan budget of {max_scan} jobs exhausted with "
+                f"{len(records)} of {limit} matches",
+            )
+            if sort_key is not None:
+                records.sort(key=sort_key)
+            return resp, records[:limit], True
+        num = min(num * factor, max_scan)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Incremental reading of the process log of actinia jobs.
+
+A log page contains the `process_log` entries of a job from the offset
+`since` on and the `offset` to continue with, so clients only receive new
+entries instead of the complete actinia job on every poll.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from flask import request
+
+from actinia_ogc_api_processes_plugin.authentication import credentials_key
+from actinia_ogc_api_processes_plugin.core.actinia_common import map_status
+from actinia_ogc_api_processes_plugin.core.job_events import (
+    EventStream,
+    Watcher,
+    error_from_response,
+)
+from actinia_ogc_api_processes_plugin.core.job_list import COMPLETED_STATES
+from actinia_ogc_api_processes_plugin.core.job_status_info import (
+    get_actinia_job,
+    job_data_from_response,
+)
+from actinia_ogc_api_processes_plugin.resources.config import JOBSTATUS
+
+
+def _process_log(data: dict) -> list:
+    """Return the process log of an actinia job."""
+    process_log = data.get("process_log")
+    return process_log if isinstance(process_log, list) else []
+
+
+def log_page(job_id: str, data: dict, since: int) -> dict:
+    """Return the log page of an actinia job from offset `since` on.
+
+    `since` is reduced to the length of the log if it is beyond.
+    """
+    process_log = _process_log(data)
+    since = min(since, len(process_log))
+    return {
+        "jobID": job_id,
+        "status": map_status(data.get("status")),
+        "since": since,
+        "offset": len(process_log),
+        "entries": process_log[since:],
+    }
+
+
+def parse_since(value: str | None) -> int:
+    """Return the `since` query parameter, raise ValueError if invalid."""
+    if value is None:
+        return 0
+    since = int(value)
+    if since < 0:
+        msg = f"Invalid log offset: {value}"
+        raise ValueError(msg)
+    return since
+
+
+def get_job_log(job_id: str, since: int = 0) -> tuple:
+    """Return a tuple (status_code, log_page_or_None, response).
+
+    The offset `since` is only given by the client (see the `next` link),
+    so any worker can continue a log. `response` is the actinia response
+    for logging.
+    """
+    resp = get_actinia_job(job_id)
+    data = job_data_from_response(resp)
+    if data is None:
+        status_code = 404 if resp.status_code == 400 else resp.status_code
+        return status_code, None, resp
+    page = log_page(job_id, data, since)
+    href = request.base_url
+    page["links"] = [
+        {"href": request.url, "rel": "self"},
+        {"href": f"{href}?since={page['offset']}", "rel": "next"},
+        {"href": href.rsplit("/", 1)[0], "rel": "up"},
+    ]
+    return 200, page, resp
+
+
+class JobLogWatcher(Watcher):
+    """Watches the process log of one job.
+
+    `log` events are log pages with the entries added since the previous
+    event (without links); they are sent when entries were added or the
+    status changed. A `done` event is sent when the job reached a final
+    state.
+    """
+
+    def __init__(self, key: tuple, auth, job_id: str) -> None:
+        """Initialise."""
+        super().__init__(key, auth)
+        self.min_interval = JOBSTATUS.wait_min_interval
+        self.max_interval = JOBSTATUS.wait_max_interval
+        self.job_id = job_id
+        self.process_log = None
+        self.status = None
+
+    def poll(self) -> list:
+        """Request the job from actinia."""
+        resp = get_actinia_job(self.job_id, auth=self.auth)
+        data = job_data_from_response(resp)
+        if data is None:
+            self.done = True
+            return [error_from_response(resp, self.job_id)]
+        since = 0 if self.process_log is None else len(self.process_log)
+        page = log_page(self.job_id, data, since)
+        events = []
+        if (
+            self.process_log is None
+            or page["entries"]
+            or page["status"] != self.status
+        ):
+            events.append(("log", page))
+        self.process_log = _process_log(data)
+        self.status = page["status"]
+        if self.status in COMPLETED_STATES:
+            self.done = True
+            events.append(("done", {"jobID": self.job_id}))
+        return events
+
+    def snapshot(self) -> list:
+        """Return the complete log if it is known already."""
+        if self.process_log is None:
+            return []
+        events = [
+            (
+                "log",
+                {
+                    "jobID": self.job_id,
+                    "status": self.status,
+                    "since": 0,
+                    "offset": len(self.process_log),
+                    "entries": self.process_log,
+                },
+            ),
+        ]
+        if self.done:
+            events.append(("done", {"jobID": self.job_id}))
+        return events
+
+
+class LogEventStream(EventStream):
+    """Event stream of the log of a job starting at an offset."""
+
+    def __init__(self, key: tuple, factory, since: int) -> None:
+        """Subscribe to the log watcher of `key`."""
+        self.since = since
+        super().__init__(key, factory)
+
+    def transform(self, event: tuple) -> tuple:
+        """Remove the log entries before `since` from the event."""
+        name, data = event
+        skip = self.since - data.get("since", self.since)
+        if name != "log" or skip <= 0:
+            return event
+        skip = min(skip, len(data["entries"]))
+        return name, {
+            **data,
+            "since": data["since"] + skip,
+            "entries": data["entries"][skip:],
+        }
+
+
+def job_log_stream(job_id: str, since: int = 0) -> LogEventStream:
+    """Return the log event stream of a job of the current user.
+
+    All streams of the log of a job share one `JobLogWatcher`.
+    """
+    key = (credentials_key(), job_id, "logs")
+    auth = request.authorization
+    return LogEventStream(
+        key,
+        lambda: JobLogWatcher(key, auth, job_id),
+        since,
+    )
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Estimation of the completion of running jobs from their progress.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+import math
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+from actinia_ogc_api_processes_plugin.core.cache import LRUCache
+from actinia_ogc_api_processes_plugin.resources.config import JOBSTATUS
+
+RUNNING_STATES = frozenset({"accepted", "running"})
+
+# (credentials key, job id) -> deque of (epoch seconds, progress) samples
+_SAMPLES = LRUCache(JOBSTATUS.progress_jobs)
+
+
+def _to_epoch(value: str | None) -> float | None:
+    """Return an ISO timestamp of a statusInfo as epoch seconds or None."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+def record_progress(key: tuple, status_info: dict, now=None) -> None:
+    """Add the progress of a statusInfo to the samples of the job.
+
+    A sample is only added when the progress changed; its time is the
+    `updated` timestamp of the job. The start of the job is the first
+    sample (with progress 0). Samples of jobs which are not running
+    anymore are removed.
+    """
+    if status_info.get("status") not in RUNNING_STATES:
+        _SAMPLES.pop(key)
+        return
+    progress = status_info.get("progress")
+    if progress is None:
+        return
+    samples = _SAMPLES.get(key)
+    if samples is None:
+        samples = deque(maxlen=JOBSTATUS.progress_samples)
+        start = _to_epoch(
+            status_info.get("started") or status_info.get("created"),
+        )
+        if start is not None and progress > 0:
+            samples.append((start, 0))
+        _SAMPLES.set(key, samples)
+    if not samples or samples[-1][1] != progress:
+        if now is None:
+            now = time.time()
+        updated = _to_epoch(status_info.get("updated"))
+        samples.append((now if updated is None else updated, progress))
+
+
+def estimate_completion(key: tuple, now=None) -> tuple:
+    """Return a tuple (estimated completion or None, seconds to next poll).
+
+    The completion (epoch seconds) is extrapolated from the progress rate
+    between the first and the last sample. The next poll is due when the
+    progress probably changes again, i.e. one average interval between two
+    samples after the last one, but not after the estimated completion.
+    The seconds are within `JOBSTATUS.retry_after_min` and
+    `JOBSTATUS.retry_after_max`.
+    """
+    if now is None:
+        now = time.time()
+    retry_after = JOBSTATUS.retry_after_min
+    samples = _SAMPLES.get(key)
+    if not samples or len(samples) < 2:
+        return None, retry_after
+    first_time, first_progress = samples[0]
+    last_time, last_progress = samples[-1]
+    if last_progress <= first_progress or last_time <= first_time:
+        return None, retry_after
+    rate = (last_progress - first_progress) / (last_time - first_time)
+    completion = max(last_time + (100 - last_progress) / rate, now)
+    next_change = last_time + (last_time - first_time) / (len(samples) - 1)
+    retry_after = min(
+        max(min(next_change, completion) - now, JOBSTATUS.retry_after_min),
+        JOBSTATUS.retry_after_max,
+    )
+    return completion, math.ceil(retry_after)
+
+
+def progress_hints(key: tuple, status_info: dict) -> tuple:
+    """Return a tuple (estimatedCompletion or None, Retry-After or None).
+
+    Records the progress of the statusInfo of a job. Both are None for
+    jobs in a final state.
+    """
+    record_progress(key, status_info)
+    if status_info.get("status") not in RUNNING_STATES:
+        return None, None
+    completion, retry_after = estimate_completion(key)
+    if completion is not None:
+        completion = (
+            datetime.fromtimestamp(completion, tz=timezone.utc)
+            .replace(microsecond=0)
+            .isoformat()
+        )
+    return completion, retry_after
@@ -17,10 +17,19 @@ from email.mime.base import MIMEBase
 from email.mime.text import MIMEText
 
 import requests
-from flask import make_response, request
+from flask import Response, make_response, request
 from requests.auth import HTTPBasicAuth
 
-from actinia_ogc_api_processes_plugin.resources.config import ACTINIA
+from actinia_ogc_api_processes_plugin.core.result_cache import (
+    VALIDATOR_HEADERS,
+    cache_result,
+    cached_result,
+    range_response,
+)
+from actinia_ogc_api_processes_plugin.resources.config import (
+    ACTINIA,
+    JOBRESULTS,
+)
 
 
 # ruff: noqa: PLR0912
@@ -249,18 +258,69 @@ def export_ref_to_header(result_format, status_code):
     return response
 
 
+def _iter_upstream(upstream):
+    """Yield the body of an actinia response in chunks and close it."""
+    try:
+        yield from upstream.iter_content(JOBRESULTS.stream_chunk_size)
+    finally:
+        upstream.close()
+
+
+def _passthrough_response(upstream, status_code, content_type):
+    """Return a response streaming the body of an actinia response."""
+    response = Response(
+        _iter_upstream(upstream),
+        status=status_code,
+        content_type=content_type,
+    )
+    headers = upstream.headers
+    # the length of the decoded content is unknown for compressed content
+    if headers.get("Content-Length") and not headers.get("Content-Encoding"):
+        response.headers["Content-Length"] = headers["Content-Length"]
+    for name in (*VALIDATOR_HEADERS, "Content-Range"):
+        if headers.get(name):
+            response.headers[name] = headers[name]
+    # ranges are read from a local copy if actinia does not support them
+    if JOBRESULTS.range_cache_size > 0 or headers.get("Accept-Ranges"):
+        response.headers["Accept-Ranges"] = "bytes"
+    return response
+
+
 def get_ref_value(value, status_code):
     """Get the value of reference link via request.
 
+    The content is streamed from actinia to the client in chunks of
+    `JOBRESULTS.stream_chunk_size` bytes, so large result files are never
+    held in memory; the next chunk is only read when the previous one was
+    sent. Content-Type is taken from the reference link or from actinia,
+    Content-Length from actinia.
+
+    Range and If-Range headers are forwarded to actinia. If actinia ignores
+    them, the file is copied to a local cache once and the ranges are read
+    from there (see `core.result_cache`).
+
     Args:
         value (dict): A dictionary containing the reference link information,
         status_code (int): The HTTP status code to be used in the response.
 
     Returns:
-        Response: A Flask response object containing the content retrieved from
-            the reference link, with the specified HTTP status code.
+        Response: A Flask response object streaming the content retrieved
+            from the reference link, with the specified HTTP status code
+            (or the status code of actinia if it failed, or 206 for
+            ranges).
 
     """
+    url = re.sub(
+        r"https?:\/\/(.*?)\/api\/v\d+",
+        ACTINIA.processing_base_url,
+        value["href"],
+    )
+    ranged = "Range" in request.headers
+    if ranged:
+        cached = cached_result(url)
+        if cached is not None:
+            return range_response(*cached, status_code)
+
     auth = request.authorization
     kwargs = dict()
     if auth:
@@ -268,15 +328,40 @@ def get_ref_value(value, status_code):
             auth.username,
             auth.password,
         )
-    url = re.sub(
-        r"https?:\/\/(.*?)\/api\/v\d+",
-        ACTINIA.processing_base_url,
-        value["href"],
-    )
-    return make_response(
-        requests.get(url, **kwargs).content,
-        status_code,
+    if ranged:
+        kwargs["headers"] = {
+            name: request.headers[name]
+            for name in ("Range", "If-Range")
+            if name in request.headers
+        }
+    upstream = requests.get(url, stream=True, **kwargs)
+    if upstream.status_code >= 400 and upstream.status_code != 416:
+        # error messages are small
+        try:
+            return make_response(upstream.content, upstream.status_code)
+        finally:
+            upstream.close()
+    content_type = (
+        value.get("type")
+        or upstream.headers.get("Content-Type")
+        or "application/octet-stream"
     )
+    if upstream.status_code in {206, 416}:
+        if upstream.headers.get("Content-Type", "").startswith("multipart/"):
+            # multipart/byteranges with the boundary of actinia
+            content_type = upstream.headers["Content-Type"]
+        return _passthrough_response(
+            upstream,
+            upstream.status_code,
+            content_type,
+        )
+    # actinia sends the complete file: it ignores ranges unless it
+    # announces to support them (then If-Range did not match)
+    if ranged and upstream.headers.get("Accept-Ranges") != "bytes":
+        cached = cache_result(url, upstream, content_type)
+        if cached is not None:
+            return range_response(*cached, status_code)
+    return _passthrough_response(upstream, status_code, content_type)
 
 
 def export_ref_to_multipart(result_format, multipart_message):
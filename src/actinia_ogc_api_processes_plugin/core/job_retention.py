@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Retention of old jobs: hide them in the background and remember them.
+
+actinia has no endpoint to delete the jobs of a user (DELETE of a resource
+only requests its termination, its records expire in actinia itself), so
+jobs in a final state are only hidden: they are removed from job lists and
+answered with 404 without asking actinia. Nothing is reclaimed in actinia
+and job lists are still read from actinia in full. The ids of hidden jobs
+are kept per user name as tombstones, shared by all workers through the
+shared database (see `core.shared_store`).
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import requests
+from flask import request
+
+from actinia_ogc_api_processes_plugin.authentication import credentials_key
+from actinia_ogc_api_processes_plugin.core.cache import LRUCache
+from actinia_ogc_api_processes_plugin.core.job_cache import (
+    invalidate_terminal_job,
+)
+from actinia_ogc_api_processes_plugin.core.job_list import (
+    COMPLETED_STATES,
+    get_actinia_jobs,
+    iter_job_records,
+    read_resource_list,
+)
+from actinia_ogc_api_processes_plugin.core.shared_store import (
+    shared,
+    shared_key,
+    shared_transaction,
+)
+from actinia_ogc_api_processes_plugin.resources.config import (
+    JOBLIST,
+    RETENTION,
+)
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+# tombstones are kept per user name, so they survive password changes
+_TOMBSTONES = LRUCache(1000)
+# all other keys are credentials keys, see `authentication.credentials_key`
+_REPORTS = LRUCache(1000)
+# monotonic time of the next retention run
+_NEXT_RUN = LRUCache(1000)
+_LOCK = threading.Lock()
+
+# retention runs are executed one after another in a single background thread
+_SCHEDULER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="retention")
+
+
+class Tombstones:
+    """Compact set of the ids of hidden jobs.
+
+    Only an 8 byte digest of each job id is kept. The oldest tombstones are
+    dropped once `maxsize` is reached. `version` is the version of the
+    tombstones in the shared database they were loaded from.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialise an empty set."""
+        self.maxsize = maxsize
+        self.version = None
+        # dict keeps the insertion order for dropping the oldest entries
+        self._digests = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(job_id: str) -> int:
+        """Return the digest of a job id."""
+        digest = hashlib.blake2b(job_id.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    def replace(self, digests, version) -> None:
+        """Replace the tombstones with the digests of another worker."""
+        with self._lock:
+            self._digests = dict.fromkeys(digests)
+            self.version = version
+
+    def __len__(self) -> int:
+        """Return the number of tombstones."""
+        return len(self._digests)
+
+    def __contains__(self, job_id: str) -> bool:
+        """Return True if the job is hidden."""
+        return self.digest(job_id) in self._digests
+
+    def add(self, job_id: str) -> None:
+        """Add a tombstone for a hidden job."""
+        with self._lock:
+            self._digests[self.digest(job_id)] = None
+            while len(self._digests) > self.maxsize:
+                del self._digests[next(iter(self._digests))]
+
+    def record_filter(self, record) -> bool:
+        """Record filter passing only jobs which are not hidden."""
+        return record.job_id not in self
+
+
+def _get_tombstones(username: str) -> Tombstones:
+    """Return the tombstones of a user."""
+    with _LOCK:
+        tombstones = _TOMBSTONES.get(username)
+        if tombstones is None:
+            tombstones = Tombstones(RETENTION.max_tombstones)
+            _TOMBSTONES.set(username, tombstones)
+    return tombstones
+
+
+def _shared_keys(username: str) -> tuple:
+    """Return the keys of the set of tombstones and its version."""
+    name = shared_key("tombstones", username)
+    return name, f"{name}:version"
+
+
+def _load_shared_tombstones(username: str) -> None:
+    """Update the tombstones of a user from the shared database.
+
+    The tombstones are only loaded again when their version changed.
+    """
+    name, version_name = _shared_keys(username)
+    version = shared("get", version_name)
+    if version is None:
+        return
+    tombstones = _get_tombstones(username)
+    if version == tombstones.version:
+        return
+    # added and versioned in one transaction, so the members are at least
+    # those of `version`
+    digests = shared("smembers", name)
+    if digests is not None:
+        tombstones.replace((int(d) for d in digests), version)
+
+
+def _share_tombstones(username: str, job_ids: list) -> None:
+    """Add tombstones to the shared database.
+
+    Random tombstones are dropped once there are more than
+    `RETENTION.max_tombstones`.
+    """
+    if not job_ids:
+        return
+    name, version_name = _shared_keys(username)
+    digests = [str(Tombstones.digest(job_id)) for job_id in job_ids]
+    result = shared_transaction(
+        ("sadd", name, *digests),
+        ("incr", version_name),
+        ("scard", name),
+    )
+    if result is not None and result[2] > RETENTION.max_tombstones:
+        shared_transaction(
+            ("spop", name, result[2] - RETENTION.max_tombstones),
+            ("incr", version_name),
+        )
+
+
+def get_tombstones() -> Tombstones | None:
+    """Return the tombstones of the current user or None if there are none.
+
+    Hidden jobs are kept per user name, so they stay hidden after a
+    change of the password of the user.
+    """
+    username = request.authorization.username
+    _load_shared_tombstones(username)
+    tombstones = _TOMBSTONES.get(username)
+    return tombstones if tombstones else None
+
+
+def is_purged(job_id: str) -> bool:
+    """Return True if the job of the current user is hidden."""
+    tombstones = get_tombstones()
+    return tombstones is not None and job_id in tombstones
+
+
+def _last_change(record) -> float:
+    """Return the epoch of the last change of a job."""
+    for value in (record.updated, record.finished, record.created):
+        if value is not None:
+            return value
+    return 0.0
+
+
+def select_expired(
+    records,
+    now: float | None = None,
+    complete: bool = True,
+) -> list:
+    """Return the ids of the jobs which are hidden by the retention rules.
+
+    Only jobs in one of `RETENTION.states` which is a final state are
+    hidden: those whose last change is older than `RETENTION.max_age`
+    seconds and all but the `RETENTION.max_count` most recently changed
+    ones. The count is only applied if `records` are `complete`, i.e. all
+    jobs of the user.
+    """
+    now = time.time() if now is None else now
+    states = set(RETENTION.states) & COMPLETED_STATES
+    candidates = [record for record in records if record.status in states]
+    candidates.sort(key=_last_change, reverse=True)
+    expired = {}
+    if RETENTION.max_count > 0 and complete:
+        for record in candidates[RETENTION.max_count :]:
+            expired[record.job_id] = None
+    if RETENTION.max_age > 0:
+        cutoff = now - RETENTION.max_age
+        for record in candidates:
+            if _last_change(record) < cutoff:
+                expired[record.job_id] = None
+    return list(expired)
+
+
+def purge_jobs(key: str, auth) -> dict:
+    """Hide the expired jobs of a user.
+
+    Adds a tombstone for every expired job which was not hidden before and
+    removes it from the cache of jobs in a final state. `key` is the
+    credentials key of `auth`. Only the first `JOBLIST.max_scan` jobs are
+    read from actinia; if there are more, `RETENTION.max_count` is not
+    applied, as the most recently changed jobs might be missing. Returns
+    the report of this run.
+    """
+    report = {"hidden": 0, "failed": 0}
+    resp = get_actinia_jobs(limit=JOBLIST.max_scan, auth=auth)
+    if resp.status_code != 200:
+        log.error(f"Retention: actinia job list returned {resp.status_code}")
+        report["failed"] = None
+        return report
+
+    _load_shared_tombstones(auth.username)
+    tombstones = _get_tombstones(auth.username)
+    items = read_resource_list(resp)
+    # actinia returned as many jobs as requested -> there might be more
+    complete = len(items) < JOBLIST.max_scan
+    if not complete and RETENTION.max_count > 0:
+        log.warning(
+            f"Retention: more than {JOBLIST.max_scan} jobs of"
+            f" {auth.username}, max_count is not applied",
+        )
+    hidden = [
+        job_id
+        for job_id in select_expired(iter_job_records(items), None, complete)
+        if job_id not in tombstones
+    ]
+    for job_id in hidden:
+        tombstones.add(job_id)
+        invalidate_terminal_job(job_id, key)
+    _share_tombstones(auth.username, hidden)
+    report["hidden"] = len(hidden)
+    return report
+
+
+def _run(key: str, auth) -> None:
+    """Run `purge_jobs` and update the report (runs in the scheduler)."""
+    try:
+        report = purge_jobs(key, auth)
+    except requests.RequestException as e:
+        log.error(f"Retention: Connection ERROR: {e}")
+        report = {"hidden": 0, "failed": None}
+    last_run = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    with _LOCK:
+        total = (_REPORTS.get(key) or {}).get("hidden", 0)
+        _REPORTS.set(
+            key,
+            {
+                "lastRun": last_run,
+                "lastHidden": report["hidden"],
+                "lastFailed": report["failed"],
+                "hidden": total + report["hidden"],
+            },
+        )
+    log.info(
+        f"Retention: hid {report['hidden']} jobs of {auth.username}"
+        f" ({report['failed']} failed)",
+    )
+
+
+def schedule_retention() -> bool:
+    """Start a retention run for the current user if one is due.
+
+    A run is due every `RETENTION.interval` seconds per credentials. The
+    run is executed in the background with the credentials of the current
+    request, which are not kept after the run. Returns True if a run was
+    started.
+    """
+    if not RETENTION.enabled:
+        return False
+    key = credentials_key()
+    now = time.monotonic()
+    with _LOCK:
+        next_run = _NEXT_RUN.get(key)
+        if next_run is not None and next_run > now:
+            return False
+        _NEXT_RUN.set(key, now + RETENTION.interval)
+    _SCHEDULER.submit(_run, key, request.authorization)
+    return True
+
+
+def get_retention_report() -> dict:
+    """Return the number of jobs hidden for the current user."""
+    key = credentials_key()
+    report = dict(_REPORTS.get(key) or {"lastRun": None, "hidden": 0})
+    tombstones = _TOMBSTONES.get(request.authorization.username)
+    report["tombstones"] = len(tombstones) if tombstones else 0
+    return report
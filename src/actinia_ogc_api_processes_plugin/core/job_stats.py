@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Core helper to aggregate job statistics of the actinia job list.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+import math
+import time
+
+from flask import request
+
+from actinia_ogc_api_processes_plugin.authentication import credentials_key
+from actinia_ogc_api_processes_plugin.core.cache import LRUCache
+from actinia_ogc_api_processes_plugin.core.job_list import (
+    COMPLETED_STATES,
+    get_actinia_jobs,
+    iter_job_records,
+    read_resource_list,
+)
+from actinia_ogc_api_processes_plugin.core.job_retention import (
+    get_retention_report,
+    get_tombstones,
+)
+from actinia_ogc_api_processes_plugin.resources.config import (
+    JOBLIST,
+    RETENTION,
+)
+
+PERCENTILES = (50, 90, 99)
+
+# credentials key -> (expiry time, stats)
+_STATS_CACHE = LRUCache(1000)
+
+
+def _percentile(values: list, pct: float) -> float:
+    """Return the linearly interpolated percentile of sorted `values`."""
+    rank = (len(values) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def _summarize(values: list) -> dict:
+    """Return count, mean, min, max and percentiles of `values` (seconds)."""
+    summary = {"count": len(values)}
+    if not values:
+        return summary
+    values.sort()
+    summary["mean"] = round(sum(values) / len(values), 3)
+    summary["min"] = round(values[0], 3)
+    summary["max"] = round(values[-1], 3)
+    for pct in PERCENTILES:
+        summary[f"p{pct}"] = round(_percentile(values, pct), 3)
+    return summary
+
+
+def compute_job_stats(records) -> dict:
+    """Aggregate JobRecords in a single pass.
+
+    Counts jobs per status and type. `duration` (finished - started) is
+    summarized for completed jobs and `queueWait` (started - created) for
+    all jobs which were started.
+    """
+    total = 0
+    status_counts = {}
+    type_counts = {}
+    durations = []
+    queue_waits = []
+    for record in records:
+        total += 1
+        status_counts[record.status] = status_counts.get(record.status, 0) + 1
+        type_counts[record.type] = type_counts.get(record.type, 0) + 1
+        if record.started is None:
+            continue
+        if record.created is not None:
+            queue_waits.append(max(0.0, record.started - record.created))
+        if record.status in COMPLETED_STATES and record.finished is not None:
+            durations.append(max(0.0, record.finished - record.started))
+
+    return {
+        "numberOfJobs": total,
+        "status": status_counts,
+        "type": type_counts,
+        "duration": _summarize(durations),
+        "queueWait": _summarize(queue_waits),
+    }
+
+
+def _with_retention(stats: dict) -> dict:
+    """Add the number of hidden jobs if the retention is enabled."""
+    if not RETENTION.enabled:
+        return stats
+    return dict(stats, retention=get_retention_report())
+
+
+def get_job_stats():
+    """Return a tuple (resp, stats) for the jobs of the current user.
+
+    Statistics are cached for `JOBLIST.stats_ttl` seconds per user; `resp`
+    is None when served from the cache. `stats` is None when actinia did
+    not answer with 200. Hidden jobs are not counted, their number is added
+    as `retention` instead.
+    """
+    now = time.monotonic()
+    key = credentials_key()
+    cached = _STATS_CACHE.get(key)
+    if cached is not None and cached[0] > now:
+        return None, _with_retention(cached[1])
+
+    resp = get_actinia_jobs(limit=JOBLIST.max_scan)
+    if resp.status_code != 200:
+        return resp, None
+    items = read_resource_list(resp)
+    records = iter_job_records(items)
+    tombstones = get_tombstones()
+    if tombstones:
+        records = filter(tombstones.record_filter, records)
+    stats = compute_job_stats(records)
+    # actinia returned as many jobs as requested -> there might be more
+    stats["partial"] = len(items) >= JOBLIST.max_scan
+
+    stats["links"] = [
+        {"href": request.base_url, "rel": "self", "type": "application/json"},
+    ]
+    _STATS_CACHE.set(key, (now + JOBLIST.stats_ttl, stats))
+    return resp, _with_retention(stats)
@@ -11,21 +11,48 @@ __author__ = "Carmen Tawalika"
 __copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 
+import math
 import re
+import time
 
 import requests
 from flask import request
 from requests.auth import HTTPBasicAuth
 
+from actinia_ogc_api_processes_plugin.authentication import credentials_key
 from actinia_ogc_api_processes_plugin.core.actinia_common import (
+    JobRecord,
     parse_actinia_job,
 )
-from actinia_ogc_api_processes_plugin.resources.config import ACTINIA
+from actinia_ogc_api_processes_plugin.core.actinia_valkey import (
+    read_actinia_job,
+)
+from actinia_ogc_api_processes_plugin.core.cache import LRUCache
+from actinia_ogc_api_processes_plugin.core.known_jobs import remember_job
+from actinia_ogc_api_processes_plugin.resources.config import (
+    ACTINIA,
+    JOBSTATUS,
+    VALKEY,
+)
+
+# (credentials key, job id) -> (epoch seconds when seen, statusInfo)
+_LAST_KNOWN = LRUCache(JOBSTATUS.last_known_size)
 
 
-def get_actinia_job(job_id):
-    """Retrieve job status from actinia."""
-    auth = request.authorization
+def get_actinia_job(job_id, auth=None):
+    """Retrieve job status from actinia.
+
+    With `VALKEY.url` the job is read from the valkey of actinia if
+    possible. `auth` defaults to the credentials of the current request; it
+    has to be passed when called outside of the request context (e.g. in
+    threads).
+    """
+    if auth is None:
+        auth = request.authorization
+    if VALKEY.url:
+        resp = read_actinia_job(job_id, auth)
+        if resp is not None:
+            return resp
     kwargs = dict()
     if auth:
         kwargs["auth"] = HTTPBasicAuth(auth.username, auth.password)
@@ -37,12 +64,14 @@ def get_actinia_job(job_id):
     return requests.get(url, **kwargs)
 
 
-def cancel_actinia_job(job_id):
+def cancel_actinia_job(job_id, auth=None):
     """Send a DELETE request to actinia to cancel the given job.
 
-    Returns the raw `requests.Response` object.
+    Returns the raw `requests.Response` object. `auth` defaults to the
+    credentials of the current request.
     """
-    auth = request.authorization
+    if auth is None:
+        auth = request.authorization
     kwargs = dict()
     if auth:
         kwargs["auth"] = HTTPBasicAuth(auth.username, auth.password)
@@ -73,32 +102,34 @@ def add_actinia_logs(status_info, data):
     )
 
 
-def get_job_status_info(job_id):
-    """Return a tuple (status_code, status_info_dict_or_None, response).
+def _status_info(job_id, data, links=None) -> dict:
+    """Return the statusInfo incl. link to the actinia log of a job."""
+    if links is None:
+        status_info = parse_actinia_job(job_id, data)
+    else:
+        status_info = JobRecord.from_actinia(job_id, data).to_status_info(
+            links=links,
+        )
+    add_actinia_logs(status_info, data)
+    return status_info
 
-    Maps the actinia job response into the OGC `statusInfo` structure when
-    possible. `response` is the original requests.Response for logging.
-    """
-    resp = get_actinia_job(job_id)
 
+def job_data_from_response(resp):
+    """Return the actinia job of an actinia job response or None."""
     status_code = resp.status_code
 
     if status_code == 200:
-        data = resp.json()
-        status_info = parse_actinia_job(job_id, data)
-        add_actinia_logs(status_info, data)
-        return 200, status_info, resp
+        return resp.json()
 
     # Actinia returns HTTP 400 both for 'no such job' and for
     # resources that include an error state. Distinguish by inspecting the
     # JSON payload: if it looks like a job/resource object (contains
-    # identifiers or job fields) treat it as a valid resource and map it to
-    # a 200 + statusInfo. Otherwise return 404.
+    # identifiers or job fields) treat it as a valid resource.
     if status_code == 400:
         try:
             data = resp.json()
         except (ValueError, TypeError):
-            return 404, None, resp
+            return None
 
         indicative_keys = {
             "accept_timestamp",
@@ -109,11 +140,89 @@ def get_job_status_info(job_id):
         }
 
         if isinstance(data, dict) and indicative_keys.issubset(data.keys()):
-            status_info = parse_actinia_job(job_id, data)
-            add_actinia_logs(status_info, data)
-            return 200, status_info, resp
+            return data
+
+    return None
 
-        return 404, None, resp
+
+def status_info_from_response(job_id, resp, links=None):
+    """Return a tuple (status_code, status_info_dict_or_None).
+
+    Maps an actinia job response into the OGC `statusInfo` structure when
+    possible; actinia jobs in an error state (HTTP 400) are mapped to a 200
+    + statusInfo, other 400 responses to 404. `links` overwrite the links
+    of the statusInfo.
+    """
+    data = job_data_from_response(resp)
+    if data is not None:
+        return 200, _status_info(job_id, data, links)
+    if resp.status_code == 400:
+        return 404, None
 
     # Any other status codes return as-is
-    return status_code, None, resp
+    return resp.status_code, None
+
+
+def get_job_status_info(job_id):
+    """Return a tuple (status_code, status_info_dict_or_None, response).
+
+    Maps the actinia job response into the OGC `statusInfo` structure when
+    possible. `response` is the original requests.Response for logging.
+    """
+    resp = get_actinia_job(job_id)
+    status_code, status_info = status_info_from_response(job_id, resp)
+    if status_code == 200:
+        remember_job(job_id)
+    return status_code, status_info, resp
+
+
+def remember_status_info(job_id, status_info) -> None:
+    """Store the statusInfo of a job of the current user as last known."""
+    _LAST_KNOWN.set((credentials_key(), job_id), (time.time(), status_info))
+
+
+def last_known_status_info(job_id):
+    """Return a tuple (statusInfo, age in seconds) of a job or None.
+
+    Returns the last statusInfo of a job of the current user which was
+    returned before, if it is not older than `JOBSTATUS.stale_max_age`
+    seconds. Used to answer while actinia is not available.
+    """
+    entry = _LAST_KNOWN.get((credentials_key(), job_id))
+    if entry is None:
+        return None
+    age = max(0, time.time() - entry[0])
+    if age > JOBSTATUS.stale_max_age:
+        return None
+    return entry[1], age
+
+
+def _parse_seconds(value: str) -> float:
+    """Return a non-negative number of seconds, raise ValueError if not."""
+    seconds = float(value)
+    if not math.isfinite(seconds) or seconds < 0:
+        msg = f"Invalid number of seconds: {value}"
+        raise ValueError(msg)
+    return seconds
+
+
+def parse_wait(value: str | None, prefer: str | None = None):
+    """Return the number of seconds to wait for a job change or None.
+
+    `value` is the `wait` query parameter. Without it the `wait` preference
+    of the Prefer header (RFC 7240, e.g. `Prefer: wait=10`) is used, which
+    is ignored if invalid. The result is capped at `JOBSTATUS.max_wait`.
+    Raises ValueError for an invalid `wait` query parameter.
+    """
+    if value is not None:
+        return min(_parse_seconds(value), JOBSTATUS.max_wait)
+    for preference in (prefer or "").split(","):
+        name, _, seconds = preference.split(";")[0].partition("=")
+        if name.strip().lower() != "wait":
+            continue
+        try:
+            seconds = _parse_seconds(seconds.strip().strip('"'))
+        except ValueError:
+            return None
+        return min(seconds, JOBSTATUS.max_wait)
+    return None
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Incremental parser for large JSON responses read in chunks.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+import codecs
+import json
+import re
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _ChunkReader:
+    """Text buffer over an iterable of UTF-8 encoded byte chunks.
+
+    Only the not yet consumed part of the input is kept in memory.
+    """
+
+    def __init__(self, chunks) -> None:
+        """Initialise with an iterable of byte chunks."""
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, min_size: int = 1) -> bool:
+        """Read until `min_size` characters are unconsumed.
+
+        Returns False when the end of the input was reached before.
+        """
+        self.buf = self.buf[self.pos :]
+        self.pos = 0
+        parts = [self.buf]
+        size = len(self.buf)
+        while size < min_size and not self.eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.eof = True
+                text = self._decoder.decode(b"", final=True)
+            else:
+                text = self._decoder.decode(chunk)
+            parts.append(text)
+            size += len(text)
+        self.buf = "".join(parts)
+        return size >= min_size
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at the end)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character which has to be one of `chars`."""
+        char = self.peek()
+        if not char or char not in chars:
+            msg = f"Expecting one of {chars!r} at offset {self.pos}"
+            raise ValueError(msg)
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode and consume the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # incomplete value: at least double the buffer (so large
+                # values are not decoded over and over again) and retry
+                if self.eof:
+                    raise
+                self.fill(2 * (len(self.buf) - self.pos) + 1)
+                continue
+            # a number at the end of the buffer might continue in the next
+            # chunk
+            if end == len(self.buf) and not self.eof:
+                self.fill(len(self.buf) - self.pos + 1)
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_json_array(chunks, key: str, fields=None):
+    """Yield the items of the array `key` of a JSON object read in chunks.
+
+    Only one item is decoded at a time. If `fields` is given, dict items
+    are reduced to these keys before they are yielded, so large unneeded
+    values are released right away. Reading stops at the end of the array.
+    Yields nothing if `key` is missing or is not an array.
+
+    Raises ValueError for invalid JSON.
+    """
+    reader = _ChunkReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                return
+            while True:
+                item = reader.value()
+                if fields is not None and isinstance(item, dict):
+                    item = {k: v for k, v in item.items() if k in fields}
+                yield item
+                if reader.expect(",]") == "]":
+                    return
+        reader.value()
+        if reader.expect(",}") == "}":
+            return
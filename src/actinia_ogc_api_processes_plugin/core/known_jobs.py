@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Fast path for requests of unknown job ids.
+
+The ids of the jobs of a user are kept per worker in a Bloom filter (see
+`core.job_index.KnownJobIds`), which is fed by executions, job lists and
+status requests and rebuilt from the complete job list every
+`JOBSTATUS.known_jobs_ttl` seconds. Jobs started through any worker are
+also added to the shared database (see `core.shared_store`), so requests
+for ids which are certainly unknown are answered without asking actinia.
+Without the shared database all requests are passed to actinia.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from flask import request
+
+from actinia_ogc_api_processes_plugin.authentication import credentials_key
+from actinia_ogc_api_processes_plugin.core.actinia_common import (
+    parse_actinia_job_id,
+)
+from actinia_ogc_api_processes_plugin.core.job_index import get_known_job_ids
+from actinia_ogc_api_processes_plugin.core.job_list import (
+    get_actinia_jobs,
+    read_resource_list,
+)
+from actinia_ogc_api_processes_plugin.core.shared_store import (
+    is_shared,
+    shared_key,
+    shared_transaction,
+)
+from actinia_ogc_api_processes_plugin.resources.config import (
+    JOBLIST,
+    JOBSTATUS,
+)
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+# rebuilds are executed one after another in a single background thread
+_SCHEDULER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="known_jobs")
+
+
+def _enabled() -> bool:
+    """Return True if the known job ids are used.
+
+    They are disabled without the shared database, which holds the jobs
+    started through other workers.
+    """
+    return JOBSTATUS.known_jobs_ttl > 0 and is_shared()
+
+
+def _new_jobs_key(key: str) -> str:
+    """Return the shared key of the jobs started recently by a user."""
+    return shared_key("new-jobs", key)
+
+
+def remember_job(job_id: str, *, new: bool = False) -> None:
+    """Add the id of a job of the current user to its known job ids.
+
+    Ids of `new` jobs are also added to the shared database for the other
+    workers, until all of them rebuilt their known job ids.
+    """
+    if not _enabled() or not job_id:
+        return
+    key = credentials_key()
+    get_known_job_ids(key, JOBSTATUS.known_jobs_error_rate).add(job_id)
+    if new:
+        # scores are the times the jobs were started
+        now = time.time()
+        keep = 2 * JOBSTATUS.known_jobs_ttl
+        name = _new_jobs_key(key)
+        shared_transaction(
+            ("zadd", name, {job_id: now}),
+            ("zremrangebyscore", name, "-inf", now - keep),
+            ("expire", name, keep),
+        )
+
+
+def rebuild_known_jobs(known, auth) -> None:
+    """Rebuild known job ids from the complete job list of the user.
+
+    `known.start_rebuild` has to be called before. If the job list cannot
+    be read completely (at most `JOBLIST.max_scan` jobs are requested), the
+    known job ids are not trusted until the next successful rebuild.
+    """
+    job_ids = None
+    try:
+        resp = get_actinia_jobs(limit=JOBLIST.max_scan, auth=auth)
+        if resp.status_code != 200:
+            log.debug(f"actinia job list returned {resp.status_code}")
+            return
+        items = read_resource_list(resp)
+        if len(items) >= JOBLIST.max_scan:
+            log.debug(
+                f"Known jobs of {auth.username} not rebuilt: more than "
+                f"{JOBLIST.max_scan} jobs",
+            )
+            return
+        job_ids = [
+            parse_actinia_job_id(item)
+            for item in items
+            if isinstance(item, dict)
+        ]
+    except requests.RequestException as e:
+        log.error(f"Rebuilding the known jobs failed: {e}")
+    except (KeyError, TypeError, ValueError) as e:
+        log.error(f"Invalid actinia job list for the known jobs: {e}")
+    finally:
+        if job_ids is not None:
+            job_ids = [job_id for job_id in job_ids if job_id]
+        known.finish_rebuild(job_ids, time.monotonic())
+
+
+def is_unknown_job(job_id: str) -> bool:
+    """Return True if the job of the current user certainly does not exist.
+
+    Only known job ids rebuilt less than `JOBSTATUS.known_jobs_ttl` seconds
+    ago are trusted. Otherwise a rebuild is started in the background and
+    False is returned, so the job is requested from actinia. Ids which are
+    not known are looked up in the jobs started through other workers.
+    """
+    if not _enabled():
+        return False
+    key = credentials_key()
+    known = get_known_job_ids(key, JOBSTATUS.known_jobs_error_rate)
+    rebuilt = known.rebuilt
+    ttl = JOBSTATUS.known_jobs_ttl
+    if rebuilt is None or time.monotonic() - rebuilt > ttl:
+        if known.start_rebuild():
+            auth = request.authorization
+            _SCHEDULER.submit(rebuild_known_jobs, known, auth)
+        return False
+    if job_id in known:
+        return False
+    result = shared_transaction(("zscore", _new_jobs_key(key), job_id))
+    # unknown only if the shared database answered
+    return result is not None and result[0] is None
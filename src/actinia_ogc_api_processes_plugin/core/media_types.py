@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Content negotiation for JSON and the binary encodings MessagePack and CBOR.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+from urllib.parse import urlencode
+
+from flask import jsonify, make_response, request
+
+from actinia_ogc_api_processes_plugin.model.response_models import (
+    SimpleStatusCodeResponseModel,
+)
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+CBOR = "application/cbor"
+
+# values of the `f` query parameter
+FORMATS = {"json": JSON, "msgpack": MSGPACK, "cbor": CBOR}
+
+# media types sent by older MessagePack clients
+_ALIASES = {
+    "application/x-msgpack": MSGPACK,
+    "application/vnd.msgpack": MSGPACK,
+}
+
+
+def available_media_types() -> list:
+    """Return the media types which can be encoded, JSON first."""
+    media_types = [JSON]
+    if msgpack is not None:
+        media_types.append(MSGPACK)
+    if cbor2 is not None:
+        media_types.append(CBOR)
+    return media_types
+
+
+def negotiate_media_type() -> str | None:
+    """Return the media type of the response for the current request.
+
+    The `f` query parameter takes precedence over the Accept header. JSON
+    is returned if nothing else was asked for (unknown `f` values and Accept
+    headers without a supported binary media type included). Returns None if
+    a binary encoding was requested with `f` whose library is not
+    installed.
+    """
+    available = available_media_types()
+    fmt = request.args.get("f")
+    if fmt and fmt.lower() in FORMATS:
+        media_type = FORMATS[fmt.lower()]
+        return media_type if media_type in available else None
+
+    accept = request.accept_mimetypes
+    if not accept:
+        return JSON
+    offers = available + [
+        alias for alias, target in _ALIASES.items() if target in available
+    ]
+    best = accept.best_match(offers, default=JSON)
+    return _ALIASES.get(best, best)
+
+
+def format_href(fmt: str, href: str | None = None) -> str:
+    """Return the URL of the current request in the format `fmt`.
+
+    The `f` query parameter of the request is replaced, other parameters
+    are kept. Outside of a request `href` is used instead.
+    """
+    if href is not None:
+        return f"{href}?f={fmt}"
+    args = request.args.copy()
+    args["f"] = fmt
+    return f"{request.base_url}?{urlencode(list(args.items(multi=True)))}"
+
+
+def alternate_links(href: str | None = None, media_type: str = JSON) -> list:
+    """Return `alternate` links to the current request in other media types.
+
+    See `format_href` for `href`.
+    """
+    return [
+        {"href": format_href(fmt, href), "rel": "alternate", "type": other}
+        for fmt, other in FORMATS.items()
+        if other != media_type and other in available_media_types()
+    ]
+
+
+def encode(obj, media_type: str) -> bytes:
+    """Encode `obj` (JSON compatible types) in a binary media type."""
+    if media_type == MSGPACK:
+        return msgpack.packb(obj, use_bin_type=True)
+    if media_type == CBOR:
+        return cbor2.dumps(obj)
+    msg = f"Unsupported media type {media_type}"
+    raise ValueError(msg)
+
+
+def make_encoded_response(obj, media_type: str | None, status: int = 200):
+    """Return a response with `obj` encoded in `media_type`.
+
+    Binary encodings are created directly from `obj` without a JSON
+    document in between.
+    """
+    if media_type in {MSGPACK, CBOR}:
+        res = make_response(encode(obj, media_type), status)
+        res.mimetype = media_type
+    else:
+        res = make_response(jsonify(obj), status)
+    res.vary.add("Accept")
+    return res
+
+
+def not_acceptable_response():
+    """Return a 406 response for a requested but unavailable encoding."""
+    res = jsonify(
+        SimpleStatusCodeResponseModel(
+            status=406,
+            message=(
+                "ERROR: Requested format is not available, supported are "
+                + ", ".join(available_media_types())
+            ),
+        ),
+    )
+    return make_response(res, 406)
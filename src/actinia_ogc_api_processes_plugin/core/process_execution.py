@@ -18,6 +18,14 @@ import requests
 from flask import has_request_context, jsonify, make_response, request
 from requests.auth import HTTPBasicAuth
 
+from actinia_ogc_api_processes_plugin.core.actinia_common import (
+    parse_actinia_job_id,
+)
+from actinia_ogc_api_processes_plugin.core.job_callbacks import (
+    parse_subscriber,
+    register_callbacks,
+)
+from actinia_ogc_api_processes_plugin.core.known_jobs import remember_job
 from actinia_ogc_api_processes_plugin.model.response_models import (
     SimpleStatusCodeResponseModel,
 )
@@ -389,6 +397,15 @@ def _check_input_by_reference(postbody: dict) -> dict:
         return None
 
 
+def _started_job_id(resp) -> str | None:
+    """Return the id of the job started by an execute response or None."""
+    try:
+        data = resp.json()
+    except ValueError:
+        return None
+    return parse_actinia_job_id(data) if isinstance(data, dict) else None
+
+
 def post_process_execution(
     process_id: str | None = None,
     postbody: dict | None = None,
@@ -404,6 +421,18 @@ def post_process_execution(
             },
         )
         return make_response(res, 400)
+    try:
+        subscriber = parse_subscriber(postbody.get("subscriber"))
+    except ValueError as e:
+        res = jsonify(
+            {
+                "type": "InvalidRequestBody",
+                "title": "Invalid subscriber",
+                "status": 400,
+                "detail": str(e),
+            },
+        )
+        return make_response(res, 400)
 
     # Authentication for actinia
     auth = request.authorization
@@ -533,7 +562,13 @@ def post_process_execution(
         "processing_export"
     )
 
-    return requests.post(
+    resp = requests.post(
         url_process_execution,
         **kwargs,
     )
+    job_id = _started_job_id(resp) if resp.status_code == 200 else None
+    if job_id:
+        remember_job(job_id, new=True)
+        if subscriber:
+            register_callbacks(job_id, subscriber)
+    return resp
@@ -15,17 +15,42 @@ __maintainer__ = "mundialis GmbH & Co. KG"
 import json
 
 import requests
-from flask import jsonify, request
+from flask import request
 from requests.auth import HTTPBasicAuth
 
+from actinia_ogc_api_processes_plugin.core.media_types import (
+    alternate_links,
+    format_href,
+)
 from actinia_ogc_api_processes_plugin.resources.config import ACTINIA
 from actinia_ogc_api_processes_plugin.resources.logging import log
 
+# members of a process summary in the order they are returned
+PROCESS_SUMMARY_FIELDS = ("id", "version", "description", "keywords")
 
-def get_modules(limit: int | None = None):
+
+def _process_summary(el: dict, version: str | None, fields=None) -> dict:
+    """Return the process summary of an actinia module.
+
+    If `fields` is given, only these members are included.
+    """
+    summary = {
+        "id": el["id"],
+        "version": version,
+        "description": el["description"],
+        "keywords": el["categories"],
+    }
+    if fields is None:
+        return summary
+    return {k: summary[k] for k in PROCESS_SUMMARY_FIELDS if k in fields}
+
+
+def get_modules(limit: int | None = None, fields=None):
     """Get all modules (for current user).
 
-    All grass-modules and actinia-modules and format them
+    All grass-modules and actinia-modules and format them.
+    If `fields` is given, the process summaries are projected to them and
+    the GRASS version is only requested if `version` is included.
     """
     # Authentication for actinia
     auth = request.authorization
@@ -60,21 +85,18 @@ def get_modules(limit: int | None = None):
         # -- actinia modules
         for el in json.loads(resp_actinia_modules.text)["processes"]:
             resp_format["processes"].append(
-                {
-                    "id": el["id"],
-                    # TODO: when implemented in actinia module plugin:
-                    # use version of actinia module template
-                    "version": "1.0.0",
-                    "description": el["description"],
-                    "keywords": el["categories"],
-                },
+                # TODO: when implemented in actinia module plugin:
+                # use version of actinia module template
+                _process_summary(el, "1.0.0", fields),
             )
         # -- grass modules
-        url_version = f"{ACTINIA.processing_base_url}/version"
-        resp_version = requests.get(url_version)
-        grass_version = json.loads(resp_version.text)["grass_version"][
-            "version"
-        ]
+        grass_version = None
+        if fields is None or "version" in fields:
+            url_version = f"{ACTINIA.processing_base_url}/version"
+            resp_version = requests.get(url_version)
+            grass_version = json.loads(resp_version.text)["grass_version"][
+                "version"
+            ]
         for el in json.loads(resp_grass_modules.text)["processes"]:
             if not (
                 el["id"].startswith("d.")
@@ -83,14 +105,9 @@ def get_modules(limit: int | None = None):
             ):
                 continue
             resp_format["processes"].append(
-                {
-                    "id": el["id"],
-                    # TODO: for non-official GRASS Addons:
-                    # any better version than grass_version?
-                    "version": grass_version,
-                    "description": el["description"],
-                    "keywords": el["categories"],
-                },
+                # TODO: for non-official GRASS Addons:
+                # any better version than grass_version?
+                _process_summary(el, grass_version, fields),
             )
         if limit is not None:
             # TODO: use limit from actinia-module-plugin when implemented
@@ -99,17 +116,17 @@ def get_modules(limit: int | None = None):
         # required: href (string)
         resp_format["links"].append(
             {
-                "href": f"{request.url}?f=json",
+                "href": format_href("json"),
                 "rel": "self",
                 "type": "application/json",
             },
-            # Additional: a link to the response document
-            # in every other media type supported by the service
-            # (relation: alternate)
-            # NOTE: until now only json supported
         )
+        # Additional: a link to the response document
+        # in every other media type supported by the service
+        # (relation: alternate)
+        resp_format["links"] += alternate_links()
         return (
-            jsonify(resp_format),
+            resp_format,
             resp_grass_modules.status_code,
             resp_actinia_modules.status_code,
         )
@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Range requests of result files.
+
+Ranges are forwarded to actinia. If actinia ignores them, the result file is
+downloaded once into a local cache (`JOBRESULTS.range_cache_dir`) and the
+ranges are read from the cached copy.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+
+from flask import Response, request
+from werkzeug.http import (
+    parse_date,
+    parse_if_range_header,
+    parse_range_header,
+    unquote_etag,
+)
+
+from actinia_ogc_api_processes_plugin.authentication import credentials_key
+from actinia_ogc_api_processes_plugin.resources.config import JOBRESULTS
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+# headers of actinia which describe the result file
+VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+
+# serializes the eviction of cached files within a worker
+_EVICT_LOCK = threading.Lock()
+
+
+def _cache_dir() -> Path | None:
+    """Return the directory of the cached result files or None.
+
+    The directory is only accessible by the user of the worker. None is
+    returned if it cannot be created or belongs to another user.
+    """
+    path = Path(
+        JOBRESULTS.range_cache_dir
+        or Path(tempfile.gettempdir()) / "actinia-ogc-results",
+    )
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if path.stat().st_uid != os.getuid():
+            log.error(f"Result cache {path} belongs to another user")
+            return None
+        path.chmod(0o700)
+    except OSError as e:
+        log.error(f"Result cache {path} is not available: {e}")
+        return None
+    return path
+
+
+def _meta_path(path: Path) -> Path:
+    """Return the path of the metadata of a cached copy."""
+    return path.with_name(f"{path.name}.json")
+
+
+def _cache_path(url: str) -> Path | None:
+    """Return the path of the cached copy of a result of the current user.
+
+    The credentials are part of the name, so other users (and wrong
+    credentials) never read the copy. Returns None without cache directory.
+    """
+    directory = _cache_dir()
+    if directory is None:
+        return None
+    name = hashlib.sha256(f"{credentials_key()}\n{url}".encode()).hexdigest()
+    return directory / name
+
+
+def cached_result(url: str) -> tuple | None:
+    """Return (open file, metadata) of the cached copy of a result or None.
+
+    The file stays readable if the copy is evicted in the meantime.
+    """
+    if JOBRESULTS.range_cache_size <= 0:
+        return None
+    path = _cache_path(url)
+    if path is None:
+        return None
+    try:
+        meta = json.loads(_meta_path(path).read_text())
+        data_file = path.open("rb")
+    except (OSError, ValueError):
+        return None
+    try:
+        # the modification time orders the copies for the eviction
+        path.touch()
+    except OSError:
+        pass
+    return data_file, meta
+
+
+def _evict(directory: Path) -> None:
+    """Remove the least recently used copies beyond the cache size."""
+    with _EVICT_LOCK:
+        entries = []
+        for path in directory.iterdir():
+            if path.suffix in {".json", ".tmp"}:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _mtime, size, _path in entries)
+        for _mtime, size, path in sorted(entries):
+            if total <= JOBRESULTS.range_cache_size:
+                break
+            _meta_path(path).unlink(missing_ok=True)
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def cache_result(url: str, upstream, content_type: str) -> tuple | None:
+    """Download a complete actinia result response into the cache.
+
+    Returns (open file, metadata) of the cached copy, or None if caching is
+    disabled or the length of the file is unknown or larger than the
+    cache. Then `upstream` is not read.
+    """
+    length = upstream.headers.get("Content-Length")
+    if (
+        JOBRESULTS.range_cache_size <= 0
+        or not length
+        or upstream.headers.get("Content-Encoding")
+        or int(length) > JOBRESULTS.range_cache_size
+    ):
+        return None
+    path = _cache_path(url)
+    if path is None:
+        return None
+    meta = {
+        "length": int(length),
+        "type": content_type,
+        **{
+            name: upstream.headers[name]
+            for name in VALIDATOR_HEADERS
+            if upstream.headers.get(name)
+        },
+    }
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp_meta = tmp.with_suffix(".json")
+    try:
+        size = 0
+        with tmp.open("wb") as data_file:
+            for chunk in upstream.iter_content(JOBRESULTS.stream_chunk_size):
+                data_file.write(chunk)
+                size += len(chunk)
+        if size != meta["length"]:
+            log.warning(f"Incomplete download of {url} is not cached")
+            tmp.unlink()
+            return None
+        tmp_meta.write_text(json.dumps(meta))
+        tmp.replace(path)
+        tmp_meta.replace(_meta_path(path))
+        data_file = path.open("rb")
+    except OSError as e:
+        log.warning(f"Result {url} could not be cached: {e}")
+        tmp.unlink(missing_ok=True)
+        tmp_meta.unlink(missing_ok=True)
+        return None
+    finally:
+        upstream.close()
+    _evict(path.parent)
+    return data_file, meta
+
+
+def _if_range_matches(meta: dict) -> bool:
+    """Return False if the If-Range header does not match the file."""
+    value = request.headers.get("If-Range")
+    if not value:
+        return True
+    if_range = parse_if_range_header(value)
+    if if_range.etag is not None:
+        etag = meta.get("ETag")
+        # If-Range requires a strong comparison
+        if not etag or value.startswith("W/"):
+            return False
+        etag, weak = unquote_etag(etag)
+        return not weak and etag == if_range.etag
+    last_modified = parse_date(meta.get("Last-Modified"))
+    return last_modified is not None and last_modified == if_range.date
+
+
+def _iter_file(data_file, ranges: list, boundary=None, parts=()):
+    """Yield byte ranges of a file, as multipart body with a boundary.
+
+    The file is closed at the end.
+    """
+    with data_file:
+        for i, (start, stop) in enumerate(ranges):
+            if boundary is not None:
+                yield parts[i]
+            data_file.seek(start)
+            remaining = stop - start
+            while remaining > 0:
+                chunk = data_file.read(
+                    min(JOBRESULTS.stream_chunk_size, remaining),
+                )
+                if not chunk:
+                    return
+                remaining -= len(chunk)
+                yield chunk
+        if boundary is not None:
+            yield f"\r\n--{boundary}--\r\n".encode()
+
+
+def range_response(data_file, meta: dict, status_code: int) -> Response:
+    """Return the ranges of the Range header read from a cached result.
+
+    Single ranges are answered with 206 and Content-Range, several ranges
+    as multipart/byteranges. If If-Range does not match or the Range header
+    is invalid, the complete file is returned with `status_code`.
+    Unsatisfiable ranges are answered with 416.
+    """
+    length = meta["length"]
+    headers = {
+        "Accept-Ranges": "bytes",
+        **{name: meta[name] for name in VALIDATOR_HEADERS if name in meta},
+    }
+    parsed = parse_range_header(request.headers.get("Range"))
+    if (
+        parsed is None
+        or parsed.units != "bytes"
+        or not _if_range_matches(meta)
+    ):
+        headers["Content-Length"] = str(length)
+        return Response(
+            _iter_file(data_file, [(0, length)]),
+            status=status_code,
+            content_type=meta["type"],
+            headers=headers,
+        )
+    ranges = []
+    for start, stop in parsed.ranges:
+        if start < 0:
+            start, stop = max(0, length + start), length
+        else:
+            stop = length if stop is None else min(stop, length)
+        if start < stop:
+            ranges.append((start, stop))
+    if not ranges:
+        data_file.close()
+        headers["Content-Range"] = f"bytes */{length}"
+        return Response("", status=416, headers=headers)
+    if len(ranges) == 1:
+        start, stop = ranges[0]
+        headers["Content-Range"] = f"bytes {start}-{stop - 1}/{length}"
+        headers["Content-Length"] = str(stop - start)
+        return Response(
+            _iter_file(data_file, ranges),
+            status=206,
+            content_type=meta["type"],
+            headers=headers,
+        )
+    boundary = uuid.uuid4().hex
+    parts = [
+        (
+            f"\r\n--{boundary}\r\nContent-Type: {meta['type']}\r\n"
+            f"Content-Range: bytes {start}-{stop - 1}/{length}\r\n\r\n"
+        ).encode()
+        for start, stop in ranges
+    ]
+    headers["Content-Length"] = str(
+        sum(len(part) for part in parts)
+        + sum(stop - start for start, stop in ranges)
+        + len(f"\r\n--{boundary}--\r\n"),
+    )
+    return Response(
+        _iter_file(data_file, ranges, boundary, parts),
+        status=206,
+        content_type=f"multipart/byteranges; boundary={boundary}",
+        headers=headers,
+    )
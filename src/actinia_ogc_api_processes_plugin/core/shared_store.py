@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Optional valkey database shared by all workers (`SHARED.url`).
+
+Without it the state of the plugin (cached jobs, tombstones of hidden jobs)
+is only kept per worker.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+import functools
+
+from actinia_ogc_api_processes_plugin.resources.config import SHARED
+from actinia_ogc_api_processes_plugin.resources.logging import log
+
+try:
+    import valkey
+except ImportError:
+    valkey = None
+
+KEY_PREFIX = "actinia-ogc"
+
+
+@functools.cache
+def shared_client():
+    """Return the client of the shared database or None."""
+    if not SHARED.url:
+        return None
+    if valkey is None:
+        log.warning(
+            "SHARED url is set, but valkey is not installed; the state is "
+            "only kept per worker",
+        )
+        return None
+    if not SHARED.secret:
+        log.error(
+            "SHARED url is set without a secret, the keys of the workers "
+            "differ; the state is only kept per worker",
+        )
+        return None
+    return valkey.Valkey.from_url(
+        SHARED.url,
+        socket_timeout=SHARED.timeout,
+        socket_connect_timeout=SHARED.timeout,
+    )
+
+
+def is_shared() -> bool:
+    """Return True if there is a shared database."""
+    return shared_client() is not None
+
+
+def shared_key(*parts: str) -> str:
+    """Return a key in the shared database."""
+    return ":".join((KEY_PREFIX, *parts))
+
+
+def shared(method: str, *args):
+    """Call a method of the shared database client.
+
+    Returns None if there is no shared database; errors are logged, not
+    raised.
+    """
+    client = shared_client()
+    if client is None:
+        return None
+    try:
+        return getattr(client, method)(*args)
+    except valkey.exceptions.ValkeyError as e:
+        log.warning(f"Shared database not available: {e}")
+        return None
+
+
+def shared_transaction(*calls) -> list | None:
+    """Execute `calls`, tuples (method, *args), in one transaction.
+
+    Returns the list of the results or None (see `shared`).
+    """
+    client = shared_client()
+    if client is None:
+        return None
+    pipe = client.pipeline(transaction=True)
+    for method, *args in calls:
+        getattr(pipe, method)(*args)
+    try:
+        return pipe.execute()
+    except valkey.exceptions.ValkeyError as e:
+        log.warning(f"Shared database not available: {e}")
+        return None
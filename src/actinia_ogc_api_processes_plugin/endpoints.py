@@ -14,8 +14,18 @@ __maintainer__ = "mundialis GmbH & Co. KG"
 from flask_restful_swagger_2 import Api
 
 from actinia_ogc_api_processes_plugin.api.conformance import Conformance
+from actinia_ogc_api_processes_plugin.api.job_batch_status import (
+    JobBatchStatus,
+)
+from actinia_ogc_api_processes_plugin.api.job_dismiss import JobDismiss
+from actinia_ogc_api_processes_plugin.api.job_events import (
+    JobEvents,
+    JobListEvents,
+)
 from actinia_ogc_api_processes_plugin.api.job_list import JobList
+from actinia_ogc_api_processes_plugin.api.job_logs import JobLogs
 from actinia_ogc_api_processes_plugin.api.job_results import JobResults
+from actinia_ogc_api_processes_plugin.api.job_stats import JobStats
 from actinia_ogc_api_processes_plugin.api.job_status_info import JobStatusInfo
 from actinia_ogc_api_processes_plugin.api.landing_page import LandingPage
 from actinia_ogc_api_processes_plugin.api.process_description import (
@@ -41,9 +51,15 @@ def create_endpoints(flask_api: Api) -> None:
         return app.test_client().get("/api.json")
 
     apidoc.add_resource(JobResults, "/jobs/<string:job_id>/results")
+    apidoc.add_resource(JobEvents, "/jobs/<string:job_id>/events")
+    apidoc.add_resource(JobLogs, "/jobs/<string:job_id>/logs")
     apidoc.add_resource(LandingPage, "/")
     apidoc.add_resource(Conformance, "/conformance")
     apidoc.add_resource(JobList, "/jobs")
+    apidoc.add_resource(JobStats, "/jobs/stats")
+    apidoc.add_resource(JobDismiss, "/jobs/dismiss")
+    apidoc.add_resource(JobBatchStatus, "/jobs/status")
+    apidoc.add_resource(JobListEvents, "/jobs/events")
     apidoc.add_resource(JobStatusInfo, "/jobs/<string:job_id>")
     apidoc.add_resource(ProcessList, "/processes")
     apidoc.add_resource(ProcessDescription, "/processes/<string:process_id>")
@@ -65,6 +65,7 @@ class StatusInfoResponseModel(Schema):
         "finished": {"type": "string", "format": "date-time"},
         "updated": {"type": "string", "format": "date-time"},
         "progress": {"type": "integer", "minimum": 0, "maximum": 100},
+        "estimatedCompletion": {"type": "string", "format": "date-time"},
         "links": {
             "type": "array",
             "items": {
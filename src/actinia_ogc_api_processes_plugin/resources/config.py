@@ -33,6 +33,192 @@ class ACTINIA:
     default_project = "nc_spm_08"
 
 
+class JOBLIST:
+    """Default config for job list retrieval."""
+
+    # When local filters are requested, actinia is asked for
+    # `limit * overfetch_factor` jobs, growing by the same factor until
+    # `limit` matches are found or the upstream list is exhausted
+    overfetch_factor = 2
+    # maximum number of upstream jobs scanned for one filtered job list
+    max_scan = 20000
+    # minimum number of upstream jobs for which datetime and duration
+    # filters are evaluated vectorized with NumPy (if installed)
+    bulk_threshold = 1000
+    # number of parsed and serialized jobs in a terminal state (finished,
+    # error, terminated) kept per worker to assemble job lists
+    terminal_cache_size = 20000
+    # seconds for which /jobs/stats results are cached per user
+    stats_ttl = 10
+    # parse actinia job lists incrementally while they are downloaded,
+    # keeping only the fields needed for the job list
+    stream_parse = True
+    # size in bytes of the chunks read from the actinia job list response
+    stream_chunk_size = 65536
+    # maximum number of cancel requests sent to actinia at the same time by
+    # POST /jobs/dismiss
+    dismiss_concurrency = 8
+    # maximum number of jobs dismissed with one POST /jobs/dismiss
+    dismiss_max_jobs = 1000
+
+
+class JOBSTATUS:
+    """Default config for job status requests."""
+
+    # maximum number of seconds GET /jobs/{jobId}?wait= waits for a change
+    max_wait = 30
+    # first and maximum number of seconds between two actinia requests
+    # while waiting; the interval is doubled after each unchanged response
+    wait_min_interval = 0.5
+    wait_max_interval = 4.0
+    # jobs are polled every `poll_age_factor` times their age in seconds
+    # (within the intervals above), but not later than their end estimated
+    # from their progress
+    poll_age_factor = 0.05
+    # number of progress samples kept per running job and number of running
+    # jobs for which samples are kept, to estimate their completion
+    progress_samples = 8
+    progress_jobs = 10000
+    # bounds of the Retry-After and Cache-Control max-age hints in seconds
+    # of the statusInfo of running jobs
+    retry_after_min = 1
+    retry_after_max = 60
+    # number of last known statusInfo (per user and job) kept per worker,
+    # which are returned while actinia is not available if they are not
+    # older than `stale_max_age` seconds, with a Retry-After of
+    # `stale_retry_after` seconds
+    last_known_size = 10000
+    stale_max_age = 3600
+    stale_retry_after = 30
+    # number of statusInfo and results documents of jobs in a final state
+    # cached per worker, and seconds they are kept in the shared database
+    # (see SHARED)
+    terminal_cache_size = 10000
+    terminal_cache_ttl = 86400
+    # seconds for which the Bloom filter of the known job ids of a user,
+    # rebuilt from the complete job list, is trusted: requests for job ids
+    # which are certainly unknown are answered with 404 without asking
+    # actinia; afterwards it is rebuilt in the background. 0 disables it.
+    # It is only used with the shared database (see SHARED), which holds
+    # the jobs started through other workers. Jobs created directly in
+    # actinia are only known after the next rebuild, so keep the time
+    # short then. `known_jobs_error_rate` is the false positive rate of
+    # the filter.
+    known_jobs_ttl = 0
+    known_jobs_error_rate = 0.01
+    # minimum number of seconds between two job list requests for the
+    # events of all jobs of a user (/jobs/events)
+    events_list_interval = 5.0
+    # number of seconds after which an idle event stream sends a comment
+    events_heartbeat = 15
+    # number of seconds after which an event stream is closed; clients
+    # reconnect after `events_retry` seconds
+    events_max_duration = 300
+    events_retry = 5
+    # maximum number of requests per worker waiting for changes at the same
+    # time (?wait=, event and log streams). Each of them holds a thread of
+    # the worker, so keep it below the number of threads (gunicorn
+    # --threads) to leave threads for other requests. Further streams are
+    # answered with 503 and a Retry-After of `events_retry` seconds,
+    # further ?wait= requests are answered without waiting.
+    max_streams = 16
+    # maximum number of actinia requests sent at the same time by
+    # POST /jobs/status
+    batch_concurrency = 8
+    # maximum number of jobs requested with one POST /jobs/status
+    batch_max_jobs = 1000
+
+
+class JOBRESULTS:
+    """Default config for job results requests."""
+
+    # size in bytes of the chunks in which result files are passed through
+    # from actinia (per download only one chunk is held in memory)
+    stream_chunk_size = 65536
+    # directory and maximum size in bytes of the local copies of result
+    # files from which Range requests are answered if actinia ignores
+    # ranges (per worker host; defaults to a directory in the temporary
+    # directory, a size of 0 disables the copies)
+    range_cache_dir = None
+    range_cache_size = 1073741824
+
+
+class VALKEY:
+    """Default config for reading jobs from the valkey database of actinia."""
+
+    # URL of the valkey database of actinia, e.g. valkey://valkey:6379/0;
+    # if set, jobs and job lists are read from it instead of the actinia
+    # API (requires the python package valkey)
+    url = None
+    # maximum number of connections to valkey per worker and seconds after
+    # which a valkey request fails (jobs are requested from actinia then)
+    max_connections = 16
+    timeout = 2.0
+    # number of keys scanned and jobs fetched per round trip for job lists
+    scan_count = 500
+    # seconds for which verified credentials are trusted
+    auth_ttl = 60
+
+
+class SHARED:
+    """Default config for the database shared by all workers."""
+
+    # optional valkey (or redis) URL of a database shared by all workers,
+    # e.g. valkey://valkey:6379/1, and the timeout in seconds of its
+    # requests (requires the python package valkey). It holds the cache of
+    # jobs in a final state and the tombstones of hidden jobs, which are
+    # otherwise only kept per worker.
+    url = None
+    timeout = 0.5
+    # secret key of the keys identifying the credentials of a user (HMAC of
+    # user and password) in the shared database and the result cache. It
+    # has to be the same for all workers and is required for the shared
+    # database; without it each worker uses a random key.
+    secret = None
+
+
+class CALLBACKS:
+    """Default config for the callbacks of a subscriber of a job."""
+
+    # maximum number of callback requests sent at the same time
+    workers = 4
+    # maximum number of callbacks waiting to be sent, further ones are
+    # dropped
+    max_pending = 10000
+    # attempts per callback; the delay in seconds between two attempts is
+    # doubled after each failure up to `max_retry_delay`
+    max_attempts = 5
+    retry_delay = 1.0
+    max_retry_delay = 60.0
+    # timeout in seconds of a callback request
+    timeout = 10
+    # hosts callbacks can be sent to; if empty, callbacks are only sent to
+    # hosts with public addresses (not private, loopback, link-local, ...)
+    allowed_hosts = ()
+
+
+class RETENTION:
+    """Default config for hiding old jobs."""
+
+    # hide jobs matching the rules below in the background; hidden jobs are
+    # left out of job lists and answered with 404, but not deleted in
+    # actinia (there is no endpoint for it)
+    enabled = False
+    # jobs whose last update is older than this number of seconds are hidden
+    # (0: no age limit)
+    max_age = 2592000
+    # number of jobs kept per user, older ones are hidden (0: no limit);
+    # not applied to users with more than `JOBLIST.max_scan` jobs
+    max_count = 0
+    # OGC states of the jobs which can be hidden, only final states are used
+    states = ("successful", "failed", "dismissed")
+    # minimum number of seconds between two retention runs for a user
+    interval = 3600
+    # number of hidden job ids remembered per user to answer with 404
+    # without asking actinia
+    max_tombstones = 100000
+
+
 class LOGCONFIG:
     """Default config for logging."""
 
@@ -92,6 +278,255 @@ class Configfile:
                     "default_project",
                 )
 
+        # JOBLIST
+        if config.has_section("JOBLIST"):
+            if config.has_option("JOBLIST", "overfetch_factor"):
+                JOBLIST.overfetch_factor = config.getint(
+                    "JOBLIST",
+                    "overfetch_factor",
+                )
+            if config.has_option("JOBLIST", "max_scan"):
+                JOBLIST.max_scan = config.getint("JOBLIST", "max_scan")
+            if config.has_option("JOBLIST", "bulk_threshold"):
+                JOBLIST.bulk_threshold = config.getint(
+                    "JOBLIST",
+                    "bulk_threshold",
+                )
+            if config.has_option("JOBLIST", "terminal_cache_size"):
+                JOBLIST.terminal_cache_size = config.getint(
+                    "JOBLIST",
+                    "terminal_cache_size",
+                )
+            if config.has_option("JOBLIST", "stats_ttl"):
+                JOBLIST.stats_ttl = config.getint("JOBLIST", "stats_ttl")
+            if config.has_option("JOBLIST", "stream_parse"):
+                JOBLIST.stream_parse = config.getboolean(
+                    "JOBLIST",
+                    "stream_parse",
+                )
+            if config.has_option("JOBLIST", "stream_chunk_size"):
+                JOBLIST.stream_chunk_size = config.getint(
+                    "JOBLIST",
+                    "stream_chunk_size",
+                )
+            if config.has_option("JOBLIST", "dismiss_concurrency"):
+                JOBLIST.dismiss_concurrency = config.getint(
+                    "JOBLIST",
+                    "dismiss_concurrency",
+                )
+            if config.has_option("JOBLIST", "dismiss_max_jobs"):
+                JOBLIST.dismiss_max_jobs = config.getint(
+                    "JOBLIST",
+                    "dismiss_max_jobs",
+                )
+
+        # JOBSTATUS
+        if config.has_section("JOBSTATUS"):
+            if config.has_option("JOBSTATUS", "max_wait"):
+                JOBSTATUS.max_wait = config.getint("JOBSTATUS", "max_wait")
+            if config.has_option("JOBSTATUS", "wait_min_interval"):
+                JOBSTATUS.wait_min_interval = config.getfloat(
+                    "JOBSTATUS",
+                    "wait_min_interval",
+                )
+            if config.has_option("JOBSTATUS", "wait_max_interval"):
+                JOBSTATUS.wait_max_interval = config.getfloat(
+                    "JOBSTATUS",
+                    "wait_max_interval",
+                )
+            if config.has_option("JOBSTATUS", "poll_age_factor"):
+                JOBSTATUS.poll_age_factor = config.getfloat(
+                    "JOBSTATUS",
+                    "poll_age_factor",
+                )
+            if config.has_option("JOBSTATUS", "progress_samples"):
+                JOBSTATUS.progress_samples = config.getint(
+                    "JOBSTATUS",
+                    "progress_samples",
+                )
+            if config.has_option("JOBSTATUS", "progress_jobs"):
+                JOBSTATUS.progress_jobs = config.getint(
+                    "JOBSTATUS",
+                    "progress_jobs",
+                )
+            if config.has_option("JOBSTATUS", "retry_after_min"):
+                JOBSTATUS.retry_after_min = config.getint(
+                    "JOBSTATUS",
+                    "retry_after_min",
+                )
+            if config.has_option("JOBSTATUS", "retry_after_max"):
+                JOBSTATUS.retry_after_max = config.getint(
+                    "JOBSTATUS",
+                    "retry_after_max",
+                )
+            if config.has_option("JOBSTATUS", "last_known_size"):
+                JOBSTATUS.last_known_size = config.getint(
+                    "JOBSTATUS",
+                    "last_known_size",
+                )
+            if config.has_option("JOBSTATUS", "stale_max_age"):
+                JOBSTATUS.stale_max_age = config.getint(
+                    "JOBSTATUS",
+                    "stale_max_age",
+                )
+            if config.has_option("JOBSTATUS", "stale_retry_after"):
+                JOBSTATUS.stale_retry_after = config.getint(
+                    "JOBSTATUS",
+                    "stale_retry_after",
+                )
+            if config.has_option("JOBSTATUS", "terminal_cache_size"):
+                JOBSTATUS.terminal_cache_size = config.getint(
+                    "JOBSTATUS",
+                    "terminal_cache_size",
+                )
+            if config.has_option("JOBSTATUS", "terminal_cache_ttl"):
+                JOBSTATUS.terminal_cache_ttl = config.getint(
+                    "JOBSTATUS",
+                    "terminal_cache_ttl",
+                )
+            if config.has_option("JOBSTATUS", "known_jobs_ttl"):
+                JOBSTATUS.known_jobs_ttl = config.getint(
+                    "JOBSTATUS",
+                    "known_jobs_ttl",
+                )
+            if config.has_option("JOBSTATUS", "known_jobs_error_rate"):
+                JOBSTATUS.known_jobs_error_rate = config.getfloat(
+                    "JOBSTATUS",
+                    "known_jobs_error_rate",
+                )
+            if config.has_option("JOBSTATUS", "events_list_interval"):
+                JOBSTATUS.events_list_interval = config.getfloat(
+                    "JOBSTATUS",
+                    "events_list_interval",
+                )
+            if config.has_option("JOBSTATUS", "events_heartbeat"):
+                JOBSTATUS.events_heartbeat = config.getint(
+                    "JOBSTATUS",
+                    "events_heartbeat",
+                )
+            if config.has_option("JOBSTATUS", "events_max_duration"):
+                JOBSTATUS.events_max_duration = config.getint(
+                    "JOBSTATUS",
+                    "events_max_duration",
+                )
+            if config.has_option("JOBSTATUS", "events_retry"):
+                JOBSTATUS.events_retry = config.getint(
+                    "JOBSTATUS",
+                    "events_retry",
+                )
+            if config.has_option("JOBSTATUS", "max_streams"):
+                JOBSTATUS.max_streams = config.getint(
+                    "JOBSTATUS",
+                    "max_streams",
+                )
+            if config.has_option("JOBSTATUS", "batch_concurrency"):
+                JOBSTATUS.batch_concurrency = config.getint(
+                    "JOBSTATUS",
+                    "batch_concurrency",
+                )
+            if config.has_option("JOBSTATUS", "batch_max_jobs"):
+                JOBSTATUS.batch_max_jobs = config.getint(
+                    "JOBSTATUS",
+                    "batch_max_jobs",
+                )
+
+        # JOBRESULTS
+        if config.has_section("JOBRESULTS"):
+            if config.has_option("JOBRESULTS", "stream_chunk_size"):
+                JOBRESULTS.stream_chunk_size = config.getint(
+                    "JOBRESULTS",
+                    "stream_chunk_size",
+                )
+            if config.has_option("JOBRESULTS", "range_cache_dir"):
+                JOBRESULTS.range_cache_dir = config.get(
+                    "JOBRESULTS",
+                    "range_cache_dir",
+                )
+            if config.has_option("JOBRESULTS", "range_cache_size"):
+                JOBRESULTS.range_cache_size = config.getint(
+                    "JOBRESULTS",
+                    "range_cache_size",
+                )
+
+        # VALKEY
+        if config.has_section("VALKEY"):
+            if config.has_option("VALKEY", "url"):
+                VALKEY.url = config.get("VALKEY", "url")
+            if config.has_option("VALKEY", "max_connections"):
+                VALKEY.max_connections = config.getint(
+                    "VALKEY",
+                    "max_connections",
+                )
+            if config.has_option("VALKEY", "timeout"):
+                VALKEY.timeout = config.getfloat("VALKEY", "timeout")
+            if config.has_option("VALKEY", "scan_count"):
+                VALKEY.scan_count = config.getint("VALKEY", "scan_count")
+            if config.has_option("VALKEY", "auth_ttl"):
+                VALKEY.auth_ttl = config.getint("VALKEY", "auth_ttl")
+
+        # SHARED
+        if config.has_section("SHARED"):
+            if config.has_option("SHARED", "url"):
+                SHARED.url = config.get("SHARED", "url")
+            if config.has_option("SHARED", "timeout"):
+                SHARED.timeout = config.getfloat("SHARED", "timeout")
+            if config.has_option("SHARED", "secret"):
+                SHARED.secret = config.get("SHARED", "secret")
+
+        # CALLBACKS
+        if config.has_section("CALLBACKS"):
+            if config.has_option("CALLBACKS", "workers"):
+                CALLBACKS.workers = config.getint("CALLBACKS", "workers")
+            if config.has_option("CALLBACKS", "max_pending"):
+                CALLBACKS.max_pending = config.getint(
+                    "CALLBACKS",
+                    "max_pending",
+                )
+            if config.has_option("CALLBACKS", "max_attempts"):
+                CALLBACKS.max_attempts = config.getint(
+                    "CALLBACKS",
+                    "max_attempts",
+                )
+            if config.has_option("CALLBACKS", "retry_delay"):
+                CALLBACKS.retry_delay = config.getfloat(
+                    "CALLBACKS",
+                    "retry_delay",
+                )
+            if config.has_option("CALLBACKS", "max_retry_delay"):
+                CALLBACKS.max_retry_delay = config.getfloat(
+                    "CALLBACKS",
+                    "max_retry_delay",
+                )
+            if config.has_option("CALLBACKS", "timeout"):
+                CALLBACKS.timeout = config.getint("CALLBACKS", "timeout")
+            if config.has_option("CALLBACKS", "allowed_hosts"):
+                hosts = config.get("CALLBACKS", "allowed_hosts")
+                CALLBACKS.allowed_hosts = tuple(
+                    h.strip() for h in hosts.split(",") if h.strip()
+                )
+
+        # RETENTION
+        if config.has_section("RETENTION"):
+            if config.has_option("RETENTION", "enabled"):
+                RETENTION.enabled = config.getboolean("RETENTION", "enabled")
+            if config.has_option("RETENTION", "max_age"):
+                RETENTION.max_age = config.getint("RETENTION", "max_age")
+            if config.has_option("RETENTION", "max_count"):
+                RETENTION.max_count = config.getint("RETENTION", "max_count")
+            if config.has_option("RETENTION", "states"):
+                RETENTION.states = tuple(
+                    s.strip()
+                    for s in config.get("RETENTION", "states").split(",")
+                    if s.strip()
+                )
+            if config.has_option("RETENTION", "interval"):
+                RETENTION.interval = config.getint("RETENTION", "interval")
+            if config.has_option("RETENTION", "max_tombstones"):
+                RETENTION.max_tombstones = config.getint(
+                    "RETENTION",
+                    "max_tombstones",
+                )
+
         # LOGGING
         if config.has_section("LOGCONFIG"):
             if config.has_option("LOGCONFIG", "logfile"):
@@ -35,6 +35,40 @@ class JobListTest(TestCase):
             assert "status" in first
             assert "links" in first
 
+    @pytest.mark.integrationtest
+    def test_get_jobs_fields(self) -> None:
+        """GET /jobs with fields returns only the requested members."""
+        resp = self.app.get(
+            "/jobs?fields=status,progress",
+            headers=self.HEADER_AUTH,
+        )
+        assert isinstance(resp, Response)
+        assert resp.status_code == 200
+        for job in resp.json["jobs"]:
+            assert set(job) <= {"jobID", "status", "progress"}
+            assert "jobID" in job
+
+    @pytest.mark.integrationtest
+    def test_get_jobs_invalid_fields(self) -> None:
+        """Unknown fields return 400."""
+        resp = self.app.get("/jobs?fields=foo", headers=self.HEADER_AUTH)
+        assert isinstance(resp, Response)
+        assert resp.status_code == 400
+
+    @pytest.mark.integrationtest
+    def test_get_jobs_bbox(self) -> None:
+        """GET /jobs with bbox returns 200, invalid bbox returns 400."""
+        resp = self.app.get(
+            "/jobs?bbox=-180,-90,180,90",
+            headers=self.HEADER_AUTH,
+        )
+        assert isinstance(resp, Response)
+        assert resp.status_code == 200
+        assert "jobs" in resp.json
+
+        resp = self.app.get("/jobs?bbox=1,2,3", headers=self.HEADER_AUTH)
+        assert resp.status_code == 400
+
     @pytest.mark.integrationtest
     def test_get_jobs_missing_auth(self) -> None:
         """Request without auth returns 401."""
@@ -117,3 +151,38 @@ class JobListTest(TestCase):
         assert hasattr(resp, "json")
         assert "jobs" in resp.json
         assert len(resp.json["jobs"]) == 0
+
+    @pytest.mark.integrationtest
+    def test_get_jobs_sync_token(self) -> None:
+        """GET /jobs?syncToken= returns a token for the changes feed."""
+        resp = self.app.get(
+            "/jobs",
+            query_string={"syncToken": ""},
+            headers=self.HEADER_AUTH,
+        )
+        assert isinstance(resp, Response)
+        assert resp.status_code == 200
+        assert "syncToken" in resp.json
+        token = resp.json["syncToken"]
+
+        # nothing changed in between -> no jobs
+        resp = self.app.get(
+            "/jobs",
+            query_string={"syncToken": token},
+            headers=self.HEADER_AUTH,
+        )
+        assert resp.status_code == 200
+        assert "syncToken" in resp.json
+        assert len(resp.json["jobs"]) == 0
+
+    @pytest.mark.integrationtest
+    def test_get_jobs_wrong_sync_token(self) -> None:
+        """Invalid syncToken GET to /jobs returns 400."""
+        resp = self.app.get(
+            "/jobs",
+            query_string={"syncToken": "abc"},
+            headers=self.HEADER_AUTH,
+        )
+        assert isinstance(resp, Response)
+        assert resp.status_code == 400
+        assert "message" in resp.json
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import pytest
+from flask import Response
+
+from tests.testsuite import TestCase
+
+
+class JobStatsTest(TestCase):
+    """Integration tests for /jobs/stats endpoint."""
+
+    @pytest.mark.integrationtest
+    def test_get_job_stats(self) -> None:
+        """Successful GET /jobs/stats returns aggregated statistics."""
+        resp = self.app.get("/jobs/stats", headers=self.HEADER_AUTH)
+        assert isinstance(resp, Response)
+        assert resp.status_code == 200
+        assert "numberOfJobs" in resp.json
+        assert "status" in resp.json
+        assert "duration" in resp.json
+        assert "queueWait" in resp.json
+        assert "max-age" in resp.headers["Cache-Control"]
+
+    @pytest.mark.integrationtest
+    def test_get_job_stats_missing_auth(self) -> None:
+        """Request without auth returns 401."""
+        resp = self.app.get("/jobs/stats")
+        assert isinstance(resp, Response)
+        assert resp.status_code == 401
+
+    @pytest.mark.integrationtest
+    def test_get_job_stats_false_auth(self) -> None:
+        """Wrong credentials return 401."""
+        resp = self.app.get("/jobs/stats", headers=self.HEADER_AUTH_WRONG)
+        assert isinstance(resp, Response)
+        assert resp.status_code == 401
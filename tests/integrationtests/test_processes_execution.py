@@ -44,6 +44,14 @@ test_process_input_bbox_error = {
     "response": "document",
 }
 
+test_process_input_invalid_subscriber = {
+    "inputs": {
+        "url_to_geojson_point": "https://raw.githubusercontent.com/"
+        "mmacata/pagestest/gh-pages/pointInBonn.geojson",
+    },
+    "subscriber": {"failedUri": "ftp://localhost/failed"},
+}
+
 test_process_input_with_grass_project = {
     "inputs": {
         "url_to_geojson_point": "https://raw.githubusercontent.com/"
@@ -148,6 +156,21 @@ class ProcessExecution(TestCase):
         assert "detail" in resp.json
         assert "bounding_box" in resp.json["detail"]
 
+    @pytest.mark.integrationtest
+    def test_post_process_execution_invalid_subscriber(self) -> None:
+        """Test post method of the /processes/<process_id>/execution endpoint.
+
+        Failing query with invalid subscriber
+        """
+        resp = self.app.post(
+            "/processes/point_in_polygon/execution",
+            headers=self.HEADER_AUTH,
+            json=test_process_input_invalid_subscriber,
+        )
+        assert isinstance(resp, Response)
+        assert resp.status_code == 400
+        assert resp.json["title"] == "Invalid subscriber"
+
     @pytest.mark.integrationtest
     def test_post_process_execution_invalid_process_id(self) -> None:
         """Test post method of the /processes/<process_id>/execution endpoint.
@@ -166,3 +166,85 @@ def test_map_status_and_reverse():
     assert actinia.map_status_reverse("failed") == "error"
     assert actinia.map_status_reverse("dismissed") == "terminated"
     assert actinia.map_status_reverse("unknown") is None
+
+
+@pytest.mark.unittest
+def test_job_record_from_actinia():
+    """Test JobRecord keeps epoch values and serializes to statusInfo."""
+    sample = {
+        "status": "finished",
+        "resource_id": "resource_id-96ed4cb9-1290-4409-b034-c162759c10a1",
+        "accept_timestamp": "1767697334.010796",
+        "start_timestamp": 1767697335.5,
+        "timestamp": 1767697369.8468018,
+        "time_delta": 35.83603835105896,
+        "progress": {"num_of_steps": 4, "step": 4},
+        "type": "process",
+        "links": [{"href": "http://example.com/out", "rel": "alternate"}],
+    }
+    record = actinia.JobRecord.from_actinia("96ed4cb9", sample)
+    assert not hasattr(record, "__dict__")
+    assert record.created == 1767697334.010796
+    assert record.started == 1767697335.5
+    assert record.finished == 1767697334.010796 + 35.83603835105896
+    assert record.status == "successful"
+    assert record.progress == 100
+
+    info = record.to_status_info()
+    assert list(info) == [
+        "jobID",
+        "status",
+        "type",
+        "message",
+        "processID",
+        "created",
+        "updated",
+        "started",
+        "finished",
+        "progress",
+        "links",
+    ]
+    assert info["created"] == "2026-01-06T11:02:14+00:00"
+    assert info["started"] == "2026-01-06T11:02:15+00:00"
+    assert info["finished"] == "2026-01-06T11:02:49+00:00"
+    assert info["links"][0]["href"] == "http://example.com/out"
+
+    # links can be overwritten at serialization
+    links = [{"href": "/jobs/96ed4cb9", "rel": "status"}]
+    assert record.to_status_info(links=links)["links"] == links
+
+    # invalid timestamps are left out
+    record = actinia.JobRecord.from_actinia(
+        "96ed4cb9",
+        {"status": "running", "accept_timestamp": "x", "links": links},
+    )
+    assert record.created is None
+    assert "created" not in record.to_status_info()
+
+
+@pytest.mark.unittest
+def test_job_record_status_info_fields():
+    """Only requested statusInfo members are computed."""
+    record = actinia.JobRecord(
+        "96ed4cb9",
+        "running",
+        created=1767697334.0,
+        updated=1767697335.0,
+        progress=50,
+    )
+    fields = actinia.parse_fields(
+        ["status,progress"],
+        actinia.STATUS_INFO_FIELDS,
+        required=("jobID",),
+    )
+    info = record.to_status_info(fields=fields)
+    assert info == {"jobID": "96ed4cb9", "status": "running", "progress": 50}
+
+    info = record.to_status_info(fields={"jobID", "updated"})
+    assert info["updated"] == "2026-01-06T11:02:15+00:00"
+    assert list(info) == ["jobID", "updated"]
+
+    assert actinia.parse_fields([], actinia.STATUS_INFO_FIELDS) is None
+    assert actinia.parse_fields([","], actinia.STATUS_INFO_FIELDS) is None
+    with pytest.raises(ValueError, match="Unknown fields: foo"):
+        actinia.parse_fields("status,foo", actinia.STATUS_INFO_FIELDS)
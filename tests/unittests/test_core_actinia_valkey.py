@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for reading jobs from the valkey of actinia.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import base64
+import fnmatch
+import hashlib
+import pickle
+import sys
+import types
+
+import pytest
+from werkzeug.datastructures import Authorization
+
+from actinia_ogc_api_processes_plugin.core import actinia_valkey as core
+from actinia_ogc_api_processes_plugin.core.job_list import read_resource_list
+from actinia_ogc_api_processes_plugin.core.job_status_info import (
+    status_info_from_response,
+)
+from actinia_ogc_api_processes_plugin.main import flask_app
+from actinia_ogc_api_processes_plugin.resources.config import VALKEY
+
+
+class Valkey:
+    """In-memory stand-in for a valkey client with bytes responses."""
+
+    def __init__(self, data: dict) -> None:
+        """Initialise with str keys and bytes or dict values."""
+        self.data = {k.encode(): v for k, v in data.items()}
+        self.round_trips = 0
+
+    def get(self, key, count=True):
+        """Return the value of a key."""
+        self.round_trips += count
+        return self.data.get(key.encode())
+
+    def hget(self, key, field, count=True):
+        """Return a field of a hash."""
+        self.round_trips += count
+        return self.data.get(key.encode(), {}).get(field)
+
+    def mget(self, keys):
+        """Return the values of several keys."""
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    def scan_iter(self, match, count):
+        """Yield the matching keys in batches of `count`."""
+        keys = [k for k in self.data if fnmatch.fnmatch(k.decode(), match)]
+        for i in range(0, len(keys), count):
+            self.round_trips += 1
+            yield from keys[i : i + count]
+
+    def pipeline(self, transaction=True):
+        """Return a pipeline."""
+        client = self
+        calls = []
+
+        class Pipeline:
+            def hget(self, *args):
+                calls.append(lambda: client.hget(*args, count=False))
+
+            def get(self, *args):
+                calls.append(lambda: client.get(*args, count=False))
+
+            def execute(self):
+                client.round_trips += 1
+                return [call() for call in calls]
+
+        return Pipeline()
+
+
+def _auth(username: str, password: str) -> Authorization:
+    """Return basic auth credentials."""
+    return Authorization(
+        "basic",
+        {"username": username, "password": password},
+    )
+
+
+def _password_hash(password: str, salt: bytes = b"salt1234") -> bytes:
+    """Return a pbkdf2-sha256 hash in the format of passlib."""
+
+    def ab64(value):
+        return base64.b64encode(value).decode().rstrip("=").replace("+", ".")
+
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, 1000)
+    return f"$pbkdf2-sha256$1000${ab64(salt)}${ab64(digest)}".encode()
+
+
+def _job(job_id: str, status: str, monkeypatch) -> bytes:
+    """Return a job pickled like actinia, with its response model class."""
+    module = types.ModuleType("actinia_core")
+
+    class ProcessingResponseModel(dict):
+        pass
+
+    ProcessingResponseModel.__module__ = "actinia_core"
+    ProcessingResponseModel.__qualname__ = "ProcessingResponseModel"
+    module.ProcessingResponseModel = ProcessingResponseModel
+    monkeypatch.setitem(sys.modules, "actinia_core", module)
+    model = ProcessingResponseModel(
+        resource_id=f"resource_id-{job_id}",
+        status=status,
+        message=status,
+        accept_timestamp=1.0,
+        timestamp=2.0,
+        urls={"status": f"http://actinia/api/v3/resources/u/{job_id}"},
+    )
+    model.schema_info = "ignored"
+    return pickle.dumps((200, model))
+
+
+@pytest.fixture
+def valkey(monkeypatch):
+    """Return a valkey stand-in with two jobs of user `u`."""
+    client = Valkey(
+        {
+            "USER-DATABASE::u": {"password_hash": _password_hash("pw")},
+            "RESOURCE-LOGGER::u::resource_id-j1": _job(
+                "j1",
+                "running",
+                monkeypatch,
+            ),
+            "RESOURCE-LOGGER::u::resource_id-j2": _job(
+                "j2",
+                "finished",
+                monkeypatch,
+            ),
+            "RESOURCE-LOGGER::u::resource_id-j2::1": b"iteration",
+            "RESOURCE-LOGGER::v::resource_id-j3": _job(
+                "j3",
+                "finished",
+                monkeypatch,
+            ),
+        },
+    )
+    monkeypatch.setattr(core, "_client", lambda: client)
+    monkeypatch.setattr(VALKEY, "scan_count", 2)
+    core._VERIFIED.clear()
+    return client
+
+
+@pytest.mark.unittest
+def test_read_actinia_job(valkey):
+    """Jobs are read with the password hash in one round trip."""
+    resp = core.read_actinia_job("j1", _auth("u", "pw"))
+    assert valkey.round_trips == 1
+    links = [{"href": "/jobs/j1", "rel": "self"}]
+    status, status_info = status_info_from_response("j1", resp, links)
+    assert status == 200
+    assert status_info["status"] == "running"
+    assert type(resp.json()) is core._Model
+
+    # verified credentials are cached
+    resp = core.read_actinia_job("j9", _auth("u", "pw"))
+    assert valkey.round_trips == 2
+    assert resp.status_code == 400
+    assert status_info_from_response("j9", resp) == (404, None)
+
+    resp = core.read_actinia_job("j1", _auth("u", "wrong"))
+    assert resp.status_code == 401
+    # unknown users are left to actinia
+    assert core.read_actinia_job("j1", _auth("x", "pw")) is None
+
+
+@pytest.mark.unittest
+def test_read_actinia_jobs(valkey):
+    """Job lists are read with SCAN and MGET batches of own jobs."""
+    auth = _auth("u", "pw")
+    resp = core.read_actinia_jobs(auth)
+    with flask_app.test_request_context("/jobs"):
+        items = read_resource_list(resp)
+    assert sorted(item["resource_id"] for item in items) == [
+        "resource_id-j1",
+        "resource_id-j2",
+    ]
+    resp = core.read_actinia_jobs(auth, actinia_type="finished")
+    assert [item["status"] for item in resp.json()["resource_list"]] == [
+        "finished",
+    ]
+    resp = core.read_actinia_jobs(auth, limit=1)
+    assert len(resp.json()["resource_list"]) == 1
+
+
+@pytest.mark.unittest
+def test_unpickler_rejects_other_classes():
+    """Only containers, values and actinia models can be unpickled."""
+    data = pickle.dumps((200, types.SimpleNamespace(a=1)))
+    with pytest.raises(pickle.UnpicklingError, match="not allowed"):
+        core._loads(data)
+    assert core.verify_password("pw", _password_hash("pw")) is True
+    assert core.verify_password("pw", b"$2b$12$bcrypt") is None
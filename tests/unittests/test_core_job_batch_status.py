@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for the batch job status (POST /jobs/status).
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import base64
+import threading
+import time
+
+import pytest
+import requests
+
+from actinia_ogc_api_processes_plugin.core import job_batch_status as core
+from actinia_ogc_api_processes_plugin.main import flask_app
+from actinia_ogc_api_processes_plugin.resources.config import JOBSTATUS
+
+HEADER_AUTH = {
+    "Authorization": f"Basic {base64.b64encode(b'user:pw').decode()}",
+}
+
+
+class MockResp:
+    """Mock actinia response."""
+
+    text = ""
+
+    def __init__(self, status_code, data=None) -> None:
+        """Initialise."""
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        """Return the json data."""
+        return self._data
+
+
+@pytest.mark.unittest
+def test_get_job_status_infos(monkeypatch):
+    """Jobs are requested concurrently and errors are reported per job."""
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+
+    def mock_get(job_id, auth=None):
+        assert auth.username == "user"
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        time.sleep(0.02)
+        with lock:
+            running["now"] -= 1
+        if job_id == "missing":
+            return MockResp(400, {})
+        if job_id in {"forbidden", "denied"}:
+            return MockResp(403 if job_id == "forbidden" else 401)
+        if job_id == "offline":
+            raise requests.ConnectionError("down")
+        return MockResp(
+            200,
+            {
+                "resource_id": f"resource_id-{job_id}",
+                "status": "running",
+                "message": "running",
+                "urls": {"status": f"http://actinia/api/v3/x/{job_id}"},
+            },
+        )
+
+    monkeypatch.setattr(core, "get_actinia_job", mock_get)
+    monkeypatch.setattr(JOBSTATUS, "batch_concurrency", 3)
+    job_ids = [f"j{i}" for i in range(8)] + ["missing", "offline", "j0"]
+    job_ids += ["forbidden", "denied"]
+
+    with flask_app.test_request_context("/jobs/status", headers=HEADER_AUTH):
+        result = core.get_job_status_infos(job_ids)
+    assert list(result["jobs"]) == [f"j{i}" for i in range(8)]
+    assert result["jobs"]["j1"]["status"] == "running"
+    assert result["jobs"]["j1"]["links"][0] == {
+        "href": "http://localhost/jobs/j1",
+        "rel": "self",
+    }
+    assert result["errors"]["missing"]["status"] == 404
+    assert result["errors"]["offline"]["status"] == 503
+    assert result["errors"]["forbidden"]["status"] == 403
+    assert result["errors"]["denied"]["status"] == 401
+    assert result["unauthorized"] is False
+    assert 1 < running["max"] <= 3
+
+
+@pytest.mark.unittest
+def test_post_job_status(monkeypatch):
+    """Invalid bodies are rejected and 401 is returned for all jobs."""
+    monkeypatch.setattr(
+        core,
+        "get_actinia_job",
+        lambda job_id, auth=None: MockResp(401),
+    )
+    client = flask_app.test_client()
+    resp = client.post("/jobs/status", headers=HEADER_AUTH, json={})
+    assert resp.status_code == 400
+    resp = client.post(
+        "/jobs/status",
+        headers=HEADER_AUTH,
+        json={"jobIDs": ["a", 1]},
+    )
+    assert resp.status_code == 400
+    resp = client.post(
+        "/jobs/status",
+        headers=HEADER_AUTH,
+        json={"jobIDs": ["a", "b"]},
+    )
+    assert resp.status_code == 401
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for the cache of jobs in a final state (core.job_cache).
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import base64
+import hashlib
+
+import pytest
+
+from actinia_ogc_api_processes_plugin.api import job_status_info as api
+from actinia_ogc_api_processes_plugin.authentication import credentials_key
+from actinia_ogc_api_processes_plugin.core import job_cache as core
+from actinia_ogc_api_processes_plugin.core import (
+    job_status_info,
+    shared_store,
+)
+from actinia_ogc_api_processes_plugin.main import flask_app
+from actinia_ogc_api_processes_plugin.resources.config import SHARED
+
+
+class MockResp:
+    """Mock actinia response."""
+
+    text = ""
+
+    def __init__(self, status_code, data=None) -> None:
+        """Initialise."""
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        """Return the json data."""
+        return self._data
+
+
+class SharedBackend:
+    """In-memory stand-in for the valkey client."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.data = {}
+
+    def get(self, key):
+        """Return the value of `key`."""
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        """Store `value` for `key`."""
+        self.data[key] = value
+
+    def delete(self, key):
+        """Remove `key`."""
+        self.data.pop(key, None)
+
+
+def _headers(password="pw"):
+    """Return basic auth headers."""
+    token = base64.b64encode(f"user:{password}".encode()).decode()
+    return {"Authorization": f"Basic {token}"}
+
+
+JOB = {
+    "resource_id": "resource_id-j1",
+    "status": "finished",
+    "message": "Processing successfully finished",
+    "accept_timestamp": 1.0,
+    "timestamp": 2.0,
+    "urls": {
+        "status": "http://actinia/api/v3/resources/user/resource_id-j1",
+        "resources": [],
+    },
+    "process_chain_list": [{"list": []}],
+    "process_results": {"stats": {"min": 1}},
+}
+
+
+@pytest.fixture
+def actinia(monkeypatch):
+    """Count the requests of jobs sent to actinia."""
+    core._LOCAL.clear()
+    calls = []
+
+    def mock_get_actinia_job(job_id, auth=None):
+        calls.append(job_id)
+        return MockResp(200, JOB)
+
+    monkeypatch.setattr(
+        job_status_info,
+        "get_actinia_job",
+        mock_get_actinia_job,
+    )
+    return calls
+
+
+@pytest.mark.unittest
+def test_terminal_job_cache(monkeypatch, actinia):
+    """Finished jobs are requested once per user until they are deleted."""
+    client = flask_app.test_client()
+    first = client.get("/jobs/j1", headers=_headers())
+    second = client.get("/jobs/j1?f=json", headers=_headers())
+    assert len(actinia) == 1
+    assert second.json["status"] == "successful"
+    assert second.json["links"][0]["href"].endswith("/jobs/j1?f=json")
+    assert second.json["links"][2] == first.json["links"][2]
+
+    results = client.get(
+        "/jobs/j1/results?resultResponse=document",
+        headers=_headers(),
+    )
+    assert results.json == {
+        "stats": {"min": 1},
+        "log": second.json["links"][2]["href"],
+    }
+    assert len(actinia) == 1
+
+    # other credentials are not answered from the cache
+    client.get("/jobs/j1", headers=_headers("other"))
+    assert len(actinia) == 2
+
+    # a refused termination does not drop the cached job
+    monkeypatch.setattr(
+        api,
+        "cancel_actinia_job",
+        lambda job_id: MockResp(401),
+    )
+    client.delete("/jobs/j1", headers=_headers())
+    client.get("/jobs/j1", headers=_headers())
+    assert len(actinia) == 2
+
+    monkeypatch.setattr(
+        api,
+        "cancel_actinia_job",
+        lambda job_id: MockResp(200),
+    )
+    client.delete("/jobs/j1", headers=_headers())
+    client.get("/jobs/j1", headers=_headers())
+    assert len(actinia) == 4
+
+
+@pytest.mark.unittest
+def test_shared_backend(monkeypatch, actinia):
+    """Entries are shared by all workers through the shared backend."""
+    backend = SharedBackend()
+    monkeypatch.setattr(shared_store, "shared_client", lambda: backend)
+    with flask_app.test_request_context("/jobs/j1", headers=_headers()):
+        running = {"jobID": "j1", "status": "running", "links": []}
+        core.cache_terminal_job("j1", running)
+        assert backend.data == {}
+        status_info = {
+            "jobID": "j1",
+            "status": "failed",
+            "links": [{"href": "http://log", "rel": "convertedfrom"}],
+        }
+        core.cache_terminal_job("j1", status_info)
+        assert len(backend.data) == 1
+        core._LOCAL.clear()
+        entry = core.get_terminal_job("j1")
+        assert core.status_info_of(entry)["links"][2]["href"] == "http://log"
+        core.invalidate_terminal_job("j1")
+        assert backend.data == {}
+        assert core.get_terminal_job("j1") is None
+
+
+@pytest.mark.unittest
+def test_shared_key_secret(monkeypatch):
+    """Shared keys are HMACs with the server secret, not password hashes."""
+    monkeypatch.setattr(SHARED, "secret", "s1")
+    headers = {"Authorization": f"Basic {base64.b64encode(b'u:pw').decode()}"}
+    with flask_app.test_request_context("/jobs/j1", headers=headers):
+        key = credentials_key()
+        monkeypatch.setattr(SHARED, "secret", "s2")
+        assert credentials_key() != key
+    assert hashlib.sha256(b"u:pw").hexdigest() != key
+
+    # without a secret the keys differ per worker, so nothing is shared
+    monkeypatch.setattr(SHARED, "url", "valkey://localhost")
+    monkeypatch.setattr(SHARED, "secret", None)
+    assert shared_store.shared_client.__wrapped__() is None
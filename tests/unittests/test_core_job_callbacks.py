@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for core.job_callbacks against a local HTTP sink.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from actinia_ogc_api_processes_plugin.core import job_callbacks as core
+from actinia_ogc_api_processes_plugin.core import job_events
+from actinia_ogc_api_processes_plugin.main import flask_app
+from actinia_ogc_api_processes_plugin.resources.config import (
+    CALLBACKS,
+    JOBSTATUS,
+)
+
+
+class MockResp:
+    """Mock actinia response."""
+
+    text = ""
+
+    def __init__(self, status_code, data=None) -> None:
+        """Initialise."""
+        self.status_code = status_code
+        self.data = data
+
+    def json(self):
+        """Return the configured data."""
+        return self.data
+
+
+class Sink:
+    """Local HTTP server recording the callbacks it receives."""
+
+    def __init__(self, failures: int = 0) -> None:
+        """Start the server; the first `failures` requests get a 503."""
+        self.received = []
+        self.attempts = 0
+        self.failures = failures
+        self.event = threading.Condition()
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                body = json.loads(self.rfile.read(length))
+                with sink.event:
+                    sink.attempts += 1
+                    failed = sink.attempts <= sink.failures
+                    if not failed:
+                        sink.received.append((self.path, body))
+                    sink.event.notify_all()
+                self.send_response(503 if failed else 204)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def wait_for(self, count: int) -> list:
+        """Wait until `count` callbacks were received."""
+        with self.event:
+            self.event.wait_for(lambda: len(self.received) >= count, 10)
+        return self.received
+
+    def close(self) -> None:
+        """Stop the server."""
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def sink(monkeypatch):
+    """Return a running HTTP sink."""
+    monkeypatch.setattr(CALLBACKS, "allowed_hosts", ("127.0.0.1",))
+    server = Sink()
+    yield server
+    server.close()
+
+
+def _headers(user, password):
+    """Return basic auth headers."""
+    token = base64.b64encode(f"{user}:{password}".encode()).decode()
+    return {"Authorization": f"Basic {token}"}
+
+
+def _job(status, step=None):
+    """Return an actinia job."""
+    job = {
+        "resource_id": "resource_id-j1",
+        "status": status,
+        "message": status,
+        "accept_timestamp": 1.0,
+        "timestamp": 1.0,
+        "urls": {
+            "status": "http://localhost/api/v3/resources/u/j1",
+            "resources": [],
+        },
+        "process_chain_list": [{"list": []}],
+        "process_results": {"stats": {"min": 1}},
+    }
+    if step is not None:
+        job["progress"] = {"num_of_steps": 4, "step": step}
+    return job
+
+
+@pytest.mark.unittest
+def test_parse_subscriber(monkeypatch):
+    """Subscribers need a successUri and http(s) URIs to allowed hosts."""
+    assert core.parse_subscriber(None) is None
+    subscriber = {"successUri": "http://a/s", "failedUri": "https://a/f"}
+    monkeypatch.setattr(CALLBACKS, "allowed_hosts", ("a",))
+    assert core.parse_subscriber(subscriber) == subscriber
+    for invalid in (
+        {"failedUri": "http://a/f"},
+        {"successUri": "ftp://a/s"},
+        {"successUri": "http://a/s", "other": "http://a/o"},
+        {"successUri": 1},
+        "http://a/s",
+    ):
+        with pytest.raises(ValueError, match=r"URI|Unknown|successUri"):
+            core.parse_subscriber(invalid)
+    monkeypatch.setattr(CALLBACKS, "allowed_hosts", ("b",))
+    with pytest.raises(ValueError, match="not allowed"):
+        core.parse_subscriber(subscriber)
+
+    # without allowed hosts only public addresses are allowed
+    monkeypatch.setattr(CALLBACKS, "allowed_hosts", ())
+    public = {"successUri": "https://93.184.215.14/s"}
+    assert core.parse_subscriber(public) == public
+    for host in (
+        "127.0.0.1",
+        "[::1]",
+        "169.254.169.254",
+        "10.0.0.1",
+        "a.invalid",
+    ):
+        with pytest.raises(ValueError, match="not allowed"):
+            core.parse_subscriber({"successUri": f"http://{host}/s"})
+
+
+@pytest.mark.unittest
+def test_dispatch_not_allowed(monkeypatch, sink):
+    """Callbacks to hosts which are not allowed are dropped."""
+    monkeypatch.setattr(CALLBACKS, "allowed_hosts", ())
+    monkeypatch.setattr(core, "_PENDING", threading.BoundedSemaphore(1))
+    assert core.dispatch(f"{sink.url}/cb", {"a": 1})
+    # the pending slot of the dropped callback is released again
+    assert core._PENDING.acquire(timeout=5)
+    assert sink.attempts == 0
+
+
+@pytest.mark.unittest
+def test_dispatch_retries(monkeypatch):
+    """Failed callbacks are retried with backoff."""
+    monkeypatch.setattr(CALLBACKS, "retry_delay", 0.01)
+    monkeypatch.setattr(CALLBACKS, "allowed_hosts", ("127.0.0.1",))
+    server = Sink(failures=2)
+    try:
+        assert core.dispatch(f"{server.url}/cb", {"a": 1})
+        assert server.wait_for(1) == [("/cb", {"a": 1})]
+        assert server.attempts == 3
+    finally:
+        server.close()
+
+
+@pytest.mark.unittest
+def test_register_callbacks(monkeypatch, sink):
+    """Progress changes and the results are sent to the subscriber."""
+    monkeypatch.setattr(JOBSTATUS, "wait_min_interval", 0.001)
+    monkeypatch.setattr(JOBSTATUS, "wait_max_interval", 0.001)
+    jobs = iter(
+        [
+            _job("running", 1),
+            _job("running", 1),
+            _job("running", 3),
+            _job("finished"),
+        ],
+    )
+    monkeypatch.setattr(
+        job_events,
+        "get_actinia_job",
+        lambda job_id, auth=None: MockResp(200, next(jobs)),
+    )
+    monkeypatch.setattr(
+        core,
+        "get_actinia_job",
+        lambda job_id, auth=None: MockResp(200, _job("finished")),
+    )
+    job_events._WATCHERS.clear()
+
+    with flask_app.test_request_context(
+        "/processes/p/execution",
+        headers=_headers("u", "pw"),
+    ):
+        core.register_callbacks(
+            "j1",
+            {
+                "successUri": f"{sink.url}/success",
+                "inProgressUri": f"{sink.url}/progress",
+            },
+        )
+    received = sink.wait_for(3)
+    # the unchanged second poll did not result in a callback
+    progress = [body for path, body in received if path == "/progress"]
+    assert len(progress) == 2
+    assert progress[0]["progress"] < progress[1]["progress"]
+    assert progress[1]["jobID"] == "j1"
+    assert "links" in progress[1]
+    success = [body for path, body in received if path == "/success"]
+    assert len(success) == 1
+    assert success[0]["stats"] == {"min": 1}
+    assert success[0]["log"].endswith("/resources/u/j1")
+
+
+@pytest.mark.unittest
+def test_dispatch_invalid_payload(monkeypatch, sink):
+    """Errors building the payload drop the callback without a retry."""
+    monkeypatch.setattr(core, "_PENDING", threading.BoundedSemaphore(1))
+    calls = []
+
+    def payload():
+        calls.append(1)
+        # as get_results for a job without process chain
+        raise IndexError("list index out of range")
+
+    assert core.dispatch(f"{sink.url}/cb", payload)
+    # the pending slot of the dropped callback is released again
+    assert core._PENDING.acquire(timeout=5)
+    assert calls == [1]
+    assert sink.attempts == 0
+
+
+@pytest.mark.unittest
+def test_callback_subscriber_gives_up(monkeypatch):
+    """Watching a job again while actinia is unavailable is bounded."""
+    monkeypatch.setattr(CALLBACKS, "max_attempts", 3)
+    monkeypatch.setattr(JOBSTATUS, "wait_max_interval", 0.001)
+    subscribed = threading.Semaphore(0)
+
+    def mock_subscribe(key, factory, subscriber):
+        subscribed.release()
+        subscriber.put(("error", {"status": 503, "message": "down"}))
+
+    monkeypatch.setattr(core, "subscribe", mock_subscribe)
+    subscriber = core.CallbackSubscriber({}, ("k", "j1"), None, None)
+    subscriber.put(("error", {"status": 503, "message": "down"}))
+    assert subscribed.acquire(timeout=5)
+    assert subscribed.acquire(timeout=5)
+    assert not subscribed.acquire(timeout=0.2)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for core.job_changes change feed.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import pytest
+
+from actinia_ogc_api_processes_plugin.core import job_changes as core
+from actinia_ogc_api_processes_plugin.core.actinia_common import JobRecord
+
+
+def _records(states):
+    """Return JobRecords for a dict job_id -> (status, timestamp)."""
+    return [
+        JobRecord.from_actinia(
+            job_id,
+            {"status": status, "timestamp": timestamp},
+        )
+        for job_id, (status, timestamp) in states.items()
+    ]
+
+
+def _changes(feed, records, token=None, updated_since=None, limit=100):
+    """Apply a change filter and return (job ids, next token)."""
+    change_filter = feed.changes_since(token, updated_since)
+    changed = [r for r in records if change_filter(r)]
+    changed.sort(key=change_filter.sort_key)
+    changed = changed[:limit]
+    return (
+        [r.job_id for r in changed],
+        change_filter.next_token(changed, limit),
+    )
+
+
+@pytest.mark.unittest
+def test_change_feed_returns_changed_jobs():
+    """Only jobs changed since the sync token are returned."""
+    feed = core.JobChangeFeed()
+    states = {
+        "aaa": ("running", 100.0),
+        "bbb": ("accepted", 100.0),
+        "ccc": ("finished", 90.0),
+    }
+
+    # empty token -> all jobs
+    ids, token = _changes(feed, _records(states), token="")
+    assert ids == ["aaa", "bbb", "ccc"]
+
+    # nothing changed
+    ids, token = _changes(feed, _records(states), token=token)
+    assert ids == []
+
+    # one job changed, one new job
+    states["bbb"] = ("running", 101.5)
+    states["ddd"] = ("accepted", 101.0)
+    ids, token2 = _changes(feed, _records(states), token=token)
+    assert ids == ["bbb", "ddd"]
+
+    # the older token still returns the same changes
+    ids, _ = _changes(feed, _records(states), token=token)
+    assert ids == ["bbb", "ddd"]
+    ids, _ = _changes(feed, _records(states), token=token2)
+    assert ids == []
+
+
+@pytest.mark.unittest
+def test_change_feed_limit_and_fallbacks(monkeypatch):
+    """Cut change lists continue with the next token; foreign tokens work."""
+    feed = core.JobChangeFeed()
+    states = {f"j{i}": ("running", 100.0 + i) for i in range(5)}
+    ids, token = _changes(feed, _records(states), token="", limit=2)
+    assert ids == ["j0", "j1"]
+    ids, token = _changes(feed, _records(states), token=token, limit=2)
+    assert ids == ["j2", "j3"]
+    ids, token = _changes(feed, _records(states), token=token, limit=2)
+    assert ids == ["j4"]
+
+    # updatedSince filters by the `updated` timestamp
+    ids, _ = _changes(feed, _records(states), updated_since=102.0)
+    assert ids == ["j3", "j4"]
+
+    # token of another worker falls back to its high-water mark
+    foreign = core.encode_sync_token(1, 102.5)
+    monkeypatch.setattr(core, "INSTANCE_ID", "other")
+    ids, _ = _changes(feed, _records(states), token=foreign)
+    assert ids == ["j3", "j4"]
+
+    # cut change lists of the fallback continue after the last returned job
+    states = {
+        "j0": ("running", 101.0),
+        "j1": ("running", 101.0),
+        "j2": ("running", 101.0),
+        "j3": ("running", 102.0),
+        "j4": ("running", 100.0),
+    }
+    foreign = core.encode_sync_token(None, 100.5)
+    ids, token = _changes(feed, _records(states), token=foreign, limit=2)
+    assert ids == ["j0", "j1"]
+    ids, token = _changes(feed, _records(states), token=token, limit=2)
+    assert ids == ["j2", "j3"]
+    ids, token = _changes(feed, _records(states), token=token, limit=2)
+    assert ids == []
+
+    with pytest.raises(ValueError, match="Invalid sync token"):
+        feed.changes_since("not-a-token")
+
+
+@pytest.mark.unittest
+def test_change_feed_token_of_returned_changes():
+    """Tokens of cut lists only move to the last returned change."""
+    feed = core.JobChangeFeed()
+    states = {f"j{i}": ("running", 100.0 + i) for i in range(4)}
+    _, token = _changes(feed, _records(states), token="")
+    for job_id in ("j0", "j1", "j2"):
+        states[job_id] = ("finished", 110.0)
+
+    change_filter = feed.changes_since(token)
+    changed = [r for r in _records(states) if change_filter(r)]
+    changed.sort(key=change_filter.sort_key)
+    # a concurrent request sees another change of a returned job
+    feed.observe(JobRecord("j1", "failed", updated=111.0))
+    next_token = change_filter.next_token(changed[:2], 2)
+    assert core.decode_sync_token(next_token)["seq"] == 6
+
+    ids, _ = _changes(feed, _records(states), token=next_token)
+    assert ids == ["j2", "j1"]
+
+
+@pytest.mark.unittest
+def test_change_feed_bounded(monkeypatch):
+    """Only the states of the last `JOBLIST.max_scan` jobs are kept."""
+    monkeypatch.setattr(core.JOBLIST, "max_scan", 2)
+    feed = core.JobChangeFeed()
+    states = {f"j{i}": ("running", 100.0 + i) for i in range(3)}
+    _, token = _changes(feed, _records(states), token="")
+    assert len(feed._last_seen) == 2
+
+    # the dropped job is returned again instead of being skipped
+    ids, _ = _changes(feed, _records(states), token=token)
+    assert ids == ["j0", "j1", "j2"]
+
+
+@pytest.mark.unittest
+def test_parse_updated_since():
+    """updatedSince accepts date-time strings and epoch seconds."""
+    assert core.parse_updated_since("2021-01-01T00:00:00Z") == 1609459200
+    assert core.parse_updated_since("2021-01-01T00:00:00") == 1609459200
+    assert core.parse_updated_since("1609459200.5") == 1609459200.5
+    with pytest.raises(ValueError):
+        core.parse_updated_since("yesterday")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for core.job_dismiss bulk cancellation.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import base64
+import threading
+import time
+
+import pytest
+import requests
+
+from actinia_ogc_api_processes_plugin.api import job_dismiss as api
+from actinia_ogc_api_processes_plugin.core import job_dismiss as core
+from actinia_ogc_api_processes_plugin.main import flask_app
+from actinia_ogc_api_processes_plugin.resources.config import JOBLIST
+
+HEADER_AUTH = {
+    "Authorization": f"Basic {base64.b64encode(b'user:pw').decode()}",
+}
+
+
+class MockResp:
+    """Mock actinia response."""
+
+    text = ""
+
+    def __init__(self, status_code, data=None) -> None:
+        """Initialise."""
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        """Return the json data."""
+        return self._data
+
+
+@pytest.mark.unittest
+def test_dismiss_jobs_bounded_concurrency(monkeypatch):
+    """Jobs are cancelled concurrently, at most dismiss_concurrency."""
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+    fetched = []
+
+    def mock_cancel(job_id, auth=None):
+        assert auth.username == "user"
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        time.sleep(0.02)
+        with lock:
+            running["now"] -= 1
+        if job_id == "missing":
+            return MockResp(404)
+        if job_id == "offline":
+            raise requests.ConnectionError("down")
+        return MockResp(200)
+
+    def mock_get(job_id, auth=None):
+        fetched.append(job_id)
+        return MockResp(
+            200,
+            {
+                "resource_id": f"resource_id-{job_id}",
+                "status": "terminated",
+                "urls": {"status": f"http://actinia/api/v3/x/{job_id}"},
+            },
+        )
+
+    monkeypatch.setattr(core, "cancel_actinia_job", mock_cancel)
+    monkeypatch.setattr(core, "get_actinia_job", mock_get)
+    monkeypatch.setattr(JOBLIST, "dismiss_concurrency", 3)
+    job_ids = [f"j{i}" for i in range(10)] + ["missing", "offline", "j0"]
+
+    with flask_app.test_request_context("/jobs/dismiss", headers=HEADER_AUTH):
+        result = core.dismiss_jobs(job_ids)
+        assert fetched == []
+        assert 1 < running["max"] <= 3
+        assert [j["jobID"] for j in result["jobs"]] == job_ids[:10]
+        assert result["jobs"][0]["status"] == "dismissed"
+        assert result["jobs"][0]["links"][0]["href"].endswith("/jobs/j0")
+        assert [(e["jobID"], e["status"]) for e in result["errors"]] == [
+            ("missing", 404),
+            ("offline", 503),
+        ]
+
+        result = core.dismiss_jobs(["j1"], with_status_info=True)
+        assert fetched == ["j1"]
+        assert result["jobs"][0]["status"] == "dismissed"
+        assert result["jobs"][0]["links"][-1]["rel"] == "convertedfrom"
+
+
+@pytest.mark.unittest
+def test_job_dismiss_endpoint(monkeypatch):
+    """POST /jobs/dismiss validates the body and aggregates results."""
+    monkeypatch.setattr(
+        core,
+        "cancel_actinia_job",
+        lambda job_id, auth=None: MockResp(401 if job_id == "x" else 200),
+    )
+    monkeypatch.setattr(
+        api,
+        "find_jobs_to_dismiss",
+        lambda *_args: (MockResp(200), ["a", "b"]),
+    )
+    client = flask_app.test_client()
+
+    resp = client.post("/jobs/dismiss", json=[], headers=HEADER_AUTH)
+    assert resp.status_code == 400
+    resp = client.post("/jobs/dismiss", json={}, headers=HEADER_AUTH)
+    assert resp.status_code == 400
+
+    resp = client.post(
+        "/jobs/dismiss",
+        json={"jobIDs": ["a", "b"]},
+        headers=HEADER_AUTH,
+    )
+    assert resp.status_code == 200
+    assert resp.json["numberOfDismissed"] == 2
+
+    resp = client.post(
+        "/jobs/dismiss",
+        json={"processID": "r.slope.aspect"},
+        headers=HEADER_AUTH,
+    )
+    assert resp.status_code == 200
+    assert [j["jobID"] for j in resp.json["jobs"]] == ["a", "b"]
+
+    resp = client.post(
+        "/jobs/dismiss",
+        json={"jobIDs": ["x"]},
+        headers=HEADER_AUTH,
+    )
+    assert resp.status_code == 401
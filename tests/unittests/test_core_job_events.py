@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for core.job_events.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import base64
+import json
+import threading
+import time
+
+import pytest
+
+from actinia_ogc_api_processes_plugin.core import job_events as core
+from actinia_ogc_api_processes_plugin.core import job_status_info
+from actinia_ogc_api_processes_plugin.main import flask_app
+from actinia_ogc_api_processes_plugin.resources.config import JOBSTATUS
+
+
+class MockResp:
+    """Mock actinia response."""
+
+    text = ""
+
+    def __init__(self, status_code, data=None) -> None:
+        """Initialise."""
+        self.status_code = status_code
+        self.data = data
+
+    def json(self):
+        """Return the configured data."""
+        return self.data
+
+
+def _headers(user, password):
+    """Return basic auth headers."""
+    token = base64.b64encode(f"{user}:{password}".encode()).decode()
+    return {"Authorization": f"Basic {token}"}
+
+
+def _job(status, step=None, timestamp=1.0):
+    """Return an actinia job."""
+    job = {
+        "resource_id": "resource_id-j1",
+        "status": status,
+        "message": status,
+        "accept_timestamp": 1.0,
+        "timestamp": timestamp,
+        "urls": {"status": "http://localhost/api/v3/resources/u/j1"},
+    }
+    if step is not None:
+        job["progress"] = {"num_of_steps": 4, "step": step}
+    return job
+
+
+def _parse_events(lines) -> list:
+    """Return (event, data) tuples of server-sent events."""
+    events = []
+    for block in "".join(lines).split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in block.splitlines() if ": " in line
+        )
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+@pytest.fixture
+def fast_polling(monkeypatch):
+    """Poll without delays."""
+    monkeypatch.setattr(JOBSTATUS, "wait_min_interval", 0.001)
+    monkeypatch.setattr(JOBSTATUS, "wait_max_interval", 0.001)
+    monkeypatch.setattr(JOBSTATUS, "events_list_interval", 0.001)
+    core._WATCHERS.clear()
+    job_status_info._LAST_KNOWN.clear()
+
+
+@pytest.mark.unittest
+def test_job_event_stream(monkeypatch, fast_polling):
+    """Subscribers share one watcher and receive deltas until done."""
+    jobs = iter(
+        [
+            _job("running", 1),
+            _job("running", 1),
+            _job("running", 2, timestamp=2.0),
+            _job("finished", timestamp=3.0),
+        ],
+    )
+    calls = []
+    proceed = threading.Event()
+
+    def mock_get_actinia_job(job_id, auth=None):
+        # wait until both subscribers are there before changing the job
+        if calls:
+            proceed.wait(5)
+        calls.append(auth.username)
+        return MockResp(200, next(jobs))
+
+    monkeypatch.setattr(core, "get_actinia_job", mock_get_actinia_job)
+
+    with flask_app.test_request_context(
+        "/jobs/j1/events",
+        headers=_headers("u", "pw"),
+    ):
+        first = core.job_event_stream("j1")
+        second = core.job_event_stream("j1")
+    assert first._watcher is second._watcher
+    proceed.set()
+
+    events = _parse_events(first)
+    assert [event for event, _ in events] == [
+        "status",
+        "status",
+        "status",
+        "done",
+    ]
+    assert events[0][1]["status"] == "running"
+    assert "links" in events[0][1]
+    # later events only contain the changed members
+    assert "links" not in events[1][1]
+    assert events[1][1]["jobID"] == "j1"
+    assert events[2][1]["status"] == "successful"
+    assert _parse_events(second)[1:] == events[1:]
+    # the unchanged second poll was not sent, all polls were shared
+    assert len(calls) == 4
+    assert core._WATCHERS == {}
+
+
+@pytest.mark.unittest
+def test_job_event_stream_error(monkeypatch, fast_polling):
+    """Errors of the first poll are available before streaming."""
+    monkeypatch.setattr(
+        core,
+        "get_actinia_job",
+        lambda job_id, auth=None: MockResp(401, {}),
+    )
+    with flask_app.test_request_context(
+        "/jobs/j1/events",
+        headers=_headers("u", "wrong"),
+    ):
+        stream = core.job_event_stream("j1")
+    assert stream.error["status"] == 401
+    stream.close()
+
+
+@pytest.mark.unittest
+def test_user_event_stream(monkeypatch, fast_polling):
+    """All jobs of a user are watched with one job list request."""
+    lists = iter(
+        [
+            [_job("running", 1), _job("finished") | {"resource_id": "j2"}],
+            [_job("running", 3, timestamp=2.0)]
+            + [_job("finished") | {"resource_id": "j2"}],
+        ],
+    )
+
+    def mock_get_actinia_jobs(limit, auth=None):
+        try:
+            return MockResp(200, {"resource_list": next(lists)})
+        except StopIteration:
+            return MockResp(401, {})
+
+    monkeypatch.setattr(core, "get_actinia_jobs", mock_get_actinia_jobs)
+    monkeypatch.setattr(core.JOBLIST, "stream_parse", False)
+
+    with flask_app.test_request_context(
+        "/jobs/events",
+        headers=_headers("u", "pw"),
+    ):
+        stream = core.user_event_stream()
+    events = _parse_events(stream)
+    assert events[0][0] == "status"
+    assert events[0][1]["jobID"] == "j1"
+    assert events[1] == ("ready", {"numberOfJobs": 2})
+    assert events[2][1]["progress"] > events[0][1]["progress"]
+    assert set(events[2][1]) == {"jobID", "progress", "updated"}
+    assert events[3][0] == "error"
+
+
+@pytest.mark.unittest
+def test_wait_for_job_status_info(monkeypatch, fast_polling):
+    """Waiting requests share one poller and return after a change."""
+    jobs = [
+        _job("running", 1),
+        _job("running", 1),
+        _job("running", 2, timestamp=2.0),
+        _job("finished", timestamp=3.0),
+    ]
+    calls = []
+    proceed = threading.Event()
+
+    def mock_get_actinia_job(job_id, auth=None):
+        if calls:
+            proceed.wait(5)
+        calls.append(job_id)
+        return MockResp(200, jobs[min(len(calls), len(jobs)) - 1])
+
+    monkeypatch.setattr(core, "get_actinia_job", mock_get_actinia_job)
+    results = []
+
+    def wait():
+        with flask_app.test_request_context(
+            "/jobs/j1?wait=5",
+            headers=_headers("u", "pw"),
+        ):
+            results.append(core.wait_for_job_status_info("j1", 5))
+
+    threads = [threading.Thread(target=wait) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    # wait until all requests are subscribed before changing the job
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and not any(
+        len(watcher._subscribers) == 3 for watcher in core._WATCHERS.values()
+    ):
+        time.sleep(0.001)
+    proceed.set()
+    for thread in threads:
+        thread.join(5)
+    assert [result[0] for result in results] == [200, 200, 200]
+    # the unchanged second poll did not end the wait
+    assert {result[1]["progress"] for result in results} == {40}
+    assert len(calls) == 3
+
+    # final states are returned right away from the finished watcher
+    with flask_app.test_request_context(
+        "/jobs/j1?wait=5",
+        headers=_headers("u", "pw"),
+    ):
+        _status, status_info, _ = core.wait_for_job_status_info("j1", 5)
+    assert status_info["status"] == "successful"
+    assert len(calls) in {4, 5}
+
+
+@pytest.mark.unittest
+def test_job_watcher_interval(monkeypatch):
+    """Old jobs are polled less often, unless they are about to end."""
+    monkeypatch.setattr(JOBSTATUS, "wait_min_interval", 0.5)
+    monkeypatch.setattr(JOBSTATUS, "wait_max_interval", 4.0)
+    monkeypatch.setattr(JOBSTATUS, "poll_age_factor", 0.05)
+    watcher = core.JobWatcher(("k", "j1"), None, "j1", [])
+    assert watcher.next_interval(0.5, []) == 1.0
+    assert watcher.next_interval(4.0, [("status", {})]) == 0.5
+
+    started = core.datetime.fromtimestamp(core.time.time() - 40).isoformat()
+    watcher.status_info = {"started": started, "progress": 10}
+    assert watcher.next_interval(0.5, [("status", {})]) == pytest.approx(2)
+    assert watcher.next_interval(2, []) == 4.0
+    watcher.status_info["progress"] = 95
+    # estimated end in about 2 seconds
+    assert watcher.next_interval(0.5, [("status", {})]) == pytest.approx(
+        2.1,
+        rel=0.05,
+    )
+
+
+@pytest.mark.unittest
+def test_wait_for_job_status_info_limit(monkeypatch, fast_polling):
+    """Without a free waiting slot the statusInfo is returned right away."""
+    monkeypatch.setattr(JOBSTATUS, "max_streams", 0)
+    monkeypatch.setattr(
+        core,
+        "get_job_status_info",
+        lambda job_id: (200, {"status": "running"}, "resp"),
+    )
+    with flask_app.test_request_context(
+        "/jobs/j1?wait=5",
+        headers=_headers("u", "pw"),
+    ):
+        result = core.wait_for_job_status_info("j1", 5)
+    assert result == (200, {"status": "running"}, "resp")
+    assert core._WATCHERS == {}
+    assert core._WAITING == set()
+
+
+@pytest.mark.unittest
+def test_job_event_stream_limit(monkeypatch, fast_polling):
+    """Streams beyond JOBSTATUS.max_streams are rejected with 503."""
+    monkeypatch.setattr(JOBSTATUS, "max_streams", 1)
+    monkeypatch.setattr(
+        core,
+        "get_actinia_job",
+        lambda job_id, auth=None: MockResp(200, _job("running", 1)),
+    )
+    with flask_app.test_request_context(
+        "/jobs/j1/events",
+        headers=_headers("u", "pw"),
+    ):
+        first = core.job_event_stream("j1")
+        second = core.job_event_stream("j1")
+    assert first.error is None
+    assert second.error["status"] == 503
+    second.close()
+
+    # closing a stream frees its slot, also more than once
+    first.close()
+    first.close()
+    assert core._WAITING == set()
+
+
+@pytest.mark.unittest
+def test_wait_for_job_status_info_last_known(monkeypatch, fast_polling):
+    """Changes since the previous request of the client end the wait."""
+    monkeypatch.setattr(
+        core,
+        "get_actinia_job",
+        lambda job_id, auth=None: MockResp(
+            200,
+            _job("running", 2, timestamp=2.0),
+        ),
+    )
+    with flask_app.test_request_context(
+        "/jobs/j1?wait=5",
+        headers=_headers("u", "pw"),
+    ):
+        job_status_info.remember_status_info(
+            "j1",
+            {"status": "running", "progress": 20},
+        )
+        start = time.monotonic()
+        status, status_info, _ = core.wait_for_job_status_info("j1", 5)
+    assert time.monotonic() - start < 1
+    assert status == 200
+    assert status_info["progress"] == 40
+
+
+@pytest.mark.unittest
+def test_wait_for_job_status_info_deadline(monkeypatch, fast_polling):
+    """A stalled first poll does not extend the wait."""
+    proceed = threading.Event()
+
+    def mock_get_actinia_job(job_id, auth=None):
+        proceed.wait(5)
+        return MockResp(200, _job("running", 1))
+
+    monkeypatch.setattr(core, "get_actinia_job", mock_get_actinia_job)
+    with flask_app.test_request_context(
+        "/jobs/j2?wait=0.1",
+        headers=_headers("u", "pw"),
+    ):
+        start = time.monotonic()
+        result = core.wait_for_job_status_info("j2", 0.1)
+    proceed.set()
+    assert time.monotonic() - start < 1
+    assert result == (504, None, None)
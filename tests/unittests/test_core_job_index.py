@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for core.job_index bbox filter.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import io
+import json
+
+import pytest
+import requests
+
+from actinia_ogc_api_processes_plugin.core import job_index as core
+from actinia_ogc_api_processes_plugin.core.job_list import (
+    iter_job_records,
+    read_resource_list,
+)
+from actinia_ogc_api_processes_plugin.resources.config import JOBLIST
+
+
+def _region_step(w, s, e, n):
+    """Return the g.region step set for a `bounding_box` input."""
+    return {
+        "id": "g_region_1",
+        "module": "g.region",
+        "inputs": [
+            {"param": "w", "value": str(w)},
+            {"param": "s", "value": str(s)},
+            {"param": "e", "value": str(e)},
+            {"param": "n", "value": str(n)},
+        ],
+        "flags": "g",
+    }
+
+
+@pytest.mark.unittest
+def test_parse_bbox():
+    """Bounding boxes are parsed from strings and lists."""
+    assert core.parse_bbox("7,50,8,51") == (7, 50, 8, 51)
+    assert core.parse_bbox([7, 50, 0, 8, 51, 100]) == (7, 50, 8, 51)
+    for value in ("7,50,8", "a,b,c,d", "8,50,7,51", "7,50,8,nan", None):
+        with pytest.raises(ValueError, match="Bounding box"):
+            core.parse_bbox(value)
+
+    data = {"process_chain_list": [{"list": [_region_step(7, 50, 8, 51)]}]}
+    assert core.bbox_from_process_chain(data) == (7, 50, 8, 51)
+    assert core.bbox_from_process_chain({"process_chain_list": []}) is None
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("stream_parse", [True, False])
+def test_bbox_filter(monkeypatch, stream_parse):
+    """Jobs read from actinia are filtered by the bbox of their region."""
+    monkeypatch.setattr(JOBLIST, "stream_parse", stream_parse)
+    body = {
+        "resource_list": [
+            {
+                "resource_id": "resource_id-aaa",
+                "status": "finished",
+                "process_chain_list": [
+                    {"list": [_region_step(7, 50, 8, 51)]},
+                ],
+            },
+            {
+                "resource_id": "resource_id-bbb",
+                "status": "finished",
+                "process_chain_list": [
+                    {"list": [_region_step(0, 0, 1, 1)]},
+                ],
+            },
+            {"resource_id": "resource_id-ccc", "status": "finished"},
+        ],
+    }
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.raw = io.BytesIO(json.dumps(body).encode())
+    items = read_resource_list(resp)
+    if stream_parse:
+        assert "process_chain_list" not in items[0]
+    records = list(iter_job_records(items))
+    assert [r.bbox for r in records] == [(7, 50, 8, 51), (0, 0, 1, 1), None]
+    bbox_filter = core.BBoxFilter((7.5, 50.5, 9, 52))
+    assert [r.job_id for r in records if bbox_filter(r)] == ["aaa"]
+    # touching boxes intersect
+    bbox_filter = core.BBoxFilter((1, 1, 7, 50))
+    assert [r.job_id for r in records if bbox_filter(r)] == ["aaa", "bbb"]
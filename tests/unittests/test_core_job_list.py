@@ -12,11 +12,19 @@ __copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 
 
+import base64
+import json
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from flask import jsonify
 
 from actinia_ogc_api_processes_plugin.core import job_list as core
+from actinia_ogc_api_processes_plugin.main import flask_app
+
+HEADER_AUTH = {
+    "Authorization": f"Basic {base64.b64encode(b'user:pw').decode()}",
+}
 
 
 class MockResp:
@@ -269,3 +277,214 @@ def test_parse_actinia_jobs_filter_by_type():
     # mixed filter -> no job returned
     mixed_type3 = core.parse_actinia_jobs(resp, job_types=["noone", "another"])
     assert len(mixed_type3["jobs"]) == 0
+
+
+class MockListResp(MockResp):
+    """Mock actinia resource list response with status code."""
+
+    status_code = 200
+
+
+def _mock_actinia_jobs(items, calls):
+    """Return a get_actinia_jobs replacement serving `items` up to `num`."""
+
+    def _get_actinia_jobs(actinia_type=None, limit=None):
+        calls.append(limit)
+        return MockListResp({"resource_list": items[:limit]})
+
+    return _get_actinia_jobs
+
+
+@pytest.mark.unittest
+def test_collect_actinia_jobs_overfetch(monkeypatch):
+    """collect_actinia_jobs should fetch more jobs until limit matches."""
+    # only every 10th job matches the requested processID
+    items = [
+        {
+            "resource_id": f"resource_id-{i:03d}",
+            "status": "finished",
+            "type": "process" if i % 10 == 0 else "other",
+            "links": [{"href": "http://example.com/x", "rel": "self"}],
+        }
+        for i in range(100)
+    ]
+    calls = []
+    monkeypatch.setattr(
+        core,
+        "get_actinia_jobs",
+        _mock_actinia_jobs(items, calls),
+    )
+    monkeypatch.setattr(core.JOBLIST, "overfetch_factor", 2)
+    monkeypatch.setattr(core.JOBLIST, "max_scan", 1000)
+
+    resp, records, partial = core.collect_actinia_jobs(
+        limit=3,
+        job_types=["process"],
+    )
+    assert resp.status_code == 200
+    assert [r.job_id for r in records] == ["000", "010", "020"]
+    assert partial is False
+    # batches grow 6 -> 12 -> 24 until 3 matches are found
+    assert calls == [6, 12, 24]
+
+    # source exhausted before limit reached -> not partial
+    calls.clear()
+    resp, records, partial = core.collect_actinia_jobs(
+        limit=50,
+        job_types=["process"],
+    )
+    assert len(records) == 10
+    assert partial is False
+
+    # scan budget hit before limit reached -> partial
+    calls.clear()
+    monkeypatch.setattr(core.JOBLIST, "max_scan", 30)
+    resp, records, partial = core.collect_actinia_jobs(
+        limit=5,
+        job_types=["process"],
+    )
+    assert len(records) == 3
+    assert partial is True
+    assert calls[-1] == 30
+
+    # sorted matches -> the scan does not stop at limit matches
+    calls.clear()
+    monkeypatch.setattr(core.JOBLIST, "max_scan", 1000)
+    resp, records, partial = core.collect_actinia_jobs(
+        limit=3,
+        job_types=["process"],
+        sort_key=lambda record: -int(record.job_id),
+    )
+    assert [r.job_id for r in records] == ["090", "080", "070"]
+    assert partial is False
+    assert calls == [6, 12, 24, 48, 96, 192]
+
+    # no local filters -> single request with num=limit
+    calls.clear()
+    resp, records, partial = core.collect_actinia_jobs(limit=5)
+    assert calls == [5]
+    assert len(records) == 5
+
+
+@pytest.mark.unittest
+def test_parse_actinia_jobs_bulk_time_filters(monkeypatch):
+    """NumPy bulk path should return the same jobs as the Python path."""
+    pytest.importorskip("numpy")
+    base_ts = datetime(2021, 1, 1, tzinfo=timezone.utc).timestamp()
+    statuses = ["finished", "error", "running", "accepted", "terminated"]
+    items = [
+        {
+            "resource_id": f"resource_id-{i:03d}",
+            "status": statuses[i % len(statuses)],
+            "accept_timestamp": base_ts + i * 60.5,
+            "start_timestamp": base_ts + i * 60.5 + 1.5,
+            "time_delta": (i * 7) % 120,
+            "links": [{"href": "http://example.com/x", "rel": "self"}],
+        }
+        for i in range(200)
+    ]
+    # invalid items and timestamps are excluded in both paths
+    items.append({"resource_id": "resource_id-x", "status": "finished"})
+    items.append("invalid")
+    resp = MockResp({"resource_list": items})
+
+    filters = [
+        {"datetime_param": "2021-01-01T01:00:00Z/.."},
+        {"datetime_param": "2021-01-01T00:30:15Z"},
+        {"min_duration": 30},
+        {"min_duration": 10, "max_duration": 60},
+        {"datetime_param": "/2021-01-01T02:00:00", "max_duration": 50},
+    ]
+    for kwargs in filters:
+        monkeypatch.setattr(core.JOBLIST, "bulk_threshold", 10**9)
+        expected = core.parse_actinia_jobs(resp, **kwargs)
+        assert expected["jobs"]
+        monkeypatch.setattr(core.JOBLIST, "bulk_threshold", 1)
+        assert core.parse_actinia_jobs(resp, **kwargs) == expected
+
+        # without NumPy the pure-Python path is used
+        with monkeypatch.context() as m:
+            m.setattr(core, "np", None)
+            assert core.parse_actinia_jobs(resp, **kwargs) == expected
+
+
+@pytest.mark.unittest
+def test_serialize_job_list_terminal_fragments():
+    """Terminal jobs are cached with their serialized statusInfo."""
+    items = [
+        {
+            "resource_id": "resource_id-aaa",
+            "status": "finished",
+            "accept_timestamp": 1609459200,
+            "timestamp": 1609459300,
+            "time_delta": 100,
+        },
+        {
+            "resource_id": "resource_id-bbb",
+            "status": "running",
+            "accept_timestamp": 1609459200,
+            "timestamp": 1609459300,
+        },
+    ]
+    resp = MockResp({"resource_list": items})
+    core.TERMINAL_JOBS.clear()
+
+    with flask_app.test_request_context(
+        "/jobs",
+        headers=HEADER_AUTH,
+    ):
+        records = core._filter_actinia_items(_read(resp))
+        body = core.serialize_job_list(records, partial=False)
+        expected = jsonify(core.build_job_list(records, partial=False))
+        assert body == expected.get_data()
+        assert json.loads(body)["jobs"][0]["finished"] == (
+            "2021-01-01T00:01:40+00:00"
+        )
+        # only the terminal job keeps its serialized statusInfo
+        assert records[0].fragment is not None
+        assert records[1].fragment is None
+
+        # the terminal job is not parsed again while its timestamp is
+        # unchanged, the running job is
+        again = core._filter_actinia_items(_read(resp))
+        assert again[0] is records[0]
+        assert again[1] is not records[1]
+        assert core.serialize_job_list(again, partial=False) == body
+
+        # an updated timestamp results in a new record
+        items[0]["timestamp"] = 1609459400
+        assert core._filter_actinia_items(_read(resp))[0] is not records[0]
+
+
+@pytest.mark.unittest
+def test_serialize_job_list_fields():
+    """Projected job lists contain only the requested members."""
+    items = [
+        {
+            "resource_id": f"resource_id-{i}",
+            "status": "finished",
+            "accept_timestamp": 1609459200,
+            "timestamp": 1609459300,
+            "progress": {"step": 1, "num_of_steps": 1},
+        }
+        for i in range(3)
+    ]
+    fields = frozenset({"jobID", "status", "progress"})
+    with flask_app.test_request_context("/jobs", headers=HEADER_AUTH):
+        core.TERMINAL_JOBS.clear()
+        records = core._filter_actinia_items(items)
+        body = core.serialize_job_list(records, fields=fields)
+        expected = jsonify(core.build_job_list(records, fields=fields))
+        assert body == expected.get_data()
+        assert json.loads(body)["jobs"][0] == {
+            "jobID": "0",
+            "status": "successful",
+            "progress": 100,
+        }
+        # projected statusInfo is not cached on the records
+        assert all(record.fragment is None for record in records)
+
+
+def _read(resp):
+    """Return the resource list of a mocked actinia response."""
+    return resp.json()["resource_list"]
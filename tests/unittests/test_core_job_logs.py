@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for core.job_logs and GET /jobs/{jobId}/logs.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import base64
+import json
+
+import pytest
+
+from actinia_ogc_api_processes_plugin.core import job_events
+from actinia_ogc_api_processes_plugin.core import job_logs as core
+from actinia_ogc_api_processes_plugin.main import flask_app
+from actinia_ogc_api_processes_plugin.resources.config import JOBSTATUS
+
+
+class MockResp:
+    """Mock actinia response."""
+
+    text = ""
+
+    def __init__(self, status_code, data=None) -> None:
+        """Initialise."""
+        self.status_code = status_code
+        self.data = data
+
+    def json(self):
+        """Return the configured data."""
+        return self.data
+
+
+HEADERS = {"Authorization": f"Basic {base64.b64encode(b'u:pw').decode()}"}
+
+
+def _job(status, steps):
+    """Return an actinia job with a process log of `steps` entries."""
+    return {
+        "resource_id": "resource_id-j1",
+        "status": status,
+        "message": status,
+        "accept_timestamp": 1.0,
+        "timestamp": 2.0,
+        "urls": {"status": "http://localhost/api/v3/resources/u/j1"},
+        "process_log": [
+            {"executable": f"step{i}", "return_code": 0} for i in range(steps)
+        ],
+    }
+
+
+@pytest.fixture
+def actinia(monkeypatch):
+    """Return the list of jobs returned by subsequent actinia requests."""
+    job_events._WATCHERS.clear()
+    monkeypatch.setattr(JOBSTATUS, "wait_min_interval", 0.001)
+    monkeypatch.setattr(JOBSTATUS, "wait_max_interval", 0.001)
+    jobs = []
+
+    def mock_get_actinia_job(job_id, auth=None):
+        if job_id != "j1":
+            return MockResp(400, {"message": "Resource does not exist"})
+        return MockResp(200, jobs.pop(0) if len(jobs) > 1 else jobs[0])
+
+    monkeypatch.setattr(core, "get_actinia_job", mock_get_actinia_job)
+    return jobs
+
+
+@pytest.mark.unittest
+def test_job_logs(actinia):
+    """Only the entries after the last offset are returned."""
+    actinia.extend([_job("running", 2), _job("running", 3)])
+    client = flask_app.test_client()
+
+    resp = client.get("/jobs/j1/logs", headers=HEADERS)
+    assert resp.status_code == 200
+    assert resp.json["status"] == "running"
+    assert (resp.json["since"], resp.json["offset"]) == (0, 2)
+    assert len(resp.json["entries"]) == 2
+    assert resp.json["links"][1]["href"].endswith("/jobs/j1/logs?since=2")
+
+    # the offset is only given by the client
+    resp = client.get("/jobs/j1/logs?since=2", headers=HEADERS)
+    assert resp.json["entries"] == [{"executable": "step2", "return_code": 0}]
+    resp = client.get("/jobs/j1/logs", headers=HEADERS)
+    assert (resp.json["since"], len(resp.json["entries"])) == (0, 3)
+    resp = client.get("/jobs/j1/logs?since=1", headers=HEADERS)
+    assert (resp.json["since"], len(resp.json["entries"])) == (1, 2)
+    resp = client.get("/jobs/j1/logs?since=9", headers=HEADERS)
+    assert (resp.json["since"], resp.json["entries"]) == (3, [])
+
+    resp = client.get("/jobs/j1/logs?since=-1", headers=HEADERS)
+    assert resp.status_code == 400
+    assert client.get("/jobs/j2/logs", headers=HEADERS).status_code == 404
+
+
+@pytest.mark.unittest
+def test_job_log_stream(actinia):
+    """Streams send new entries from `since` on until the job is done."""
+    actinia.extend(
+        [_job("running", 2), _job("running", 2), _job("finished", 4)],
+    )
+    resp = flask_app.test_client().get(
+        "/jobs/j1/logs?since=1",
+        headers={**HEADERS, "Accept": "text/event-stream"},
+    )
+    assert resp.mimetype == "text/event-stream"
+    events = [
+        (fields["event"], json.loads(fields["data"]))
+        for fields in (
+            dict(line.split(": ", 1) for line in block.splitlines())
+            for block in resp.get_data(as_text=True).split("\n\n")
+            if block.startswith("event")
+        )
+    ]
+    assert [name for name, _ in events] == ["log", "log", "done"]
+    assert [e["executable"] for e in events[0][1]["entries"]] == ["step1"]
+    assert events[1][1]["status"] == "successful"
+    assert (events[1][1]["since"], events[1][1]["offset"]) == (2, 4)
+
+
+@pytest.mark.unittest
+def test_job_log_stream_limit(actinia, monkeypatch):
+    """Log streams beyond JOBSTATUS.max_streams are answered with 503."""
+    actinia.append(_job("running", 1))
+    monkeypatch.setattr(JOBSTATUS, "max_streams", 0)
+    resp = flask_app.test_client().get(
+        "/jobs/j1/logs",
+        headers={**HEADERS, "Accept": "text/event-stream"},
+    )
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == str(JOBSTATUS.events_retry)
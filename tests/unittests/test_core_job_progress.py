@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for core.job_progress.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import base64
+from datetime import datetime, timezone
+
+import pytest
+
+from actinia_ogc_api_processes_plugin.api import job_status_info as api
+from actinia_ogc_api_processes_plugin.core import job_progress as core
+from actinia_ogc_api_processes_plugin.main import flask_app
+from actinia_ogc_api_processes_plugin.resources.config import JOBSTATUS
+
+
+def _iso(epoch: float) -> str:
+    """Return epoch seconds as ISO string."""
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).isoformat()
+
+
+def _status_info(progress, updated, status="running") -> dict:
+    """Return a statusInfo of a job started at 1000."""
+    return {
+        "jobID": "j1",
+        "status": status,
+        "type": "process",
+        "created": _iso(1000),
+        "updated": _iso(updated),
+        "progress": progress,
+    }
+
+
+@pytest.fixture
+def samples(monkeypatch):
+    """Start without samples and with known bounds of the hints."""
+    core._SAMPLES.clear()
+    monkeypatch.setattr(JOBSTATUS, "retry_after_min", 1)
+    monkeypatch.setattr(JOBSTATUS, "retry_after_max", 90)
+
+
+@pytest.mark.unittest
+def test_estimate_completion(samples):
+    """The completion is extrapolated from the progress rate."""
+    key = ("user", "j1")
+    assert core.estimate_completion(key, now=1000) == (None, 1)
+
+    # 20 % after 100 seconds
+    core.record_progress(key, _status_info(20, 1100), now=1105)
+    completion, retry_after = core.estimate_completion(key, now=1105)
+    assert completion == pytest.approx(1500)
+    # capped by `retry_after_max`
+    assert retry_after == 90
+
+    # unchanged progress adds no sample
+    core.record_progress(key, _status_info(20, 1100), now=1150)
+    core.record_progress(key, _status_info(60, 1200), now=1200)
+    assert len(core._SAMPLES.get(key)) == 3
+    completion, retry_after = core.estimate_completion(key, now=1220)
+    # 60 % in 200 seconds, the progress changed every 100 seconds
+    assert completion == pytest.approx(1333.33, rel=1e-3)
+    assert retry_after == 80
+
+    # samples of finished jobs are removed
+    core.record_progress(key, _status_info(100, 1300, "successful"))
+    assert key not in core._SAMPLES
+    assert core.progress_hints(
+        key,
+        _status_info(100, 1300, "successful"),
+    ) == (None, None)
+
+
+@pytest.mark.unittest
+def test_job_status_info_hints(monkeypatch, samples):
+    """Running jobs are returned with estimatedCompletion and Retry-After."""
+    now = datetime.now(timezone.utc).timestamp()
+    status_info = _status_info(50, now - 10)
+    status_info["created"] = _iso(now - 110)
+    monkeypatch.setattr(
+        api,
+        "get_job_status_info",
+        lambda job_id: (200, status_info, None),
+    )
+    monkeypatch.setattr(api, "is_purged", lambda job_id: False)
+    token = base64.b64encode(b"user:pw").decode()
+
+    resp = flask_app.test_client().get(
+        "/jobs/j1",
+        headers={"Authorization": f"Basic {token}"},
+    )
+    assert resp.status_code == 200
+    completion = datetime.fromisoformat(resp.json["estimatedCompletion"])
+    assert completion.timestamp() == pytest.approx(now + 90, abs=2)
+    assert 1 <= int(resp.headers["Retry-After"]) <= 90
+    assert resp.headers["Cache-Control"] == (
+        f"private, max-age={resp.headers['Retry-After']}"
+    )
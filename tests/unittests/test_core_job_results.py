@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for core.job_results.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import base64
+
+import pytest
+
+from actinia_ogc_api_processes_plugin.core import job_results as core
+from actinia_ogc_api_processes_plugin.core import result_cache
+from actinia_ogc_api_processes_plugin.main import flask_app
+from actinia_ogc_api_processes_plugin.resources.config import JOBRESULTS
+
+HEADERS = {"Authorization": f"Basic {base64.b64encode(b'u:pw').decode()}"}
+
+
+class Upstream:
+    """Mock streamed actinia response which records the chunks read."""
+
+    def __init__(self, body: bytes, status_code=200, headers=None) -> None:
+        """Initialise."""
+        self.body = body
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.read = []
+        self.closed = False
+
+    @property
+    def content(self) -> bytes:
+        """Return the complete body."""
+        return self.body
+
+    def iter_content(self, chunk_size):
+        """Yield the body in chunks."""
+        for i in range(0, len(self.body), chunk_size):
+            self.read.append(i)
+            yield self.body[i : i + chunk_size]
+
+    def close(self) -> None:
+        """Release the connection."""
+        self.closed = True
+
+
+@pytest.fixture
+def upstream(monkeypatch, tmp_path):
+    """Return the requests sent to actinia and the responses to send."""
+    calls = []
+    responses = []
+
+    def mock_get(url, stream=False, **kwargs):
+        calls.append((url, stream, kwargs.get("headers")))
+        return responses.pop(0)
+
+    monkeypatch.setattr(core.requests, "get", mock_get)
+    monkeypatch.setattr(JOBRESULTS, "stream_chunk_size", 4)
+    monkeypatch.setattr(JOBRESULTS, "range_cache_dir", str(tmp_path))
+    return calls, responses
+
+
+@pytest.mark.unittest
+def test_get_ref_value_streams(upstream):
+    """Result files are passed through in chunks with their headers."""
+    calls, responses = upstream
+    body = b"0123456789"
+    actinia = Upstream(body, headers={"Content-Length": "10"})
+    responses.append(actinia)
+    value = {
+        "href": "http://actinia/api/v3/resources/u/j1/out.tif",
+        "type": "image/tiff",
+    }
+    with flask_app.test_request_context("/jobs/j1/results", headers=HEADERS):
+        resp = core.get_ref_value(value, 200)
+    assert calls[0][1] is True
+    assert resp.is_streamed
+    assert resp.headers["Content-Type"] == "image/tiff"
+    assert resp.headers["Content-Length"] == "10"
+    chunks = iter(resp.response)
+    assert next(chunks) == b"0123"
+    # only the chunks sent so far were read
+    assert actinia.read == [0]
+    assert b"".join(chunks) == b"456789"
+    assert actinia.closed
+
+
+@pytest.mark.unittest
+def test_get_ref_value_headers_and_errors(upstream):
+    """Upstream Content-Type is used and errors are passed through."""
+    _calls, responses = upstream
+    gzipped = Upstream(
+        b"data",
+        headers={
+            "Content-Type": "application/zip",
+            "Content-Length": "3",
+            "Content-Encoding": "gzip",
+        },
+    )
+    missing = Upstream(b"not found", status_code=404)
+    responses.extend([gzipped, missing])
+    value = {"href": "http://actinia/api/v3/resources/u/j1/out.zip"}
+    with flask_app.test_request_context("/jobs/j1/results", headers=HEADERS):
+        resp = core.get_ref_value(value, 200)
+        assert resp.headers["Content-Type"] == "application/zip"
+        # the decoded length differs from the compressed one
+        assert "Content-Length" not in resp.headers
+        assert resp.get_data() == b"data"
+        assert gzipped.closed
+
+        resp = core.get_ref_value(value, 200)
+        assert resp.status_code == 404
+        assert missing.closed
+
+
+VALUE = {
+    "href": "http://actinia/api/v3/resources/u/j1/out.tif",
+    "type": "image/tiff",
+}
+
+
+def _get_range(range_header, if_range=None):
+    """Return the result value for a Range (and If-Range) header."""
+    headers = {**HEADERS, "Range": range_header}
+    if if_range is not None:
+        headers["If-Range"] = if_range
+    with flask_app.test_request_context("/jobs/j1/results", headers=headers):
+        resp = core.get_ref_value(VALUE, 200)
+        resp.direct_passthrough = False
+        return resp, resp.get_data()
+
+
+@pytest.mark.unittest
+def test_range_forwarded_to_actinia(upstream):
+    """Ranges are forwarded and partial actinia responses passed through."""
+    calls, responses = upstream
+    responses.append(
+        Upstream(
+            b"2345",
+            status_code=206,
+            headers={"Content-Range": "bytes 2-5/10", "ETag": '"e1"'},
+        ),
+    )
+    resp, data = _get_range("bytes=2-5", '"e1"')
+    assert calls[0][2] == {"Range": "bytes=2-5", "If-Range": '"e1"'}
+    assert resp.status_code == 206
+    assert data == b"2345"
+    assert resp.headers["Content-Range"] == "bytes 2-5/10"
+    assert resp.headers["Content-Type"] == "image/tiff"
+
+
+@pytest.mark.unittest
+def test_range_from_local_copy(upstream):
+    """Ranges are read from a local copy if actinia ignores them."""
+    calls, responses = upstream
+    headers = {"Content-Length": "10", "ETag": '"e1"'}
+    responses.append(Upstream(b"0123456789", headers=headers))
+
+    resp, data = _get_range("bytes=2-5")
+    assert (resp.status_code, data) == (206, b"2345")
+    assert resp.headers["Content-Range"] == "bytes 2-5/10"
+    assert resp.headers["Content-Length"] == "4"
+
+    # further ranges are read without asking actinia
+    resp, data = _get_range("bytes=-3")
+    assert (resp.status_code, data) == (206, b"789")
+    assert len(calls) == 1
+
+    resp, data = _get_range("bytes=0-1, 8-20")
+    assert resp.status_code == 206
+    assert resp.mimetype == "multipart/byteranges"
+    assert int(resp.headers["Content-Length"]) == len(data)
+    boundary = resp.mimetype_params["boundary"]
+    parts = data.split(f"--{boundary}".encode())
+    assert parts[1].endswith(b"Content-Range: bytes 0-1/10\r\n\r\n01\r\n")
+    assert parts[2].endswith(b"Content-Range: bytes 8-9/10\r\n\r\n89\r\n")
+    assert parts[3] == b"--\r\n"
+
+    resp, _data = _get_range("bytes=20-30")
+    assert resp.status_code == 416
+    assert resp.headers["Content-Range"] == "bytes */10"
+
+    # the complete file if If-Range does not match
+    resp, data = _get_range("bytes=2-5", '"e2"')
+    assert (resp.status_code, data) == (200, b"0123456789")
+    resp, data = _get_range("bytes=2-5", '"e1"')
+    assert (resp.status_code, data) == (206, b"2345")
+
+    # copies are per user
+    with flask_app.test_request_context(
+        "/jobs/j1/results",
+        headers={"Authorization": "Basic b3RoZXI6cHc=", "Range": "bytes=0-1"},
+    ):
+        assert core.cached_result(VALUE["href"]) is None
+
+
+@pytest.mark.unittest
+def test_result_cache_dir(monkeypatch, tmp_path):
+    """The result cache is only accessible by the user of the worker."""
+    path = tmp_path / "cache"
+    monkeypatch.setattr(JOBRESULTS, "range_cache_dir", str(path))
+    assert result_cache._cache_dir() == path
+    assert path.stat().st_mode & 0o777 == 0o700
+
+    # directories of other users (e.g. created before in /tmp) are not used
+    monkeypatch.setattr(result_cache.os, "getuid", lambda: -1)
+    assert result_cache._cache_dir() is None
+    with flask_app.test_request_context("/jobs/j1/results", headers=HEADERS):
+        assert result_cache.cached_result("http://actinia/out.tif") is None
@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for core.job_retention.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import base64
+from types import SimpleNamespace
+
+import pytest
+
+from actinia_ogc_api_processes_plugin.authentication import credentials_key
+from actinia_ogc_api_processes_plugin.core import job_retention as core
+from actinia_ogc_api_processes_plugin.core import shared_store
+from actinia_ogc_api_processes_plugin.core.actinia_common import JobRecord
+from actinia_ogc_api_processes_plugin.main import flask_app
+from actinia_ogc_api_processes_plugin.resources.config import (
+    JOBLIST,
+    RETENTION,
+)
+
+
+class MockResp:
+    """Mock actinia response."""
+
+    text = ""
+
+    def __init__(self, status_code, items=None) -> None:
+        """Initialise."""
+        self.status_code = status_code
+        self.items = items
+
+    def json(self):
+        """Return the resource list."""
+        return {"resource_list": self.items}
+
+
+@pytest.fixture(autouse=True)
+def clear_tombstones():
+    """Do not leave tombstones of hidden jobs to other tests."""
+    yield
+    core._TOMBSTONES.clear()
+
+
+def _headers(user, password):
+    """Return basic auth headers."""
+    token = base64.b64encode(f"{user}:{password}".encode()).decode()
+    return {"Authorization": f"Basic {token}"}
+
+
+@pytest.mark.unittest
+def test_tombstones():
+    """Tombstones keep digests of job ids and drop the oldest ones."""
+    tombstones = core.Tombstones(2)
+    tombstones.add("a")
+    tombstones.add("b")
+    assert "a" in tombstones
+    assert "c" not in tombstones
+    tombstones.add("c")
+    assert len(tombstones) == 2
+    assert "a" not in tombstones
+    assert tombstones.record_filter(JobRecord("a", "successful"))
+    assert not tombstones.record_filter(JobRecord("c", "successful"))
+
+
+@pytest.mark.unittest
+def test_select_expired(monkeypatch):
+    """Jobs are expired by age and count, only in the configured states."""
+    monkeypatch.setattr(RETENTION, "max_age", 100)
+    monkeypatch.setattr(RETENTION, "max_count", 2)
+    records = [
+        JobRecord("new", "successful", updated=990.0),
+        JobRecord("mid", "failed", updated=950.0),
+        JobRecord("old", "dismissed", updated=800.0),
+        JobRecord("older", "successful", updated=700.0),
+        JobRecord("running", "running", updated=1.0),
+    ]
+    assert core.select_expired(records, now=1000.0) == ["old", "older"]
+
+    monkeypatch.setattr(RETENTION, "max_count", 1)
+    monkeypatch.setattr(RETENTION, "max_age", 0)
+    assert core.select_expired(records, now=1000.0) == [
+        "mid",
+        "old",
+        "older",
+    ]
+
+    # jobs which are not in a final state are never hidden
+    monkeypatch.setattr(RETENTION, "states", ("running", "successful"))
+    assert core.select_expired(records, now=1000.0) == ["older"]
+
+    # the count is not applied to an incomplete list of jobs
+    assert core.select_expired(records, 1000.0, complete=False) == []
+
+
+class MockShared:
+    """Mock of the shared database with the used set commands."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.data = {}
+
+    def get(self, name):
+        """Return a value."""
+        value = self.data.get(name)
+        return None if value is None else str(value).encode()
+
+    def delete(self, name):
+        """Delete a value."""
+        self.data.pop(name, None)
+
+    def incr(self, name):
+        """Increment a value."""
+        self.data[name] = self.data.get(name, 0) + 1
+        return self.data[name]
+
+    def sadd(self, name, *values):
+        """Add members to a set."""
+        self.data.setdefault(name, set()).update(v.encode() for v in values)
+
+    def smembers(self, name):
+        """Return the members of a set."""
+        return set(self.data.get(name, ()))
+
+    def scard(self, name):
+        """Return the size of a set."""
+        return len(self.data.get(name, ()))
+
+    def spop(self, name, count):
+        """Remove members from a set."""
+        return [self.data[name].pop() for _ in range(count)]
+
+    def pipeline(self, transaction):
+        """Return a pipeline executing the commands in order."""
+        calls = []
+        shared = self
+
+        class Pipeline:
+            def __getattr__(self, method):
+                return lambda *args: calls.append((method, args))
+
+            def execute(self):
+                return [getattr(shared, m)(*args) for m, args in calls]
+
+        return Pipeline()
+
+
+def _job_items(count):
+    """Return `count` finished actinia jobs."""
+    return [
+        {
+            "resource_id": f"resource_id-j{i}",
+            "status": "finished",
+            "timestamp": float(i),
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unittest
+def test_purge_jobs(monkeypatch):
+    """Expired jobs get a tombstone, nothing is sent to actinia."""
+    monkeypatch.setattr(RETENTION, "max_age", 0)
+    monkeypatch.setattr(RETENTION, "max_count", 1)
+    items = _job_items(4)
+    monkeypatch.setattr(
+        core,
+        "get_actinia_jobs",
+        lambda limit, auth: MockResp(200, items),
+    )
+    monkeypatch.setattr(shared_store, "shared_client", lambda: None)
+    core._TOMBSTONES.clear()
+
+    auth = SimpleNamespace(username="user", password="pw")
+    with flask_app.test_request_context(
+        "/jobs",
+        headers=_headers("user", "pw"),
+    ):
+        key = credentials_key()
+        report = core.purge_jobs(key, auth)
+        assert report == {"hidden": 3, "failed": 0}
+        assert core.is_purged("j0")
+        assert core.is_purged("j2")
+        assert not core.is_purged("j3")
+
+        # hidden jobs are not hidden again
+        assert core.purge_jobs(key, auth) == {"hidden": 0, "failed": 0}
+
+    # tombstones are kept per user name, not per password
+    with flask_app.test_request_context(
+        "/jobs",
+        headers=_headers("user", "new password"),
+    ):
+        assert core.is_purged("j0")
+    with flask_app.test_request_context(
+        "/jobs",
+        headers=_headers("other", "pw"),
+    ):
+        assert not core.is_purged("j0")
+
+
+@pytest.mark.unittest
+def test_purge_jobs_cut_list(monkeypatch):
+    """The count is not applied if actinia has more jobs than scanned."""
+    monkeypatch.setattr(RETENTION, "max_age", 0)
+    monkeypatch.setattr(RETENTION, "max_count", 1)
+    monkeypatch.setattr(JOBLIST, "max_scan", 4)
+    monkeypatch.setattr(
+        core,
+        "get_actinia_jobs",
+        lambda limit, auth: MockResp(200, _job_items(limit)),
+    )
+    monkeypatch.setattr(shared_store, "shared_client", lambda: None)
+
+    auth = SimpleNamespace(username="user", password="pw")
+    with flask_app.test_request_context(
+        "/jobs",
+        headers=_headers("user", "pw"),
+    ):
+        report = core.purge_jobs(credentials_key(), auth)
+        assert report == {"hidden": 0, "failed": 0}
+        assert not core.is_purged("j0")
+
+
+@pytest.mark.unittest
+def test_shared_tombstones(monkeypatch):
+    """Tombstones are shared by the workers through the shared database."""
+    monkeypatch.setattr(RETENTION, "max_age", 1)
+    monkeypatch.setattr(RETENTION, "max_count", 0)
+    monkeypatch.setattr(RETENTION, "max_tombstones", 3)
+    monkeypatch.setattr(
+        core,
+        "get_actinia_jobs",
+        lambda limit, auth: MockResp(200, _job_items(2)),
+    )
+    db = MockShared()
+    monkeypatch.setattr(shared_store, "shared_client", lambda: db)
+    core._TOMBSTONES.clear()
+
+    auth = SimpleNamespace(username="user", password="pw")
+    with flask_app.test_request_context(
+        "/jobs",
+        headers=_headers("user", "pw"),
+    ):
+        key = credentials_key()
+        assert core.purge_jobs(key, auth)["hidden"] == 2
+
+        # another worker without local tombstones
+        core._TOMBSTONES.clear()
+        assert core.is_purged("j0")
+        assert core.is_purged("j1")
+        assert not core.is_purged("j2")
+
+        # the oldest tombstones are dropped from the shared database, too
+        monkeypatch.setattr(
+            core,
+            "get_actinia_jobs",
+            lambda limit, auth: MockResp(200, _job_items(5)),
+        )
+        assert core.purge_jobs(key, auth)["hidden"] == 3
+        core._TOMBSTONES.clear()
+        assert len(core.get_tombstones()) == 3
+
+
+@pytest.mark.unittest
+def test_schedule_retention(monkeypatch):
+    """Runs are scheduled once per interval and reported per credentials."""
+    runs = []
+    monkeypatch.setattr(RETENTION, "enabled", True)
+    monkeypatch.setattr(
+        core,
+        "purge_jobs",
+        lambda key, auth: (
+            runs.append(auth.username) or {"hidden": 3, "failed": 0}
+        ),
+    )
+    core._NEXT_RUN.clear()
+    core._REPORTS.clear()
+
+    with flask_app.test_request_context(
+        "/jobs",
+        headers=_headers("user", "pw"),
+    ):
+        assert core.schedule_retention()
+        assert not core.schedule_retention()
+        core._SCHEDULER.submit(lambda: None).result()
+        report = core.get_retention_report()
+    assert runs == ["user"]
+    assert report["hidden"] == 3
+    assert report["lastHidden"] == 3
+    assert report["lastRun"]
+
+    # the report of other credentials is not shared
+    with flask_app.test_request_context(
+        "/jobs",
+        headers=_headers("user", "other"),
+    ):
+        assert core.get_retention_report()["hidden"] == 0
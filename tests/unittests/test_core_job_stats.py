@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for core.job_stats aggregation.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import base64
+
+import pytest
+
+from actinia_ogc_api_processes_plugin.core import job_stats as core
+from actinia_ogc_api_processes_plugin.core.actinia_common import JobRecord
+from actinia_ogc_api_processes_plugin.main import flask_app
+
+
+class MockListResp:
+    """Mock actinia resource list response."""
+
+    status_code = 200
+
+    def __init__(self, items) -> None:
+        """Initialise."""
+        self.items = items
+
+    def json(self):
+        """Return the resource list."""
+        return {"resource_list": self.items}
+
+
+def _headers(user, password):
+    """Return basic auth headers."""
+    token = base64.b64encode(f"{user}:{password}".encode()).decode()
+    return {"Authorization": f"Basic {token}"}
+
+
+@pytest.mark.unittest
+def test_compute_job_stats():
+    """Counts, durations and queue waits are aggregated."""
+    records = [
+        JobRecord(
+            f"j{i}",
+            "successful",
+            created=0.0,
+            started=float(i),
+            finished=float(i + 10 * i),
+        )
+        for i in range(1, 11)
+    ]
+    records.append(JobRecord("r", "running", created=0.0, started=5.0))
+    records.append(JobRecord("a", "accepted", job_type="other"))
+
+    stats = core.compute_job_stats(records)
+    assert stats["numberOfJobs"] == 12
+    assert stats["status"] == {"successful": 10, "running": 1, "accepted": 1}
+    assert stats["type"] == {"process": 11, "other": 1}
+    duration = stats["duration"]
+    assert duration["count"] == 10
+    assert duration["min"] == 10
+    assert duration["max"] == 100
+    assert duration["p50"] == 55
+    assert duration["p90"] == 91
+    assert stats["queueWait"]["count"] == 11
+    assert core.compute_job_stats([])["duration"] == {"count": 0}
+
+
+@pytest.mark.unittest
+def test_get_job_stats_cached_per_credentials(monkeypatch):
+    """Stats are cached per user and password for JOBLIST.stats_ttl."""
+    calls = []
+
+    def mock_get_actinia_jobs(limit):
+        calls.append(limit)
+        return MockListResp(
+            [{"resource_id": "j1", "status": "running", "timestamp": 1.0}],
+        )
+
+    monkeypatch.setattr(core, "get_actinia_jobs", mock_get_actinia_jobs)
+    core._STATS_CACHE.clear()
+
+    with flask_app.test_request_context(
+        "/jobs/stats",
+        headers=_headers("user", "pw"),
+    ):
+        resp, stats = core.get_job_stats()
+        assert resp is not None
+        assert stats["numberOfJobs"] == 1
+        assert stats["partial"] is False
+        resp, _ = core.get_job_stats()
+        assert resp is None
+    assert len(calls) == 1
+
+    # another password has to be verified by actinia again
+    with flask_app.test_request_context(
+        "/jobs/stats",
+        headers=_headers("user", "other"),
+    ):
+        resp, _ = core.get_job_stats()
+        assert resp is not None
+    assert len(calls) == 2
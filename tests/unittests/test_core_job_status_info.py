@@ -12,9 +12,14 @@ __copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 
 
+import base64
+
 import pytest
+import requests
 
+from actinia_ogc_api_processes_plugin.api import job_status_info as api
 from actinia_ogc_api_processes_plugin.core import job_status_info as core
+from actinia_ogc_api_processes_plugin.main import flask_app
 
 
 class MockResp:
@@ -76,3 +81,65 @@ def test_get_job_status_info_success_and_error(monkeypatch):
     assert status2 == 404
     assert info2 is None
     assert r2 is notfound
+
+
+@pytest.mark.unittest
+def test_parse_wait(monkeypatch):
+    """Wait is read from the query or the Prefer header and capped."""
+    monkeypatch.setattr(core.JOBSTATUS, "max_wait", 30)
+    assert core.parse_wait(None) is None
+    assert core.parse_wait("5") == 5
+    assert core.parse_wait("100") == 30
+    assert core.parse_wait(None, "respond-async, wait=10") == 10
+    assert core.parse_wait(None, "return=minimal") is None
+    # invalid preferences are ignored, invalid parameters are rejected
+    assert core.parse_wait(None, "wait=soon") is None
+    for value in ("-1", "nan", "soon"):
+        with pytest.raises(ValueError, match="seconds|float"):
+            core.parse_wait(value)
+
+
+@pytest.mark.unittest
+def test_last_known_status_info(monkeypatch):
+    """The last known status is returned while actinia is not available."""
+    status_info = {
+        "jobID": "job-stale",
+        "status": "running",
+        "type": "process",
+        "progress": 40,
+    }
+    responses = iter(
+        [
+            (200, status_info, None),
+            requests.ConnectionError("actinia down"),
+            (503, None, MockResp(503)),
+            requests.ConnectionError("actinia down"),
+        ],
+    )
+
+    def mock_get_job_status_info(job_id):
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(api, "get_job_status_info", mock_get_job_status_info)
+    client = flask_app.test_client()
+
+    def get(password):
+        token = base64.b64encode(f"user:{password}".encode()).decode()
+        return client.get(
+            "/jobs/job-stale",
+            headers={"Authorization": f"Basic {token}"},
+        )
+
+    assert "Warning" not in get("pw").headers
+    for _ in range(2):
+        resp = get("pw")
+        assert resp.status_code == 200
+        assert resp.json["progress"] == 40
+        assert resp.headers["Warning"] == '110 - "Response is Stale"'
+        assert int(resp.headers["Age"]) >= 0
+        assert resp.headers["Retry-After"] == "30"
+    # the last known status is only returned for the same credentials
+    assert get("other").status_code == 503
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for core.json_stream incremental parser.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import io
+import json
+
+import pytest
+import requests
+
+from actinia_ogc_api_processes_plugin.core.job_list import (
+    JOB_FIELDS,
+    read_resource_list,
+)
+from actinia_ogc_api_processes_plugin.core.json_stream import iter_json_array
+
+ITEMS = [
+    {
+        "resource_id": f"resource_id-{i}",
+        "status": "finished",
+        "timestamp": 1600000000.5 + i,
+        "message": 'Processing "finished" ü',
+        "process_log": [{"stdout": "line\n" * 20}],
+        "process_chain_list": [{"list": [{"module": "r.mapcalc"}]}],
+    }
+    for i in range(5)
+]
+BODY = {
+    "api_info": {"endpoint": "resourcemanager"},
+    "resource_list": [*ITEMS, 12, None],
+    "status": "finished",
+}
+
+
+def _chunks(data: bytes, size: int) -> list:
+    """Split `data` into chunks of `size` bytes."""
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 100000])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_json_array(chunk_size, indent):
+    """Items are equal to json.loads for every chunk size."""
+    data = json.dumps(BODY, indent=indent).encode()
+    items = list(iter_json_array(_chunks(data, chunk_size), "resource_list"))
+    assert items == BODY["resource_list"]
+
+    chunks = _chunks(data, chunk_size)
+    items = list(iter_json_array(chunks, "resource_list", {"status"}))
+    assert items[0] == {"status": "finished"}
+    assert items[-2:] == [12, None]
+
+
+@pytest.mark.unittest
+def test_iter_json_array_invalid():
+    """Missing arrays yield nothing, invalid JSON raises ValueError."""
+    assert list(iter_json_array([b'{"a": [1]}'], "resource_list")) == []
+    data = b'{"resource_list": 1}'
+    assert list(iter_json_array([data], "resource_list")) == []
+    for data in (b"", b"[]", b'{"resource_list": [1, 2', b'{"a" 1}'):
+        with pytest.raises(ValueError, match="Expecting"):
+            list(iter_json_array([data], "resource_list"))
+
+
+@pytest.mark.unittest
+def test_read_resource_list_streamed():
+    """Streamed actinia responses are reduced to the job fields."""
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.raw = io.BytesIO(json.dumps(BODY).encode())
+    items = read_resource_list(resp)
+    assert len(items) == 7
+    assert items[0] == {k: v for k, v in ITEMS[0].items() if k in JOB_FIELDS}
+    assert "process_log" not in items[0]
+
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.raw = io.BytesIO(b'{"resource_list": [')
+    assert read_resource_list(resp) == []
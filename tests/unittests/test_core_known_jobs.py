@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for the known job ids (core.known_jobs).
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import base64
+import time
+
+import pytest
+
+from actinia_ogc_api_processes_plugin.authentication import credentials_key
+from actinia_ogc_api_processes_plugin.core import (
+    job_index,
+    job_status_info,
+    shared_store,
+)
+from actinia_ogc_api_processes_plugin.core import known_jobs as core
+from actinia_ogc_api_processes_plugin.core.job_index import KnownJobIds
+from actinia_ogc_api_processes_plugin.main import flask_app
+from actinia_ogc_api_processes_plugin.resources.config import JOBSTATUS
+
+
+class MockResp:
+    """Mock actinia response."""
+
+    text = ""
+
+    def __init__(self, status_code, data=None) -> None:
+        """Initialise."""
+        self.status_code = status_code
+        self.data = data
+
+    def json(self):
+        """Return the configured data."""
+        return self.data
+
+
+class MockShared:
+    """Mock of the shared database with the used sorted set commands."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.data = {}
+
+    def zadd(self, name, mapping):
+        """Add members with scores."""
+        self.data.setdefault(name, {}).update(mapping)
+
+    def zremrangebyscore(self, name, low, high):
+        """Remove members with scores up to `high`."""
+        members = self.data.get(name, {})
+        for member, score in list(members.items()):
+            if score <= high:
+                del members[member]
+
+    def expire(self, name, seconds):
+        """Ignore the expiry."""
+
+    def zscore(self, name, member):
+        """Return the score of a member or None."""
+        return self.data.get(name, {}).get(member)
+
+    def __getattr__(self, method):
+        """Answer the commands of other modules (e.g. get) with None."""
+        return lambda *args: None
+
+    def pipeline(self, transaction):
+        """Return a pipeline executing the commands in order."""
+        calls = []
+        shared = self
+
+        class Pipeline:
+            def __getattr__(self, method):
+                return lambda *args: calls.append((method, args))
+
+            def execute(self):
+                return [getattr(shared, m)(*args) for m, args in calls]
+
+        return Pipeline()
+
+
+HEADERS = {"Authorization": f"Basic {base64.b64encode(b'u:pw').decode()}"}
+
+
+def _job(job_id):
+    """Return an actinia job."""
+    return {
+        "resource_id": f"resource_id-{job_id}",
+        "status": "finished",
+        "message": "finished",
+        "accept_timestamp": 1.0,
+        "timestamp": 2.0,
+        "urls": {"status": f"http://actinia/api/v3/resources/u/{job_id}"},
+    }
+
+
+@pytest.mark.unittest
+def test_known_job_ids():
+    """Added ids are always found, others rarely."""
+    known = KnownJobIds(capacity=1000, error_rate=0.01)
+    job_ids = [f"job-{i}" for i in range(1000)]
+    for job_id in job_ids:
+        known.add(job_id)
+    assert all(job_id in known for job_id in job_ids)
+    false_positives = sum(f"other-{i}" in known for i in range(10000))
+    assert false_positives < 300
+
+    # ids added while rebuilding are kept
+    assert known.start_rebuild()
+    assert not known.start_rebuild()
+    known.add("new")
+    known.finish_rebuild(["job-1"], now=1.0)
+    assert known.rebuilt == 1.0
+    assert "new" in known
+    assert "job-1" in known
+    assert sum(job_id in known for job_id in job_ids) < 100
+
+
+@pytest.mark.unittest
+def test_unknown_jobs_are_not_requested(monkeypatch):
+    """Certainly unknown jobs are answered with 404 by the filter."""
+    monkeypatch.setattr(JOBSTATUS, "known_jobs_ttl", 60)
+    db = MockShared()
+    monkeypatch.setattr(shared_store, "shared_client", lambda: db)
+    job_index._KNOWN_JOB_IDS.clear()
+    requested = []
+
+    def mock_get_actinia_job(job_id, auth=None):
+        requested.append(job_id)
+        if job_id in {"j1", "j2"}:
+            return MockResp(200, _job(job_id))
+        return MockResp(400, {"message": "Resource does not exist"})
+
+    monkeypatch.setattr(
+        job_status_info,
+        "get_actinia_job",
+        mock_get_actinia_job,
+    )
+    monkeypatch.setattr(
+        core,
+        "get_actinia_jobs",
+        lambda limit=None, auth=None: MockResp(
+            200,
+            {"resource_list": [_job("j1")]},
+        ),
+    )
+    # rebuild in the request thread
+    monkeypatch.setattr(
+        core._SCHEDULER,
+        "submit",
+        lambda func, *args: func(*args),
+    )
+    client = flask_app.test_client()
+
+    # not trusted before the first rebuild
+    assert client.get("/jobs/x1", headers=HEADERS).status_code == 404
+    assert requested == ["x1"]
+
+    assert client.get("/jobs/x2", headers=HEADERS).status_code == 404
+    resp = client.get("/jobs/x2/results", headers=HEADERS)
+    assert resp.status_code == 404
+    assert resp.json["type"].endswith("/no-such-job")
+    assert client.get("/jobs/j1", headers=HEADERS).status_code == 200
+    assert requested == ["x1", "j1"]
+
+    # status lookups feed the filter
+    with flask_app.test_request_context("/jobs/j2", headers=HEADERS):
+        assert core.is_unknown_job("j2")
+        job_status_info.get_job_status_info("j2")
+        assert not core.is_unknown_job("j2")
+
+    # jobs started through other workers are found in the shared database
+    with flask_app.test_request_context("/jobs/j3", headers=HEADERS):
+        assert core.is_unknown_job("j3")
+        name = core._new_jobs_key(credentials_key())
+        db.zadd(name, {"j3": time.time()})
+        assert not core.is_unknown_job("j3")
+
+
+@pytest.mark.unittest
+def test_known_jobs_need_shared_database(monkeypatch):
+    """Without the shared database unknown jobs are requested."""
+    monkeypatch.setattr(JOBSTATUS, "known_jobs_ttl", 60)
+    monkeypatch.setattr(shared_store, "shared_client", lambda: None)
+    job_index._KNOWN_JOB_IDS.clear()
+    with flask_app.test_request_context("/jobs/x1", headers=HEADERS):
+        core.remember_job("j1", new=True)
+        assert not core.is_unknown_job("x1")
+    assert not job_index._KNOWN_JOB_IDS
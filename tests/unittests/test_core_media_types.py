@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""SPDX-FileCopyrightText: (c) 2026 by mundialis GmbH & Co. KG.
+
+SPDX-License-Identifier: GPL-3.0-or-later
+
+Unit tests for core.media_types content negotiation.
+"""
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "Carmen Tawalika"
+__copyright__ = "Copyright 2026 mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+
+
+import pytest
+
+from actinia_ogc_api_processes_plugin.core import media_types as core
+from actinia_ogc_api_processes_plugin.main import flask_app
+
+msgpack = pytest.importorskip("msgpack")
+cbor2 = pytest.importorskip("cbor2")
+
+DOC = {"jobs": [{"jobID": "a", "progress": 50, "finished": None}]}
+
+
+def _negotiate(query="", accept=None):
+    """Return the negotiated media type for a request."""
+    headers = {"Accept": accept} if accept else {}
+    with flask_app.test_request_context(f"/jobs{query}", headers=headers):
+        return core.negotiate_media_type()
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    ("query", "accept", "expected"),
+    [
+        ("", None, core.JSON),
+        ("", "*/*", core.JSON),
+        ("", "text/html", core.JSON),
+        ("", "application/msgpack", core.MSGPACK),
+        ("", "application/x-msgpack", core.MSGPACK),
+        ("", "application/cbor;q=0.9, application/json;q=0.5", core.CBOR),
+        ("?f=cbor", "application/msgpack", core.CBOR),
+        ("?f=JSON", "application/msgpack", core.JSON),
+        ("?f=html", None, core.JSON),
+    ],
+)
+def test_negotiate_media_type(query, accept, expected):
+    """`f` takes precedence over Accept, JSON is the default."""
+    assert _negotiate(query, accept) == expected
+
+
+@pytest.mark.unittest
+def test_negotiate_unavailable(monkeypatch):
+    """Formats requested with `f` whose library is missing return None."""
+    monkeypatch.setattr(core, "cbor2", None)
+    assert _negotiate("?f=cbor") is None
+    assert _negotiate("", "application/cbor") == core.JSON
+
+
+@pytest.mark.unittest
+def test_make_encoded_response():
+    """Binary responses decode to the same document as JSON."""
+    with flask_app.test_request_context("/jobs"):
+        res = core.make_encoded_response(DOC, core.MSGPACK)
+        assert res.mimetype == core.MSGPACK
+        assert msgpack.unpackb(res.get_data()) == DOC
+        assert "Accept" in res.vary
+
+        res = core.make_encoded_response(DOC, core.CBOR)
+        assert res.mimetype == core.CBOR
+        assert cbor2.loads(res.get_data()) == DOC
+
+        res = core.make_encoded_response(DOC, core.JSON)
+        assert res.get_json() == DOC
+
+
+@pytest.mark.unittest
+def test_alternate_links():
+    """Links replace the `f` parameter and keep the other parameters."""
+    with flask_app.test_request_context("/jobs?limit=10&f=json"):
+        assert core.format_href("json") == (
+            "http://localhost/jobs?limit=10&f=json"
+        )
+        assert [link["href"] for link in core.alternate_links()] == [
+            "http://localhost/jobs?limit=10&f=msgpack",
+            "http://localhost/jobs?limit=10&f=cbor",
+        ]
+    with flask_app.test_request_context("/processes"):
+        assert core.format_href("cbor") == "http://localhost/processes?f=cbor"